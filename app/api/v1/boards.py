@@ -2,14 +2,23 @@
 Boards API Router - v1
 """
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, Header, Response
 from sqlalchemy.orm import Session
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 
 from app.db.connection import get_db
 from app.core.security import get_current_user
-from app.schemas.board import BoardResponse, BoardCreate, LaneCreate, LaneResponse, LaneUpdate
+from app.core.concurrency import parse_if_match, set_etag
+from app.schemas.board import (
+    BoardResponse, BoardCreate, LaneCreate, LaneResponse, LaneUpdate,
+    BoardMemberCreate, BoardMemberResponse, ArchivePolicyUpdate, BoardStatsResponse,
+    LabelCreate, LabelResponse, LabelUpdate
+)
+from app.schemas.activity import ActivityPage
+from app.services.audit_service import ActivityService
 from app.services.board_service import BoardService
+from app.services.job_service import JobService
+from app.services.loader import parse_ids
 
 router = APIRouter()
 
@@ -24,19 +33,140 @@ async def create_board(board: BoardCreate, db: db_dependency, user: user_depende
     return service.create_board(board)
 
 @router.get("/", response_model=List[BoardResponse])
-async def get_boards(db: db_dependency, user: user_dependency):
+async def get_boards(
+    db: db_dependency,
+    user: user_dependency,
+    ids: Optional[str] = Query(None, description="Comma-separated board ids to read in one request")
+):
+    """The user's boards, or with `ids` just those boards (unknown or hidden ids are left out)."""
     service = BoardService(db, user.get('id'))
+    board_ids = parse_ids(ids)
+    if board_ids is not None:
+        return await service.get_boards_by_ids(board_ids)
     return service.get_my_boards()
 
 @router.get("/{board_id}", response_model=BoardResponse)
-async def get_board(db: db_dependency, user: user_dependency, board_id: int):
+async def get_board(
+    db: db_dependency,
+    user: user_dependency,
+    board_id: int,
+    accept_encoding: Optional[str] = Header(None)
+):
+    """The board with its lanes and cards (precompressed per board version: br, zstd or gzip)."""
     service = BoardService(db, user.get('id'))
-    return service.get_board(board_id)
+    return await service.get_board_snapshot(board_id, accept_encoding)
+
+@router.get("/{board_id}/stats", response_model=BoardStatsResponse)
+async def get_board_stats(
+    db: db_dependency,
+    user: user_dependency,
+    board_id: int,
+    days: int = Query(30, ge=1, le=365)
+):
+    """Card counts per lane and priority, plus `days` of cumulative-flow history."""
+    service = BoardService(db, user.get('id'))
+    return service.get_board_stats(board_id, days)
+
+@router.get("/{board_id}/activity", response_model=ActivityPage)
+async def get_board_activity(
+    db: db_dependency,
+    user: user_dependency,
+    board_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None)
+):
+    """Who changed what on the board, newest first (events appear within a few seconds)."""
+    service = ActivityService(db, user.get('id'))
+    return service.board_activity(board_id, limit, cursor)
 
 @router.delete("/{board_id}")
-async def delete_board(db: db_dependency, user: user_dependency, board_id: int):
+async def delete_board(
+    db: db_dependency,
+    user: user_dependency,
+    board_id: int
+):
+    """Hide the board immediately; its lanes and tasks are purged by the job worker."""
+    service = BoardService(db, user.get('id'))
+    result = service.delete_board(board_id)
+    JobService(db).enqueue("purge", {"board_id": board_id})
+    return result
+
+@router.put("/{board_id}/archive-policy", response_model=BoardResponse)
+async def set_archive_policy(
+    board_id: int,
+    policy: ArchivePolicyUpdate,
+    db: db_dependency,
+    user: user_dependency
+):
+    """Archive the board's tasks after N idle days (lanes may override; null disables)."""
+    service = BoardService(db, user.get('id'))
+    return service.set_archive_policy(board_id, policy)
+
+# --- MEMBERS (Shared boards) ---
+
+@router.get("/{board_id}/members", response_model=List[BoardMemberResponse])
+async def get_board_members(db: db_dependency, user: user_dependency, board_id: int):
+    service = BoardService(db, user.get('id'))
+    return service.get_members(board_id)
+
+@router.put("/{board_id}/members", response_model=BoardMemberResponse)
+async def set_board_member(
+    board_id: int,
+    member: BoardMemberCreate,
+    db: db_dependency,
+    user: user_dependency
+):
+    """Share a board with a user, or change their role (owner only)."""
     service = BoardService(db, user.get('id'))
-    return service.delete_board(board_id)
+    return service.set_member(board_id, member)
+
+@router.delete("/{board_id}/members/{member_user_id}")
+async def remove_board_member(
+    board_id: int,
+    member_user_id: int,
+    db: db_dependency,
+    user: user_dependency
+):
+    service = BoardService(db, user.get('id'))
+    return service.remove_member(board_id, member_user_id)
+
+# --- LABELS ---
+
+@router.get("/{board_id}/labels", response_model=List[LabelResponse])
+async def get_board_labels(db: db_dependency, user: user_dependency, board_id: int):
+    service = BoardService(db, user.get('id'))
+    return service.get_labels(board_id)
+
+@router.post("/{board_id}/labels", response_model=LabelResponse)
+async def create_label(
+    board_id: int,
+    label: LabelCreate,
+    db: db_dependency,
+    user: user_dependency
+):
+    """Add a label to the board; attach it to cards with `label_ids`."""
+    service = BoardService(db, user.get('id'))
+    return service.create_label(board_id, label)
+
+@router.put("/labels/{label_id}", response_model=LabelResponse)
+async def update_label(
+    label_id: int,
+    label: LabelUpdate,
+    db: db_dependency,
+    user: user_dependency
+):
+    service = BoardService(db, user.get('id'))
+    return service.update_label(label_id, label)
+
+@router.delete("/labels/{label_id}")
+async def delete_label(
+    label_id: int,
+    db: db_dependency,
+    user: user_dependency
+):
+    """Delete the label and remove it from every card."""
+    service = BoardService(db, user.get('id'))
+    return service.delete_label(label_id)
 
 # --- LANES (Nested under Boards) ---
 
@@ -55,10 +185,14 @@ async def update_lane(
     lane_id: int,
     lane: LaneUpdate,
     db: db_dependency,
-    user: user_dependency
+    user: user_dependency,
+    response: Response,
+    if_match: Optional[str] = Header(None)
 ):
     service = BoardService(db, user.get('id'))
-    return service.update_lane(lane_id, lane)
+    updated = service.update_lane(lane_id, lane, parse_if_match(if_match))
+    set_etag(response, updated.version)
+    return updated
 
 @router.delete("/lanes/{lane_id}")
 async def delete_lane(
@@ -67,4 +201,6 @@ async def delete_lane(
     user: user_dependency
 ):
     service = BoardService(db, user.get('id'))
-    return service.delete_lane(lane_id)
+    result = service.delete_lane(lane_id)
+    JobService(db).enqueue("purge", {"lane_id": lane_id})
+    return result
@@ -4,20 +4,31 @@ Tasks (Cards) API Router - v1
 Provides RESTful endpoints for task (card) management operations.
 """
 
-from fastapi import APIRouter, Depends, Path, Body
+from fastapi import APIRouter, Depends, Path, Body, Query, Header, Response
 from sqlalchemy.orm import Session
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Literal, Optional
 
+from app.core.concurrency import parse_if_match, set_etag
 from app.core.security import get_current_user
 from app.db.connection import get_db
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.schemas.activity import ActivityPage
+from app.schemas.task import (
+    TaskCreate, TaskResponse, TaskUpdate, TaskPage, TaskSearchPage, ArchivedTaskPage,
+    SubtaskCreate, SubtaskMove, SubtaskResponse, SubtaskTree, SubtaskUpdate
+)
 from app.services import TaskService
+from app.services.audit_service import ActivityService
+from app.services.loader import parse_ids
+from app.services.search_service import SearchService
+from app.services.subtask_service import SubtaskService
 
 router = APIRouter()
 
 # Dependency type hints
 db_dependency = Annotated[Session, Depends(get_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
+expand_query = Query(None, description="subtasks: include each card's subtask tree and progress")
 
 @router.post("/", response_model=TaskResponse, status_code=201)
 async def create_task(
@@ -29,41 +40,206 @@ async def create_task(
     service = TaskService(db, user.get('id'))
     return service.create_task(task)
 
+@router.get("/", response_model=TaskPage)
+async def list_tasks(
+    db: db_dependency,
+    user: user_dependency,
+    board_id: Optional[int] = Query(None, gt=0),
+    lane_id: Optional[int] = Query(None, gt=0),
+    owner_id: Optional[int] = Query(None, gt=0),
+    min_priority: Optional[int] = Query(None, description="priority >= min_priority"),
+    updated_since: Optional[datetime] = Query(None),
+    labels: Optional[str] = Query(None, description="Comma-separated label ids; only cards carrying all of them"),
+    sort: Optional[str] = Query(None, description="position, priority, updated_at or created_at; prefix with - for descending"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    expand: Optional[Literal["subtasks"]] = expand_query
+) -> TaskPage:
+    """
+    List tasks of a board or lane with filters and sorting.
+
+    Only combinations served by an index are accepted: board_id (+ owner_id)
+    with sort on updated_at/priority/created_at, or lane_id sorted by
+    position. A range filter must be on the sort column. `labels` may be
+    added to any of them. `expand=subtasks` adds the checklists of the
+    page's cards (one more query for the page).
+    """
+    service = TaskService(db, user.get('id'))
+    filters = {
+        "board_id": board_id,
+        "lane_id": lane_id,
+        "owner_id": owner_id,
+        "min_priority": min_priority,
+        "updated_since": updated_since,
+        "labels": parse_ids(labels),
+    }
+    return service.list_tasks(filters, sort, limit, cursor, expand=expand == "subtasks")
+
+@router.get("/search", response_model=TaskSearchPage)
+async def search_tasks(
+    db: db_dependency,
+    user: user_dependency,
+    q: str = Query(..., min_length=1, max_length=200),
+    board_id: Optional[int] = Query(None, gt=0),
+    lane_id: Optional[int] = Query(None, gt=0),
+    min_priority: Optional[int] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None)
+) -> TaskSearchPage:
+    """
+    Full-text search over task titles and descriptions.
+
+    Results are ranked by relevance. Pass ``next_cursor`` back as
+    ``cursor`` to fetch the next page.
+    """
+    service = SearchService(db, user.get('id'))
+    return service.search_tasks(q, board_id, lane_id, min_priority, limit, cursor)
+
+@router.get("/archive", response_model=ArchivedTaskPage)
+async def search_archived_tasks(
+    db: db_dependency,
+    user: user_dependency,
+    q: Optional[str] = Query(None, max_length=200),
+    board_id: Optional[int] = Query(None, gt=0),
+    lane_id: Optional[int] = Query(None, gt=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None)
+) -> ArchivedTaskPage:
+    """
+    Search or browse archived tasks, most recently archived first.
+
+    Archived tasks are not part of board snapshots; this is the only way
+    to read them.
+    """
+    service = SearchService(db, user.get('id'))
+    return service.search_archive(q, board_id, lane_id, limit, cursor)
+
+@router.get("/{task_id}/activity", response_model=ActivityPage)
+async def get_task_activity(
+    db: db_dependency,
+    user: user_dependency,
+    task_id: int = Path(gt=0),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None)
+) -> ActivityPage:
+    """History of one card, newest first; still available after the card is deleted."""
+    service = ActivityService(db, user.get('id'))
+    return service.task_activity(task_id, limit, cursor)
+
+@router.get("/{task_id}/subtasks", response_model=SubtaskTree)
+async def get_subtasks(
+    db: db_dependency,
+    user: user_dependency,
+    task_id: int = Path(gt=0)
+) -> SubtaskTree:
+    """The card's checklist: nested items in order, with done/total counts at every level."""
+    service = SubtaskService(db, user.get('id'))
+    return service.get_tree(task_id)
+
+@router.post("/{task_id}/subtasks", response_model=SubtaskResponse, status_code=201)
+async def create_subtask(
+    db: db_dependency,
+    user: user_dependency,
+    subtask: SubtaskCreate,
+    task_id: int = Path(gt=0)
+) -> SubtaskResponse:
+    """Add a checklist item to the card, at the top level or under `parent_id`."""
+    service = SubtaskService(db, user.get('id'))
+    return service.create_subtask(task_id, subtask)
+
+@router.put("/subtasks/{subtask_id}", response_model=SubtaskResponse)
+async def update_subtask(
+    db: db_dependency,
+    user: user_dependency,
+    subtask: SubtaskUpdate,
+    subtask_id: int = Path(gt=0)
+) -> SubtaskResponse:
+    """Rename, tick or reorder a checklist item."""
+    service = SubtaskService(db, user.get('id'))
+    return service.update_subtask(subtask_id, subtask)
+
+@router.put("/subtasks/{subtask_id}/move", response_model=SubtaskResponse)
+async def move_subtask(
+    db: db_dependency,
+    user: user_dependency,
+    move: SubtaskMove,
+    subtask_id: int = Path(gt=0)
+) -> SubtaskResponse:
+    """Move an item, with everything nested below it, under another item or card."""
+    service = SubtaskService(db, user.get('id'))
+    return service.move_subtask(subtask_id, move)
+
+@router.delete("/subtasks/{subtask_id}")
+async def delete_subtask(
+    db: db_dependency,
+    user: user_dependency,
+    subtask_id: int = Path(gt=0)
+) -> dict:
+    """Delete an item and everything nested below it."""
+    service = SubtaskService(db, user.get('id'))
+    return service.delete_subtask(subtask_id)
+
+@router.get("/{task_id}", response_model=TaskResponse)
+async def get_task(
+    db: db_dependency,
+    user: user_dependency,
+    response: Response,
+    task_id: int = Path(gt=0),
+    expand: Optional[Literal["subtasks"]] = expand_query
+) -> TaskResponse:
+    """One card; `expand=subtasks` includes its checklist tree and progress."""
+    service = TaskService(db, user.get('id'))
+    task = service.get_task(task_id, expand=expand == "subtasks")
+    set_etag(response, task.version)
+    return task
+
 @router.delete("/{task_id}")
 async def delete_task(
     db: db_dependency,
     user: user_dependency,
-    task_id: int = Path(gt=0)
+    task_id: int = Path(gt=0),
+    if_match: Optional[str] = Header(None)
 ) -> dict:
-    """Delete a task."""
+    """Delete a task (pass its ETag in If-Match to refuse if it changed meanwhile)."""
     service = TaskService(db, user.get('id'))
-    return service.delete_task(task_id)
+    return service.delete_task(task_id, parse_if_match(if_match))
 
 @router.put("/{task_id}/move", response_model=TaskResponse)
 async def move_task_card(
     db: db_dependency,
     user: user_dependency,
+    response: Response,
     task_id: int = Path(gt=0),
     new_lane_id: int = Body(..., embed=True),
-    new_position: int = Body(..., embed=True)
+    new_position: int = Body(..., embed=True),
+    if_match: Optional[str] = Header(None)
 ) -> TaskResponse:
     """
     Move a task to a different lane or reorder it.
     
-    This is the primary endpoint for drag-and-drop actions.
+    This is the primary endpoint for drag-and-drop actions. Send the card's
+    ETag as If-Match to get 409 instead of overwriting a concurrent move.
     """
     service = TaskService(db, user.get('id'))
-    return service.move_task(task_id, new_lane_id, new_position) # Corrected wrapper usage
+    task = service.move_task(task_id, new_lane_id, new_position, parse_if_match(if_match))
+    set_etag(response, task.version)
+    return task
 
 @router.put("/{task_id}", response_model=TaskResponse)
 async def update_task_details(
     db: db_dependency,
     user: user_dependency,
     task: TaskUpdate,
-    task_id: int = Path(gt=0)
+    response: Response,
+    task_id: int = Path(gt=0),
+    if_match: Optional[str] = Header(None)
 ) -> TaskResponse:
     """
     Update task details (title, description, priority).
+
+    Send the card's ETag as If-Match to get 409 on a concurrent edit.
     """
     service = TaskService(db, user.get('id'))
-    return service.update_task(task_id, task)
\ No newline at end of file
+    updated = service.update_task(task_id, task, parse_if_match(if_match))
+    set_etag(response, updated.version)
+    return updated
\ No newline at end of file
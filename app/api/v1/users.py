@@ -5,13 +5,14 @@ Provides RESTful endpoints for user management operations.
 Currently supported: List, Create, Read One, Update, Deactivate, Change Password
 """
 
-from fastapi import APIRouter, Depends, Path, Body
+from fastapi import APIRouter, Depends, Path, Body, Query
 from sqlalchemy.orm import Session
-from typing import Annotated
+from typing import Annotated, Optional
 
 from app.db.connection import get_db
 from app.schemas.user import UserResponse, UserCreate, UserUpdate, PasswordChange
 from app.services import UserService
+from app.services.loader import parse_ids
 from app.core.security import get_current_user, RoleChecker
 
 router = APIRouter()
@@ -19,34 +20,42 @@ router = APIRouter()
 # Dependency type hints
 db_dependency = Annotated[Session, Depends(get_db)]
 user_dependency = Annotated[dict, Depends(get_current_user)]
-admin_dependency = Annotated[dict, Depends(RoleChecker(["admin"]))]
 
 @router.get("/", response_model=list[UserResponse], tags=["Admin"])
-async def read_all_users(db: db_dependency, admin: admin_dependency):
+async def read_all_users(
+    db: db_dependency,
+    user: user_dependency,
+    ids: Optional[str] = Query(None, description="Comma-separated user ids to read in one request")
+):
     """
-    Retrieve all users. (Admin Only)
+    Retrieve all users (Admin Only), or with `ids` the profiles of those users.
+
+    Profiles are readable by any logged-in user, as with `GET /users/{id}`;
+    unknown ids are left out.
     """
     user_service = UserService(db)
+    user_ids = parse_ids(ids)
+    if user_ids is not None:
+        return await user_service.get_profiles(user_ids)
+    RoleChecker(["admin"])(user)
     return user_service.get_all_users()
 
 
-from fastapi import BackgroundTasks
-from app.services.notification_service import send_welcome_email
+from app.services.job_service import JobService
 
 @router.post("/", response_model=UserResponse, status_code=201)
 async def create_user(
     db: db_dependency, 
-    user_request: UserCreate,
-    background_tasks: BackgroundTasks
+    user_request: UserCreate
 ):
     """
-    Register a new user and send a welcome email in the background.
+    Register a new user and queue a welcome email for the job worker.
     """
     user_service = UserService(db)
     new_user = user_service.create_user(user_request)
     
-    # Add email task to background (Non-blocking)
-    background_tasks.add_task(send_welcome_email, new_user.email, new_user.full_name)
+    # Sent by `manage.py worker`, with retries (Non-blocking)
+    JobService(db).enqueue("send_welcome_email", {"email_to": new_user.email, "name": new_user.full_name})
     
     return new_user
 
@@ -57,7 +66,7 @@ async def read_current_user(db: db_dependency, user: user_dependency):
     Get current logged-in user details.
     """
     user_service = UserService(db)
-    return user_service.get_user_by_id(user.get('id'))
+    return await user_service.get_profile(user.get('id'))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
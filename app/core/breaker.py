@@ -0,0 +1,232 @@
+"""
+Circuit Breaker - Fail fast while a dependency is down or slow.
+
+A call to Redis or SMTP that cannot connect waits for the socket timeout
+before it fails. When the dependency is down every request pays that wait,
+so a cache outage becomes a latency outage. A breaker watches the recent
+outcomes of calls to one dependency and stops making them while most of
+them fail:
+
+    closed     calls go through; outcomes are counted over a rolling
+               window of ``BREAKER_WINDOW_SECONDS``. Once the window holds
+               ``BREAKER_MIN_CALLS`` calls and the failure rate reaches
+               ``BREAKER_FAILURE_RATE`` (or the share of calls slower than
+               the breaker's ``slow_call_seconds`` reaches
+               ``BREAKER_SLOW_CALL_RATE``), the breaker opens.
+    open       calls are rejected at once with ``CircuitOpenError`` for
+               ``BREAKER_OPEN_SECONDS``; callers take their fallback.
+    half_open  up to ``BREAKER_HALF_OPEN_CALLS`` trial calls go through.
+               If all of them succeed in time the breaker closes with a
+               fresh window; any failure or slow call opens it again.
+
+Usage::
+
+    try:
+        with cache_breaker.guard():
+            value = client.get(key)
+    except (redis.ConnectionError, CircuitOpenError):
+        value = None
+
+Only the exception types a breaker is built with count as failures;
+anything else (e.g. a Redis error reply) means the dependency answered.
+State lives per process and transitions are logged. ``breaker_stats``
+reports every breaker for ``GET /health/breakers``.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Type
+
+from app.core.config import settings
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+_breakers: List["CircuitBreaker"] = []
+
+
+class CircuitOpenError(RuntimeError):
+    """Call rejected without trying: the dependency's circuit is open."""
+
+
+class _Call:
+    """One guarded call (a plain class: it runs on every cache round trip)."""
+
+    __slots__ = ("breaker", "trial", "began")
+
+    def __init__(self, breaker: "CircuitBreaker"):
+        self.breaker = breaker
+
+    def __enter__(self) -> None:
+        self.trial = self.breaker._admit()
+        self.began = time.monotonic()
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        if exc_type is None or not issubclass(exc_type, Exception):
+            # Success, or cancelled (BaseException: only frees a trial slot)
+            success = True if exc_type is None else None
+        else:
+            # Other errors mean the dependency answered; the error is the caller's
+            success = not issubclass(exc_type, self.breaker.failures)
+        self.breaker._record(success, self.began, self.trial)
+        return False
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over a rolling window of call outcomes."""
+
+    def __init__(self, name: str, failures: Tuple[Type[BaseException], ...] = (Exception,),
+                 slow_call_seconds: Optional[float] = None, min_calls: Optional[int] = None):
+        """
+        Args:
+            name: Dependency name (metrics key)
+            failures: Exception types that count as a failed call
+            slow_call_seconds: Calls slower than this count as slow (None: latency is ignored)
+            min_calls: Calls in the window before rates are judged (default ``BREAKER_MIN_CALLS``)
+        """
+        self.name = name
+        self.failures = failures
+        self.slow_call_seconds = slow_call_seconds
+        self.min_calls = settings.BREAKER_MIN_CALLS if min_calls is None else min_calls
+        self.window_seconds = settings.BREAKER_WINDOW_SECONDS
+        self.failure_rate = settings.BREAKER_FAILURE_RATE
+        self.slow_call_rate = settings.BREAKER_SLOW_CALL_RATE
+        self.open_seconds = settings.BREAKER_OPEN_SECONDS
+        self.half_open_calls = settings.BREAKER_HALF_OPEN_CALLS
+
+        self.state = CLOSED
+        self._lock = threading.Lock()
+        self._opened_at = 0.0
+        self._trials = 0  # Half-open calls started
+        self._trial_successes = 0
+        # One bucket per second: [second, calls, failures, slow calls]
+        self._buckets: Deque[List[int]] = deque()
+        self._calls = self._failed = self._slow = 0
+        self._counters = {"calls": 0, "failures": 0, "slow_calls": 0, "rejected": 0, "opened": 0}
+        _breakers.append(self)
+
+    # --- CALLS ---
+    def guard(self) -> "_Call":
+        """
+        Run the ``with`` body as one call to the dependency.
+
+        Raises:
+            CircuitOpenError: Instead of running the body, while open
+        """
+        return _Call(self)
+
+    def allow(self) -> bool:
+        """Whether a call would be let through now (does not start one)."""
+        with self._lock:
+            self._advance(time.monotonic())
+            return self.state == CLOSED or (self.state == HALF_OPEN and self._trials < self.half_open_calls)
+
+    def _admit(self) -> bool:
+        if self.state == CLOSED:
+            return False  # Fast path, no lock: a racing transition only affects this one call
+        with self._lock:
+            self._advance(time.monotonic())
+            if self.state == CLOSED:
+                return False
+            if self.state == HALF_OPEN and self._trials < self.half_open_calls:
+                self._trials += 1
+                return True
+            self._counters["rejected"] += 1
+        raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def _record(self, success: Optional[bool], began: float, trial: bool) -> None:
+        """Count one outcome (None: cancelled, only frees a trial slot)."""
+        now = time.monotonic()
+        slow = self.slow_call_seconds is not None and now - began > self.slow_call_seconds
+        with self._lock:
+            if success is None:
+                if trial and self.state == HALF_OPEN:
+                    self._trials -= 1
+                return
+            self._counters["calls"] += 1
+            self._counters["failures"] += not success
+            self._counters["slow_calls"] += slow
+            if trial:
+                if self.state != HALF_OPEN:
+                    return  # Another trial already decided
+                if not success or slow:
+                    self._open(now)
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_calls:
+                    self._close()
+                return
+            if self.state != CLOSED:
+                return  # Straggler from before the breaker opened
+            self._add(int(now), success, slow)
+            if self._calls >= self.min_calls and (
+                self._failed >= self.failure_rate * self._calls
+                or (self.slow_call_seconds is not None and self._slow >= self.slow_call_rate * self._calls)
+            ):
+                self._open(now)
+
+    def reset(self) -> None:
+        """Close the breaker and forget the window."""
+        with self._lock:
+            self.state = CLOSED
+            self._buckets.clear()
+            self._calls = self._failed = self._slow = 0
+
+    # --- STATE (callers hold the lock) ---
+    def _advance(self, now: float) -> None:
+        if self.state == OPEN and now - self._opened_at >= self.open_seconds:
+            self.state = HALF_OPEN
+            self._trials = self._trial_successes = 0
+
+    def _open(self, now: float) -> None:
+        if self.state != OPEN:
+            print(f"Circuit {self.name} opened; failing fast for {self.open_seconds:g}s")
+        self.state = OPEN
+        self._opened_at = now
+        self._counters["opened"] += 1
+
+    def _close(self) -> None:
+        print(f"Circuit {self.name} closed")
+        self.state = CLOSED
+        self._buckets.clear()
+        self._calls = self._failed = self._slow = 0
+
+    def _prune(self, second: int) -> None:
+        while self._buckets and self._buckets[0][0] <= second - self.window_seconds:
+            _, calls, failed, slowed = self._buckets.popleft()
+            self._calls -= calls
+            self._failed -= failed
+            self._slow -= slowed
+
+    def _add(self, second: int, success: bool, slow: bool) -> None:
+        self._prune(second)
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0, 0])
+        bucket = self._buckets[-1]
+        bucket[1] += 1
+        bucket[2] += not success
+        bucket[3] += slow
+        self._calls += 1
+        self._failed += not success
+        self._slow += slow
+
+    # --- METRICS ---
+    def stats(self) -> Dict[str, Any]:
+        """State, rolling-window rates and lifetime counters."""
+        with self._lock:
+            now = time.monotonic()
+            self._advance(now)
+            self._prune(int(now))
+            calls = self._calls
+            return {
+                "state": self.state,
+                "window_calls": calls,
+                "failure_rate": round(self._failed / calls, 4) if calls else 0.0,
+                "slow_call_rate": round(self._slow / calls, 4) if calls else 0.0,
+                **self._counters,
+            }
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of every breaker in this process, by name."""
+    return {breaker.name: breaker.stats() for breaker in _breakers}
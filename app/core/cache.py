@@ -2,23 +2,67 @@
 Redis Cache Utility Module
 
 Provides a simple interface for caching operations using Redis.
-Supports JSON serialization for storing complex data structures.
+Values are stored as binary entries (see ``app/core/codec.py``): compact
+serialization, compression of large payloads and a schema tag, so an
+entry written for another response shape reads as a miss.
+
+Two clients share the settings, each on a bounded connection pool
+(``REDIS_MAX_CONNECTIONS``; callers wait up to ``REDIS_POOL_TIMEOUT`` for a
+free connection):
+
+    - ``CacheClient``: synchronous, for the (synchronous) services, the
+      job worker and the near-cache listener
+    - ``AsyncCacheClient``: asyncio, for ``async def`` handlers, so a cache
+      round trip does not block the event loop; ``get_many``/``set_many``
+      fetch or store N entries in one MGET or pipeline
+
+Pools are created on first use, never at import, so importing the app
+never needs Redis to be up; the application lifespan closes both.
+
+Every round trip runs under ``cache_breaker`` (see ``app/core/breaker.py``):
+while Redis is down or slow, calls take their fallback (a miss, False, 0)
+at once instead of each waiting for ``REDIS_SOCKET_TIMEOUT``.
+
+``cached()`` loads an expensive value at most once per key at a time
+(single-flight) and refreshes it before it expires (see its docstring).
+
+Keys in the namespaces listed in ``NEAR_CACHE_NAMESPACES`` are also kept
+in process (see ``app/core/near_cache.py``): reads try that layer first,
+and writes, deletes and increments publish an invalidation so every
+worker drops its copy.
 """
 
+import asyncio
+import inspect
+import math
+import random
+import time
+import uuid
 import redis
-import json
+import redis.asyncio as aioredis
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Union
 
+from app.core.breaker import CircuitBreaker, CircuitOpenError
+from app.core.codec import CodecError, codec, schema_tag
 from app.core.config import settings
+from app.core.near_cache import MISSING, PATTERN_PREFIX, near_cache
+
+cache_breaker = CircuitBreaker(
+    "redis",
+    failures=(redis.ConnectionError, redis.TimeoutError),
+    slow_call_seconds=settings.REDIS_SLOW_CALL_SECONDS
+)
+# Errors after which a cache call degrades to its fallback
+UNAVAILABLE = (redis.ConnectionError, redis.TimeoutError, CircuitOpenError)
 
 
 class CacheClient:
     """
     Redis cache client wrapper with connection management.
     
-    This class provides a singleton-like pattern for Redis connections
-    and handles JSON serialization/deserialization automatically.
+    This class provides a singleton-like pattern for Redis connections.
+    Responses are raw bytes; encoding is left to the codec.
     """
     
     _instance: Optional[redis.Redis] = None
@@ -32,54 +76,117 @@ class CacheClient:
             Redis client instance
         """
         if cls._instance is None:
-            cls._instance = redis.Redis(
+            pool = redis.BlockingConnectionPool(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
-                decode_responses=True
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                decode_responses=False
             )
+            cls._instance = redis.Redis(connection_pool=pool)
         return cls._instance
     
     @classmethod
     def close(cls) -> None:
-        """Close the Redis connection."""
+        """Close the Redis connection pool."""
         if cls._instance is not None:
             cls._instance.close()
+            cls._instance.connection_pool.disconnect()
             cls._instance = None
 
 
-# Create default client
-redis_client = CacheClient.get_client()
+class AsyncCacheClient:
+    """
+    asyncio Redis client on its own connection pool.
+
+    Connections belong to the event loop that opened them; a client is
+    created per running loop (in practice once per worker, as the server
+    runs a single loop).
+    """
+
+    _instance: Optional[aioredis.Redis] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def get_client(cls) -> aioredis.Redis:
+        """
+        Get or create the client of the running event loop.
 
+        Returns:
+            redis.asyncio client instance
+        """
+        loop = asyncio.get_running_loop()
+        if cls._instance is None or cls._loop is not loop:
+            pool = aioredis.BlockingConnectionPool(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                decode_responses=False
+            )
+            cls._instance, cls._loop = aioredis.Redis(connection_pool=pool), loop
+        return cls._instance
 
-def get_cache(key: str) -> Optional[Any]:
+    @classmethod
+    async def close(cls) -> None:
+        """Close the pool (called on application shutdown)."""
+        if cls._instance is not None:
+            client, cls._instance, cls._loop = cls._instance, None, None
+            await client.aclose(close_connection_pool=True)
+
+
+def _decode(key: str, data: Optional[bytes], schema: Optional[type], generation: int) -> Optional[Any]:
+    """Decode a fetched entry and keep it in the near cache (None on miss or foreign schema)."""
+    if not data:
+        return None
+    try:
+        value = codec.decode(data, schema_tag(schema))
+    except CodecError:
+        return None
+    near_cache.put(key, value, generation=generation)
+    return value
+
+
+def get_cache(key: str, schema: Optional[type] = None) -> Optional[Any]:
     """
     Retrieve data from cache.
     
     Args:
         key: Cache key to lookup
+        schema: Pydantic model the value was dumped from (same as passed to ``set_cache``)
         
     Returns:
-        Cached data (JSON deserialized) or None if not found
+        Cached data (decoded) or None if not found or written with another schema
     """
+    value = near_cache.get(key)
+    if value is not MISSING:
+        return value
     try:
-        data = redis_client.get(key)
-        if data:
-            return json.loads(data)
-        return None
-    except redis.ConnectionError:
+        generation = near_cache.generation()
+        with cache_breaker.guard():
+            data = CacheClient.get_client().get(key)
+    except UNAVAILABLE:
         # Log error in production, silently fail for now
         return None
+    return _decode(key, data, schema, generation)
 
 
-def set_cache(key: str, value: Any, expire_minutes: int = None) -> bool:
+def set_cache(key: str, value: Any, expire_minutes: int = None, schema: Optional[type] = None) -> bool:
     """
     Store data in cache with optional expiration.
     
     Args:
         key: Cache key
-        value: Data to cache (will be JSON serialized)
+        value: Data to cache (JSON-compatible; encoded by the codec)
         expire_minutes: TTL in minutes (defaults to settings)
+        schema: Pydantic model ``value`` was dumped from; its shape is tagged
+            in the entry
         
     Returns:
         True if successful, False otherwise
@@ -87,15 +194,214 @@ def set_cache(key: str, value: Any, expire_minutes: int = None) -> bool:
     if expire_minutes is None:
         expire_minutes = settings.CACHE_EXPIRE_MINUTES
     
+    data = codec.encode(value, schema_tag(schema))
+    try:
+        client = CacheClient.get_client()
+        if near_cache.handles(key):
+            # Other workers drop their copy in the same round trip
+            near_cache.discard(key)
+            pipe = client.pipeline(transaction=False)
+            pipe.setex(key, timedelta(minutes=expire_minutes), data)
+            pipe.publish(near_cache.channel, near_cache.message(key))
+            with cache_breaker.guard():
+                pipe.execute()
+            near_cache.put(key, value, ttl_seconds=expire_minutes * 60)
+        else:
+            with cache_breaker.guard():
+                client.setex(
+                    key, 
+                    timedelta(minutes=expire_minutes), 
+                    data
+                )
+        return True
+    except UNAVAILABLE:
+        return False
+
+
+async def aget_cache(key: str, schema: Optional[type] = None) -> Optional[Any]:
+    """
+    ``get_cache`` for ``async def`` code: the round trip does not block the event loop.
+
+    Args:
+        key: Cache key to lookup
+        schema: Pydantic model the value was dumped from
+
+    Returns:
+        Cached data (decoded) or None if not found or written with another schema
+    """
+    value = near_cache.get(key)
+    if value is not MISSING:
+        return value
     try:
-        redis_client.setex(
-            key, 
-            timedelta(minutes=expire_minutes), 
-            json.dumps(value)
-        )
+        generation = near_cache.generation()
+        with cache_breaker.guard():
+            data = await AsyncCacheClient.get_client().get(key)
+    except UNAVAILABLE:
+        return None
+    return _decode(key, data, schema, generation)
+
+
+async def aset_cache(key: str, value: Any, expire_minutes: int = None, schema: Optional[type] = None) -> bool:
+    """
+    ``set_cache`` for ``async def`` code.
+
+    Returns:
+        True if successful, False otherwise
+    """
+    return await set_many({key: value}, expire_minutes, schema)
+
+
+async def get_many(keys: Iterable[str], schema: Optional[type] = None) -> Dict[str, Any]:
+    """
+    Fetch several entries in one round trip (MGET).
+
+    Keys held by the near cache are answered from memory and left out of
+    the MGET.
+
+    Args:
+        keys: Cache keys to lookup
+        schema: Pydantic model the values were dumped from
+
+    Returns:
+        ``{key: value}`` for the keys found (misses are omitted)
+    """
+    found: Dict[str, Any] = {}
+    remote = []
+    for key in dict.fromkeys(keys):
+        value = near_cache.get(key)
+        if value is MISSING:
+            remote.append(key)
+        else:
+            found[key] = value
+    if not remote:
+        return found
+    try:
+        generation = near_cache.generation()
+        with cache_breaker.guard():
+            entries = await AsyncCacheClient.get_client().mget(remote)
+    except UNAVAILABLE:
+        return found
+    for key, data in zip(remote, entries):
+        value = _decode(key, data, schema, generation)
+        if value is not None:
+            found[key] = value
+    return found
+
+
+async def set_many(items: Dict[str, Any], expire_minutes: float = None, schema: Optional[type] = None) -> bool:
+    """
+    Store several entries in one pipelined round trip.
+
+    Near-cached keys are published for invalidation in the same pipeline.
+
+    Args:
+        items: ``{key: value}`` to store
+        expire_minutes: TTL in minutes (defaults to settings)
+        schema: Pydantic model the values were dumped from
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not items:
         return True
-    except redis.ConnectionError:
+    if expire_minutes is None:
+        expire_minutes = settings.CACHE_EXPIRE_MINUTES
+    tag = schema_tag(schema)
+    ttl = timedelta(minutes=expire_minutes)
+    try:
+        pipe = AsyncCacheClient.get_client().pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.setex(key, ttl, codec.encode(value, tag))
+            if near_cache.handles(key):
+                near_cache.discard(key)
+                pipe.publish(near_cache.channel, near_cache.message(key))
+        with cache_breaker.guard():
+            await pipe.execute()
+    except UNAVAILABLE:
         return False
+    for key, value in items.items():
+        near_cache.put(key, value, ttl_seconds=expire_minutes * 60)
+    return True
+
+
+# Raw entries: bytes stored and returned as is (no codec, never near-cached),
+# for payloads that are already encoded, e.g. precompressed response bodies
+
+async def aget_raw(key: str) -> Optional[bytes]:
+    """
+    Fetch the bytes stored under ``key`` by ``set_raw``.
+
+    Returns:
+        The stored bytes, or None if missing or Redis is unavailable
+    """
+    try:
+        with cache_breaker.guard():
+            return await AsyncCacheClient.get_client().get(key)
+    except UNAVAILABLE:
+        return None
+
+
+async def aget_raw_many(keys: Iterable[str]) -> Dict[str, bytes]:
+    """
+    Fetch several ``set_raw`` entries in one round trip (MGET).
+
+    Returns:
+        ``{key: bytes}`` for the keys found (empty if Redis is unavailable)
+    """
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+    try:
+        with cache_breaker.guard():
+            entries = await AsyncCacheClient.get_client().mget(keys)
+    except UNAVAILABLE:
+        return {}
+    return {key: data for key, data in zip(keys, entries) if data is not None}
+
+
+def set_raw(items: Dict[str, bytes], expire_seconds: float) -> bool:
+    """
+    Store several byte strings in one pipelined round trip.
+
+    Args:
+        items: ``{key: bytes}`` to store
+        expire_seconds: TTL in seconds
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        pipe = CacheClient.get_client().pipeline(transaction=False)
+        for key, data in items.items():
+            pipe.set(key, data, px=int(expire_seconds * 1000))
+        with cache_breaker.guard():
+            pipe.execute()
+        return True
+    except UNAVAILABLE:
+        return False
+
+
+def touch_raw(keys: Iterable[str], expire_seconds: float) -> Set[str]:
+    """
+    Extend the TTL of several entries in one round trip.
+
+    Args:
+        keys: Keys to extend
+        expire_seconds: New TTL in seconds
+
+    Returns:
+        The keys that still existed (and were extended); empty if Redis is unavailable
+    """
+    keys = list(keys)
+    try:
+        pipe = CacheClient.get_client().pipeline(transaction=False)
+        for key in keys:
+            pipe.pexpire(key, int(expire_seconds * 1000))
+        with cache_breaker.guard():
+            extended = pipe.execute()
+    except UNAVAILABLE:
+        return set()
+    return {key for key, ok in zip(keys, extended) if ok}
 
 
 def delete_cache(key: str) -> bool:
@@ -108,10 +414,20 @@ def delete_cache(key: str) -> bool:
     Returns:
         True if deleted, False otherwise
     """
+    near_cache.discard(key)
     try:
-        redis_client.delete(key)
+        client = CacheClient.get_client()
+        if near_cache.handles(key):
+            pipe = client.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.publish(near_cache.channel, near_cache.message(key))
+            with cache_breaker.guard():
+                pipe.execute()
+        else:
+            with cache_breaker.guard():
+                client.delete(key)
         return True
-    except redis.ConnectionError:
+    except UNAVAILABLE:
         return False
 
 
@@ -125,12 +441,17 @@ def clear_pattern(pattern: str) -> int:
     Returns:
         Number of keys deleted
     """
+    near_cache.discard_pattern(pattern)
     try:
-        keys = redis_client.keys(pattern)
-        if keys:
-            return redis_client.delete(*keys)
+        client = CacheClient.get_client()
+        with cache_breaker.guard():
+            if near_cache.enabled:
+                client.publish(near_cache.channel, near_cache.message(PATTERN_PREFIX + pattern))
+            keys = client.keys(pattern)
+            if keys:
+                return client.delete(*keys)
         return 0
-    except redis.ConnectionError:
+    except UNAVAILABLE:
         return 0
 
 
@@ -145,6 +466,212 @@ def cache_exists(key: str) -> bool:
         True if exists, False otherwise
     """
     try:
-        return redis_client.exists(key) > 0
-    except redis.ConnectionError:
-        return False
\ No newline at end of file
+        with cache_breaker.guard():
+            return CacheClient.get_client().exists(key) > 0
+    except UNAVAILABLE:
+        return False
+
+
+def get_counter(key: str) -> Optional[int]:
+    """
+    Read an integer counter (e.g. a version number).
+
+    Args:
+        key: Counter key
+
+    Returns:
+        Counter value (0 if never set), or None if Redis is unavailable
+    """
+    value = near_cache.get(key)
+    if value is not MISSING:
+        return value
+    try:
+        generation = near_cache.generation()
+        with cache_breaker.guard():
+            value = CacheClient.get_client().get(key)
+    except UNAVAILABLE:
+        return None
+    value = int(value) if value is not None else 0
+    near_cache.put(key, value, generation=generation)
+    return value
+
+
+def incr_counter(key: str) -> Optional[int]:
+    """
+    Atomically increment an integer counter.
+
+    Args:
+        key: Counter key
+
+    Returns:
+        New counter value, or None if Redis is unavailable
+    """
+    near_cache.discard(key)
+    try:
+        client = CacheClient.get_client()
+        with cache_breaker.guard():
+            if not near_cache.handles(key):
+                return client.incr(key)
+            pipe = client.pipeline(transaction=False)
+            pipe.incr(key)
+            pipe.publish(near_cache.channel, near_cache.message(key))
+            return pipe.execute()[0]
+    except UNAVAILABLE:
+        return None
+
+
+# ========================
+# Stampede Protection
+# ========================
+
+# key -> future of the load (or Redis read) in progress in this worker
+_loads: Dict[str, asyncio.Future] = {}
+_reads: Dict[str, asyncio.Future] = {}
+# Background refreshes, referenced so they are not garbage collected mid-run
+_refreshes: Set[asyncio.Task] = set()
+
+# Releases the cross-worker lock only if this worker still holds it
+_RELEASE_LOCK = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+Loader = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+async def _run_loader(loader: Loader) -> Any:
+    if inspect.iscoroutinefunction(loader):
+        return await loader()
+    # Synchronous loaders (database reads) run in a thread, off the event loop
+    return await asyncio.to_thread(loader)
+
+
+async def _load_and_store(key: str, loader: Loader, ttl_seconds: float, stale_seconds: float,
+                          schema: Optional[type], wait: bool) -> Any:
+    """
+    Load ``key`` once across workers and store it with its XFetch metadata.
+
+    Args:
+        wait: If another worker holds the lock, poll for its result (a miss)
+            instead of returning None at once (a background refresh)
+    """
+    client = AsyncCacheClient.get_client()
+    lock_key, token = f"lock:{key}", uuid.uuid4().hex
+    deadline = time.monotonic() + settings.CACHE_LOCK_SECONDS
+    while True:
+        try:
+            with cache_breaker.guard():
+                locked = await client.set(lock_key, token, nx=True, px=int(settings.CACHE_LOCK_SECONDS * 1000))
+        except UNAVAILABLE:
+            locked = True  # No Redis, no coordination: load locally
+        if locked:
+            break
+        if not wait:
+            return None
+        await asyncio.sleep(settings.CACHE_LOCK_POLL_SECONDS)
+        entry = await aget_cache(key, schema)
+        if entry is not None and entry["expires"] > time.time():
+            return entry["value"]
+        if time.monotonic() >= deadline:
+            break  # The holder died or is too slow; load without the lock
+
+    try:
+        began = time.monotonic()
+        value = await _run_loader(loader)
+        delta = time.monotonic() - began
+        if value is not None:
+            envelope = {"value": value, "expires": time.time() + ttl_seconds, "delta": delta}
+            await set_many({key: envelope}, (ttl_seconds + stale_seconds) / 60, schema)
+        return value
+    finally:
+        try:
+            with cache_breaker.guard():
+                await client.eval(_RELEASE_LOCK, 1, lock_key, token)
+        except UNAVAILABLE:
+            pass
+
+
+def _single_flight(flights: Dict[str, asyncio.Future], key: str,
+                   start: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+    """
+    Future of the operation on ``key`` in progress in this worker, starting it if none is.
+
+    Await it through ``asyncio.shield``: it is shared by every caller.
+    """
+    future = flights.get(key)
+    if future is None:
+        future = asyncio.ensure_future(start())
+        flights[key] = future
+        future.add_done_callback(lambda _: flights.pop(key, None))
+    return future
+
+
+def _refresh_in_background(key: str, load: Callable[[], Awaitable[Any]]) -> None:
+    if key in _loads:
+        return
+    task = _single_flight(_loads, key, load)
+    _refreshes.add(task)
+
+    def done(finished: asyncio.Task) -> None:
+        _refreshes.discard(finished)
+        if not finished.cancelled() and finished.exception() is not None:
+            print(f"Background refresh of {key} failed: {finished.exception()}")
+
+    task.add_done_callback(done)
+
+
+async def cached(
+    key: str,
+    loader: Loader,
+    ttl_seconds: Optional[float] = None,
+    stale_seconds: Optional[float] = None,
+    schema: Optional[type] = None,
+    beta: Optional[float] = None
+) -> Any:
+    """
+    Return the cached value of ``key``, loading it with ``loader`` on a miss.
+
+    Protection against stampedes when a hot entry expires:
+        - Single flight: concurrent misses in a worker share one asyncio
+          future, and workers share a short Redis lock (``lock:{key}``);
+          the others poll for the result instead of loading it again.
+          Concurrent hits share one Redis read and decode as well.
+        - Early refresh (XFetch): each hit recomputes ahead of expiry with
+          a probability that grows as expiry nears and with how long the
+          last load took (``beta`` scales it; 0 disables).
+        - Stale-while-revalidate: for ``stale_seconds`` after expiry the
+          old value is still served while one background load replaces it.
+
+    Early and stale refreshes never make the caller wait. None is never
+    cached, and the value returned is shared between concurrent callers
+    (treat it as read-only). Loaders run without the request's database
+    session (a background refresh outlives the request) and must open
+    their own.
+
+    Args:
+        key: Cache key
+        loader: Zero-argument function (sync or async) returning JSON-compatible data
+        ttl_seconds: Freshness period (defaults to ``CACHE_EXPIRE_MINUTES``)
+        stale_seconds: Grace period after expiry (defaults to ``CACHE_STALE_SECONDS``)
+        schema: Pydantic model the value is dumped from (see ``set_cache``)
+        beta: XFetch aggressiveness (defaults to ``CACHE_XFETCH_BETA``)
+
+    Returns:
+        The cached or freshly loaded value (None if the loader returned None)
+    """
+    ttl_seconds = settings.CACHE_EXPIRE_MINUTES * 60 if ttl_seconds is None else ttl_seconds
+    stale_seconds = settings.CACHE_STALE_SECONDS if stale_seconds is None else stale_seconds
+    beta = settings.CACHE_XFETCH_BETA if beta is None else beta
+
+    def load(wait: bool) -> Callable[[], Awaitable[Any]]:
+        return lambda: _load_and_store(key, loader, ttl_seconds, stale_seconds, schema, wait)
+
+    # Shielded: a caller that is cancelled (client gone) must not cancel the
+    # shared read or load that other callers are waiting on
+    entry = await asyncio.shield(_single_flight(_reads, key, lambda: aget_cache(key, schema)))
+    if entry is not None:
+        now = time.time()
+        # XFetch: -log(U) is exponential, so an early refresh gets likelier near expiry
+        early = beta > 0 and now - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expires"]
+        if early or now >= entry["expires"]:
+            _refresh_in_background(key, load(False))
+        return entry["value"]
+
+    return await asyncio.shield(_single_flight(_loads, key, load(True)))
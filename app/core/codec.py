@@ -0,0 +1,203 @@
+"""
+Cache Codec - Binary encoding of cache entries.
+
+Every entry written by ``app.core.cache`` starts with a 7-byte header:
+
+    byte 0     entry format (``FORMAT``)
+    byte 1     serializer id (json, orjson, msgpack)
+    byte 2     compressor id (none, zlib, zstd, lz4)
+    bytes 3-6  schema tag (big-endian uint32)
+
+followed by the serialized, possibly compressed, payload. Payloads under
+``CACHE_COMPRESS_MIN_BYTES`` are stored uncompressed; compressing a short
+role map costs more CPU than it saves.
+
+The schema tag identifies the shape of the cached value. Callers that
+cache a Pydantic response pass the model and the tag is derived from its
+JSON schema (plus ``CACHE_SCHEMA_VERSION`` for manual bumps), so a deploy
+that changes e.g. ``BoardResponse`` reads old entries as misses instead of
+serving the old shape. Entries whose codec is not installed in this
+process (mixed deploys) are misses too.
+
+orjson, msgpack, zstandard and lz4 are optional: ``CACHE_SERIALIZER`` and
+``CACHE_COMPRESSION`` fall back to the standard library (json, zlib) when
+the package is missing. Entries without a header (JSON text written
+before this format) cannot prove their shape and are misses as well; the
+next fill overwrites them.
+"""
+
+import json
+import struct
+import threading
+import zlib
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+FORMAT = 1
+HEADER = struct.Struct(">BBBI")
+
+
+class CodecError(ValueError):
+    """Entry cannot be decoded here (unknown codec or different schema); treat as a miss."""
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _load_serializers() -> Dict[int, Tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]]:
+    serializers = {1: ("json", _json_dumps, json.loads)}
+    try:
+        import orjson
+
+        # Non-str keys (e.g. {board_id: role}) become strings, as with json
+        options = orjson.OPT_NON_STR_KEYS
+        serializers[2] = ("orjson", lambda value: orjson.dumps(value, default=str, option=options), orjson.loads)
+    except ImportError:
+        pass
+    try:
+        import msgpack
+
+        serializers[3] = (
+            "msgpack",
+            lambda value: msgpack.packb(value, default=str, use_bin_type=True),
+            lambda data: msgpack.unpackb(data, raw=False, strict_map_key=False),
+        )
+    except ImportError:
+        pass
+    return serializers
+
+
+def _load_compressors() -> Dict[int, Tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    compressors = {
+        0: ("none", lambda data: data, lambda data: data),
+        1: ("zlib", lambda data: zlib.compress(data, 1), zlib.decompress),
+    }
+    try:
+        import zstandard
+
+        # zstd contexts must not be shared between threads (sync callers
+        # and to_thread in the async paths): one pair per thread
+        local = threading.local()
+
+        def contexts():
+            if not hasattr(local, "compressor"):
+                local.compressor, local.decompressor = zstandard.ZstdCompressor(level=3), zstandard.ZstdDecompressor()
+            return local
+
+        compressors[2] = (
+            "zstd",
+            lambda data: contexts().compressor.compress(data),
+            lambda data: contexts().decompressor.decompress(data),
+        )
+    except ImportError:
+        pass
+    try:
+        import lz4.frame
+
+        compressors[3] = ("lz4", lz4.frame.compress, lz4.frame.decompress)
+    except ImportError:
+        pass
+    return compressors
+
+
+SERIALIZERS = _load_serializers()
+COMPRESSORS = _load_compressors()
+
+# Preference order when a setting is "auto" (or names a codec that is not installed)
+_SERIALIZER_ORDER = ("orjson", "msgpack", "json")
+_COMPRESSOR_ORDER = ("zstd", "lz4", "zlib")
+
+
+def _pick(table: dict, wanted: str, order: Tuple[str, ...]) -> int:
+    by_name = {name: codec_id for codec_id, (name, _, _) in table.items()}
+    for name in ((wanted,) if wanted != "auto" else ()) + order:
+        if name in by_name:
+            return by_name[name]
+    return min(by_name.values())
+
+
+class Codec:
+    """Encodes and decodes cache entries with one serializer and compressor."""
+
+    def __init__(self, serializer: Optional[str] = None, compression: Optional[str] = None,
+                 min_compress_bytes: Optional[int] = None):
+        """
+        Args:
+            serializer: json, orjson, msgpack or auto (default ``CACHE_SERIALIZER``)
+            compression: none, zlib, zstd, lz4 or auto (default ``CACHE_COMPRESSION``)
+            min_compress_bytes: Smaller payloads are stored uncompressed
+        """
+        self.serializer_id = _pick(SERIALIZERS, serializer or settings.CACHE_SERIALIZER, _SERIALIZER_ORDER)
+        compression = compression or settings.CACHE_COMPRESSION
+        self.compressor_id = 0 if compression == "none" else _pick(COMPRESSORS, compression, _COMPRESSOR_ORDER)
+        self.min_compress_bytes = (
+            settings.CACHE_COMPRESS_MIN_BYTES if min_compress_bytes is None else min_compress_bytes
+        )
+
+    @property
+    def name(self) -> str:
+        serializer = SERIALIZERS[self.serializer_id][0]
+        compressor = COMPRESSORS[self.compressor_id][0]
+        return serializer if compressor == "none" else f"{serializer}+{compressor}"
+
+    def encode(self, value: Any, schema: int = 0) -> bytes:
+        """
+        Serialize ``value`` into a cache entry.
+
+        Args:
+            value: JSON-compatible data
+            schema: Schema tag (see ``schema_tag``)
+
+        Returns:
+            Header plus payload
+        """
+        payload = SERIALIZERS[self.serializer_id][1](value)
+        compressor_id = 0
+        if self.compressor_id and len(payload) >= self.min_compress_bytes:
+            compressor_id = self.compressor_id
+            payload = COMPRESSORS[compressor_id][1](payload)
+        return HEADER.pack(FORMAT, self.serializer_id, compressor_id, schema) + payload
+
+    def decode(self, data: bytes, schema: int = 0) -> Any:
+        """
+        Read a cache entry written by ``encode`` with any codec.
+
+        Raises:
+            CodecError: If the entry has no header, another schema tag, an
+                unavailable codec or a corrupt payload
+        """
+        if len(data) < HEADER.size or data[0] != FORMAT:
+            raise CodecError("Cache entry has no codec header")
+        _, serializer_id, compressor_id, entry_schema = HEADER.unpack_from(data)
+        if entry_schema != schema:
+            raise CodecError("Cache entry has another schema")
+        if serializer_id not in SERIALIZERS or compressor_id not in COMPRESSORS:
+            raise CodecError("Cache entry uses a codec that is not installed")
+        try:
+            payload = COMPRESSORS[compressor_id][2](data[HEADER.size:])
+            return SERIALIZERS[serializer_id][2](payload)
+        except Exception as e:  # Each library has its own error type
+            raise CodecError("Corrupt cache entry") from e
+
+
+@lru_cache(maxsize=None)
+def schema_tag(model: Optional[type] = None) -> int:
+    """
+    Tag identifying the shape of cached values.
+
+    Args:
+        model: Pydantic model the value was dumped from, or None for
+            ad-hoc structures (tagged by ``CACHE_SCHEMA_VERSION`` only)
+
+    Returns:
+        32-bit tag stored in the entry header
+    """
+    shape = model.model_json_schema() if model is not None else None
+    raw = json.dumps([settings.CACHE_SCHEMA_VERSION, shape], sort_keys=True).encode("utf-8")
+    return zlib.crc32(raw)
+
+
+codec = Codec()
@@ -0,0 +1,50 @@
+"""
+Optimistic Concurrency Helpers
+
+Tasks and lanes carry a ``version`` counter that every write increments.
+Responses expose it as an ``ETag`` (``"<version>"``); clients send it back
+in ``If-Match`` and the service adds ``WHERE version = ?`` to the UPDATE.
+A concurrent write makes the statement match no row, which is reported as
+409 Conflict instead of silently overwriting the other change.
+"""
+
+from typing import Optional
+
+from fastapi import HTTPException, Response, status
+
+
+def etag(version: int) -> str:
+    """Strong ETag for a row version."""
+    return f'"{version}"'
+
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    """
+    Extract the expected version from an ``If-Match`` header.
+
+    Args:
+        value: Raw header value (``"3"``, ``W/"3"``, ``3`` or ``*``)
+
+    Returns:
+        The version, or None when the header is absent or ``*`` (no check)
+
+    Raises:
+        HTTPException 400: If the header is not a single version tag
+    """
+    if value is None or value.strip() == "*":
+        return None
+    tag = value.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    if not tag.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="If-Match must be a single version ETag, e.g. \"3\""
+        )
+    return int(tag)
+
+
+def set_etag(response: Response, version: int) -> None:
+    """Expose the new version so the client can chain the next write."""
+    response.headers["ETag"] = etag(version)
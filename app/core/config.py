@@ -6,6 +6,7 @@ for environment variable management and validation.
 """
 
 import os
+from typing import Dict, List
 from pydantic_settings import BaseSettings
 from pydantic import SecretStr, Field
 
@@ -44,7 +45,80 @@ class Settings(BaseSettings):
     REDIS_HOST: str = Field(default="localhost", description="Redis server host")
     REDIS_PORT: int = Field(default=6379, description="Redis server port")
     REDIS_DB: int = Field(default=0, description="Redis database number")
+    REDIS_MAX_CONNECTIONS: int = Field(default=50, description="Connections per pool (sync and asyncio pools each)")
+    REDIS_POOL_TIMEOUT: float = Field(default=2.0, description="Seconds to wait for a free pooled connection")
+    REDIS_SOCKET_TIMEOUT: float = Field(default=1.0, description="Seconds to connect or wait for a reply")
+    REDIS_SLOW_CALL_SECONDS: float = Field(default=0.25, description="Redis calls slower than this count as slow")
     CACHE_EXPIRE_MINUTES: int = Field(default=5, description="Default cache TTL in minutes")
+    CACHE_SERIALIZER: str = Field(default="auto", description="json, orjson, msgpack or auto (best installed)")
+    CACHE_COMPRESSION: str = Field(default="auto", description="none, zlib, zstd, lz4 or auto (best installed)")
+    CACHE_COMPRESS_MIN_BYTES: int = Field(default=1024, description="Smaller entries are stored uncompressed")
+    CACHE_SCHEMA_VERSION: int = Field(default=1, description="Bump to invalidate every cached shape at once")
+    CACHE_STALE_SECONDS: float = Field(default=60.0, description="cached(): serve an expired value this long while refreshing")
+    CACHE_XFETCH_BETA: float = Field(default=1.0, description="cached(): early refresh aggressiveness (0 = off)")
+    CACHE_LOCK_SECONDS: float = Field(default=10.0, description="cached(): cross-worker load lock lifetime")
+    CACHE_LOCK_POLL_SECONDS: float = Field(default=0.05, description="cached(): poll interval while another worker loads")
+    SNAPSHOT_ENCODINGS: List[str] = Field(
+        default=["br", "zstd", "gzip"],
+        description="Precompressed variants kept per board snapshot (br and zstd need their packages)"
+    )
+    SNAPSHOT_MIN_COMPRESS_BYTES: int = Field(default=1024, description="Smaller snapshots are only kept uncompressed")
+
+    # Near Cache Settings (in-process layer in front of Redis)
+    NEAR_CACHE_ENABLED: bool = Field(default=True, description="Serve hot keys from process memory")
+    NEAR_CACHE_NAMESPACES: Dict[str, int] = Field(
+        default={"acl": 20000, "user": 10000, "board": 20000},
+        description="Key prefix -> max entries kept in process (other prefixes always go to Redis)"
+    )
+    NEAR_CACHE_TTL_SECONDS: float = Field(default=30.0, description="Longest time a worker keeps an entry")
+    NEAR_CACHE_CHANNEL: str = Field(default="cache:invalidate", description="Redis pub/sub channel for invalidations")
+
+    # Batch Reads (`GET /boards?ids=`, `GET /users?ids=`)
+    BATCH_MAX_IDS: int = Field(default=100, description="Most ids accepted by one batch read")
+
+    # Partitioning (PostgreSQL, applied with `manage.py partition-tasks`)
+    TASKS_PARTITIONS: int = Field(default=16, description="Hash partitions of tasks by board_id")
+
+    # Archive Settings
+    ARCHIVE_BATCH_SIZE: int = Field(default=1000, description="Tasks moved to the archive per transaction")
+    ARCHIVE_INTERVAL_MINUTES: int = Field(default=60, description="Pause between runs of the archive worker")
+
+    # Job Queue Settings (`manage.py worker`)
+    JOB_CONCURRENCY: int = Field(default=4, description="Jobs a worker runs in parallel")
+    JOB_POLL_SECONDS: float = Field(default=1.0, description="Worker sleep when the queue is empty")
+    JOB_MAX_ATTEMPTS: int = Field(default=5, description="Runs before a job is dead-lettered")
+    JOB_RETRY_BASE_SECONDS: int = Field(default=30, description="First retry delay (doubles per attempt)")
+    JOB_RETRY_MAX_SECONDS: int = Field(default=3600, description="Cap on the retry delay")
+    JOB_LEASE_SECONDS: int = Field(default=900, description="Running jobs not renewed for this long are requeued")
+
+    # Reminder Scheduler Settings (`manage.py scheduler`)
+    REMINDER_WINDOW_SECONDS: int = Field(default=60, description="How far ahead reminders are claimed and held in memory")
+    REMINDER_POLL_SECONDS: float = Field(default=5.0, description="Pause between claims (latency of short-notice due dates)")
+    REMINDER_TICK_SECONDS: float = Field(default=1.0, description="Timing wheel slot width: how late, at most, a reminder fires")
+    REMINDER_BATCH_SIZE: int = Field(default=500, description="Reminders claimed per statement and sent per job")
+    REMINDER_LEASE_SECONDS: int = Field(default=120, description="Claims not sent this long after the window are claimed again")
+    REMINDER_MAX_PENDING: int = Field(default=20000, description="Most reminders one scheduler holds in memory")
+
+    # Subtasks (checklists on cards)
+    SUBTASK_MAX_DEPTH: int = Field(default=8, description="Levels of nesting allowed under a card")
+
+    # Daily Digest Settings
+    DIGEST_CHUNK_SIZE: int = Field(default=5000, description="Users aggregated per digest query")
+    DIGEST_SEND_BATCH: int = Field(default=500, description="Digests per send_digests job")
+
+    # Activity Log Settings
+    AUDIT_ENABLED: bool = Field(default=True, description="Record board and card changes in activity_events")
+    AUDIT_FLUSH_SECONDS: float = Field(default=1.0, description="Longest time an event waits in the buffer")
+    AUDIT_FLUSH_SIZE: int = Field(default=500, description="Buffered events that trigger an early flush")
+    AUDIT_MAX_BUFFER: int = Field(default=50000, description="Events kept while the database is unavailable")
+
+    # Circuit Breaker Settings (Redis and SMTP, see app/core/breaker.py)
+    BREAKER_WINDOW_SECONDS: int = Field(default=30, description="Rolling window of call outcomes")
+    BREAKER_MIN_CALLS: int = Field(default=10, description="Calls in the window before the breaker may open")
+    BREAKER_FAILURE_RATE: float = Field(default=0.5, description="Failure share that opens the breaker")
+    BREAKER_SLOW_CALL_RATE: float = Field(default=0.8, description="Slow-call share that opens the breaker")
+    BREAKER_OPEN_SECONDS: float = Field(default=5.0, description="Fail fast this long before trying again")
+    BREAKER_HALF_OPEN_CALLS: int = Field(default=3, description="Trial calls that must succeed to close again")
 
     # Email Settings
     MAIL_USERNAME: str = Field(default="", description="SMTP Username (Email)")
@@ -54,6 +128,8 @@ class Settings(BaseSettings):
     MAIL_SERVER: str = Field(default="smtp.gmail.com", description="SMTP Server Host")
     MAIL_STARTTLS: bool = Field(default=True, description="Enable STARTTLS")
     MAIL_SSL_TLS: bool = Field(default=False, description="Enable SSL/TLS")
+    MAIL_TIMEOUT: int = Field(default=10, description="Seconds to connect to or wait on the SMTP server")
+    MAIL_SLOW_CALL_SECONDS: float = Field(default=10.0, description="Sends slower than this count as slow")
 
     
     class Config:
@@ -0,0 +1,231 @@
+"""
+Near Cache - Bounded in-process layer in front of Redis.
+
+Hot keys are read far more often than they change (the current user's
+profile, ACL versions and role maps). ``app.core.cache`` consults this
+layer first, so a hit costs a dict lookup instead of a Redis round trip
+and a ``json.loads``.
+
+Only namespaces listed in ``NEAR_CACHE_NAMESPACES`` are kept here, each
+in its own LRU with its own size limit; the namespace is the key prefix
+before the first ``:``. Entries live at most ``NEAR_CACHE_TTL_SECONDS``
+(or the Redis TTL, if shorter).
+
+Invalidation across workers goes through the Redis pub/sub channel
+``NEAR_CACHE_CHANNEL``: every write or delete of a near-cached key
+publishes the key, and each worker's listener thread drops it. Pub/sub
+is fire-and-forget, so:
+
+    - the layer is only read while the listener is subscribed, and it is
+      emptied whenever the listener (re)connects;
+    - a fill is discarded if any invalidation arrived while it was being
+      read from Redis, so a value published stale is never cached;
+    - the TTL bounds whatever slips through anyway.
+
+Cached values are shared between requests and must be treated as read-only.
+"""
+
+import fnmatch
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import redis
+
+from app.core.config import settings
+
+MISSING = object()
+
+# Prefix of key patterns in invalidation messages (``clear_pattern``)
+PATTERN_PREFIX = "pattern:"
+
+
+class NearCache:
+    """Per-namespace TTL-aware LRU, invalidated over Redis pub/sub."""
+
+    def __init__(self, namespaces: Optional[Dict[str, int]] = None, ttl_seconds: Optional[float] = None,
+                 channel: Optional[str] = None):
+        self.limits = dict(settings.NEAR_CACHE_NAMESPACES if namespaces is None else namespaces)
+        self.ttl_seconds = ttl_seconds or settings.NEAR_CACHE_TTL_SECONDS
+        self.channel = channel or settings.NEAR_CACHE_CHANNEL
+        self.enabled = settings.NEAR_CACHE_ENABLED and bool(self.limits)
+        # Messages carry the sender's id so a worker ignores its own writes
+        self.origin = uuid.uuid4().hex
+        self.listening = False
+        self._entries: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = {
+            namespace: OrderedDict() for namespace in self.limits
+        }
+        self._stats: Dict[str, Dict[str, int]] = {
+            namespace: {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "invalidations": 0}
+            for namespace in self.limits
+        }
+        self._generation = 0  # Bumped by every invalidation; guards fills (see ``put``)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def namespace(key: str) -> str:
+        return key.split(":", 1)[0]
+
+    def handles(self, key: str) -> bool:
+        """Whether ``key`` belongs to a near-cached namespace."""
+        return self.enabled and self.namespace(key) in self.limits
+
+    # --- READS AND FILLS ---
+    def get(self, key: str) -> Any:
+        """
+        Look ``key`` up.
+
+        Returns:
+            The cached value, or ``MISSING``
+        """
+        if not self.handles(key):
+            return MISSING
+        self._ensure_listener()
+        namespace = self.namespace(key)
+        with self._lock:
+            stats = self._stats[namespace]
+            if not self.listening:
+                stats["misses"] += 1
+                return MISSING
+            entries = self._entries[namespace]
+            entry = entries.get(key)
+            if entry is None:
+                stats["misses"] += 1
+                return MISSING
+            if entry[0] <= time.monotonic():
+                del entries[key]
+                stats["expired"] += 1
+                stats["misses"] += 1
+                return MISSING
+            entries.move_to_end(key)
+            stats["hits"] += 1
+            return entry[1]
+
+    def generation(self) -> int:
+        """Take before reading Redis; pass to ``put`` with what was read."""
+        return self._generation
+
+    def put(self, key: str, value: Any, ttl_seconds: Optional[float] = None,
+            generation: Optional[int] = None) -> None:
+        """
+        Keep ``value`` for ``key``.
+
+        Args:
+            key: Cache key
+            value: Deserialized value (shared, treat as read-only)
+            ttl_seconds: Remaining Redis TTL, if shorter than the near-cache TTL
+            generation: ``generation()`` taken before the value was read; the
+                fill is skipped if an invalidation arrived since
+        """
+        if not self.handles(key):
+            return
+        namespace = self.namespace(key)
+        ttl = min(self.ttl_seconds, ttl_seconds) if ttl_seconds else self.ttl_seconds
+        with self._lock:
+            if not self.listening or (generation is not None and generation != self._generation):
+                return
+            entries = self._entries[namespace]
+            entries[key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > self.limits[namespace]:
+                entries.popitem(last=False)
+                self._stats[namespace]["evictions"] += 1
+
+    # --- INVALIDATION ---
+    def discard(self, key: str) -> None:
+        """Drop ``key`` in this worker (other workers: see ``message``)."""
+        if not self.handles(key):
+            return
+        namespace = self.namespace(key)
+        with self._lock:
+            self._generation += 1
+            if self._entries[namespace].pop(key, None) is not None:
+                self._stats[namespace]["invalidations"] += 1
+
+    def discard_pattern(self, pattern: str) -> None:
+        """Drop every key matching a Redis-style glob in this worker."""
+        with self._lock:
+            self._generation += 1
+            for namespace, entries in self._entries.items():
+                for key in [key for key in entries if fnmatch.fnmatchcase(key, pattern)]:
+                    del entries[key]
+                    self._stats[namespace]["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            for entries in self._entries.values():
+                entries.clear()
+
+    def message(self, key: str) -> str:
+        """Payload to publish on ``channel`` so other workers drop ``key``."""
+        return f"{self.origin}|{key}"
+
+    def _apply(self, payload: Any) -> None:
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
+        origin, _, key = str(payload).partition("|")
+        if origin == self.origin:
+            return
+        if key.startswith(PATTERN_PREFIX):
+            self.discard_pattern(key[len(PATTERN_PREFIX):])
+        else:
+            self.discard(key)
+
+    # --- LISTENER ---
+    def _ensure_listener(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            # Started on first use, so importing the app needs no Redis
+            self._thread = threading.Thread(target=self._listen, name="near-cache-listener", daemon=True)
+            self._thread.start()
+
+    def _listen(self) -> None:
+        from app.core.cache import CacheClient
+
+        while True:
+            pubsub = None
+            try:
+                pubsub = CacheClient.get_client().pubsub()
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        # Anything cached before this point may have missed an invalidation
+                        self.clear()
+                        self.listening = True
+                    elif message["type"] == "message":
+                        self._apply(message["data"])
+            except (redis.RedisError, OSError, ValueError):
+                pass
+            finally:
+                self.listening = False
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except (redis.RedisError, OSError):
+                        pass
+            time.sleep(1.0)
+
+    # --- METRICS ---
+    def stats(self) -> Dict[str, Any]:
+        """Per-namespace hits, misses, hit ratio, size and limit."""
+        with self._lock:
+            namespaces = {}
+            for namespace, counts in self._stats.items():
+                lookups = counts["hits"] + counts["misses"]
+                namespaces[namespace] = {
+                    **counts,
+                    "hit_ratio": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+                    "size": len(self._entries[namespace]),
+                    "limit": self.limits[namespace],
+                }
+        return {"enabled": self.enabled, "listening": self.listening, "namespaces": namespaces}
+
+
+near_cache = NearCache()
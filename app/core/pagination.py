@@ -0,0 +1,53 @@
+"""
+Keyset Pagination Helpers
+
+Cursors are opaque, URL-safe strings wrapping the sort key of the last
+row of a page. The next page continues strictly after that key, so deep
+pages cost the same as the first one (no OFFSET scans).
+"""
+
+import base64
+import json
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode the sort key of the last returned row.
+
+    Args:
+        values: JSON-serializable key values, in sort order
+
+    Returns:
+        Opaque cursor string
+    """
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string from the client (None for the first page)
+        size: Expected number of key values
+
+    Returns:
+        List of key values, or None for the first page
+
+    Raises:
+        HTTPException 400: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
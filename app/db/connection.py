@@ -7,7 +7,10 @@ SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
 
-SessionLocal = sessionmaker(autoflush=False, autocommit=False, bind=engine)
+# Services refresh explicitly where they need server state; keeping
+# objects loaded after commit lets UPDATE ... RETURNING results be
+# serialized without another SELECT.
+SessionLocal = sessionmaker(autoflush=False, autocommit=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
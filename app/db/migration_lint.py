@@ -0,0 +1,154 @@
+"""
+Migration Lint - Rejects revisions that lock large tables for long.
+
+Every revision is rendered offline (``alembic upgrade --sql``) for
+PostgreSQL, and each statement that touches a large table (one that
+already exists, i.e. not created in the same revision) is checked:
+
+    index-lock                CREATE INDEX without CONCURRENTLY
+    table-rewrite             stored generated / volatile-default column, ALTER COLUMN TYPE,
+                              VACUUM FULL, CLUSTER
+    not-null-without-default  ADD COLUMN ... NOT NULL with no DEFAULT
+    set-not-null              ALTER COLUMN ... SET NOT NULL (scans under ACCESS EXCLUSIVE)
+    validating-constraint     FOREIGN KEY / CHECK added without NOT VALID
+    unique-constraint         PRIMARY KEY / UNIQUE added without USING INDEX
+    unbatched-write           UPDATE / DELETE without a LIMIT (use online_ddl.batched_backfill)
+    explicit-lock             LOCK TABLE
+
+A revision may waive a rule by naming it in its module-level
+``lint_waivers`` dict together with the reason.
+"""
+
+import argparse
+import io
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+LARGE_TABLES = ("tasks", "tasks_archive", "lanes")
+
+# URL only selects the dialect; offline rendering never connects
+LINT_URL = "postgresql://lint@localhost/lint"
+
+VOLATILE_DEFAULTS = ("RANDOM(", "CLOCK_TIMESTAMP(", "GEN_RANDOM_UUID(", "UUID_GENERATE", "NEXTVAL(", "TIMEOFDAY(")
+
+_REVISION = re.compile(r"^-- Running upgrade (\S*) ?-> (\S+)")
+_TARGETS = (
+    re.compile(r"^ALTER TABLE (?:IF EXISTS )?(?:ONLY )?(\w+)"),
+    re.compile(r"^CREATE (?:UNIQUE )?INDEX (?:CONCURRENTLY )?(?:IF NOT EXISTS )?\w+ ON (?:ONLY )?(\w+)"),
+    re.compile(r"^UPDATE (\w+)"),
+    re.compile(r"^DELETE FROM (\w+)"),
+    re.compile(r"^LOCK TABLE (\w+)"),
+    re.compile(r"^VACUUM FULL (\w+)"),
+    re.compile(r"^CLUSTER (\w+)"),
+)
+
+
+@dataclass
+class Violation:
+    revision: str
+    rule: str
+    statement: str
+
+    def __str__(self) -> str:
+        return f"{self.revision}: [{self.rule}] {self.statement[:160]}"
+
+
+def render_upgrades(config: Config) -> Dict[str, List[str]]:
+    """
+    Render every upgrade as PostgreSQL SQL.
+
+    Returns:
+        Statements keyed by revision id, in upgrade order
+    """
+    buffer = io.StringIO()
+    config.attributes["sql_buffer"] = buffer
+    config.attributes["skip_logging"] = True
+    config.cmd_opts = argparse.Namespace(x=[f"url={LINT_URL}"])
+    command.upgrade(config, "head", sql=True)
+
+    statements: Dict[str, List[str]] = {}
+    revision: Optional[str] = None
+    current: List[str] = []
+    for line in buffer.getvalue().splitlines():
+        match = _REVISION.match(line)
+        if match:
+            revision = match.group(2)
+            statements.setdefault(revision, [])
+            continue
+        if line.startswith("--") or revision is None:
+            continue
+        current.append(line)
+        if line.rstrip().endswith(";"):
+            statements[revision].append(" ".join(" ".join(current).split()).rstrip(";"))
+            current = []
+    return statements
+
+
+def _target(statement: str) -> Optional[str]:
+    for pattern in _TARGETS:
+        match = pattern.match(statement)
+        if match:
+            return match.group(1).lower()
+    return None
+
+
+def check_statement(statement: str) -> List[str]:
+    """Rules broken by one statement (assuming its table is large and populated)."""
+    sql = statement.upper()
+    rules = []
+    if sql.startswith("CREATE") and " INDEX " in sql and " CONCURRENTLY " not in sql:
+        rules.append("index-lock")
+    if sql.startswith("ALTER TABLE"):
+        if " ADD COLUMN " in sql:
+            if "GENERATED ALWAYS AS" in sql and " STORED" in sql:
+                rules.append("table-rewrite")
+            if any(func in sql for func in VOLATILE_DEFAULTS):
+                rules.append("table-rewrite")
+            if " NOT NULL" in sql and " DEFAULT " not in sql:
+                rules.append("not-null-without-default")
+        if re.search(r"ALTER COLUMN \w+ (SET DATA )?TYPE ", sql):
+            rules.append("table-rewrite")
+        if re.search(r"ALTER COLUMN \w+ SET NOT NULL", sql):
+            rules.append("set-not-null")
+        if re.search(r"\bADD (CONSTRAINT \w+ )?(FOREIGN KEY|CHECK)\b", sql) and "NOT VALID" not in sql:
+            rules.append("validating-constraint")
+        if re.search(r"\bADD (CONSTRAINT \w+ )?(PRIMARY KEY|UNIQUE)\b", sql) and "USING INDEX" not in sql:
+            rules.append("unique-constraint")
+    if (sql.startswith("UPDATE ") or sql.startswith("DELETE FROM ")) and " LIMIT " not in sql:
+        rules.append("unbatched-write")
+    if sql.startswith("LOCK TABLE"):
+        rules.append("explicit-lock")
+    if sql.startswith("VACUUM FULL") or sql.startswith("CLUSTER"):
+        rules.append("table-rewrite")
+    return rules
+
+
+def lint(config: Config, large_tables: Tuple[str, ...] = LARGE_TABLES) -> List[Violation]:
+    """
+    Lint every revision.
+
+    Returns:
+        Violations not covered by the revision's ``lint_waivers``
+    """
+    script = ScriptDirectory.from_config(config)
+    violations = []
+    for revision, statements in render_upgrades(config).items():
+        waivers = getattr(script.get_revision(revision).module, "lint_waivers", {}) or {}
+        created = {
+            match.group(1).lower() for statement in statements
+            for match in [re.match(r"^CREATE TABLE (?:IF NOT EXISTS )?(\w+)", statement, re.IGNORECASE)]
+            if match
+        }
+        for statement in statements:
+            table = _target(statement.upper())
+            if table is None or table not in large_tables or table in created:
+                continue
+            for rule in check_statement(statement):
+                if rule not in waivers:
+                    violations.append(Violation(revision, rule, statement))
+    return violations
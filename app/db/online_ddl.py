@@ -0,0 +1,187 @@
+"""
+Online DDL Helpers for Alembic Migrations
+
+Schema changes on big tables must not hold ACCESS EXCLUSIVE (or SHARE)
+locks for longer than a catalog update. These helpers wrap the
+PostgreSQL patterns that avoid it; on other databases they fall back to
+the plain operation.
+
+    - create_index_concurrently / drop_index_concurrently (per partition
+      on a partitioned table, where PostgreSQL rejects CONCURRENTLY)
+    - add_foreign_key_not_valid + validate_constraint
+    - batched_backfill: UPDATE in bounded batches with a duty-cycle throttle
+
+Use them from a revision's ``upgrade()``; ``manage.py lint-migrations``
+rejects the blocking equivalents on large tables.
+"""
+
+import time
+from typing import List, Optional
+
+from alembic import op
+from sqlalchemy import Column, Index, MetaData, Table, text
+from sqlalchemy.schema import CreateIndex
+
+
+def _dialect() -> str:
+    return op.get_context().dialect.name
+
+
+def _partitions(table: str) -> Optional[List[str]]:
+    """Partitions of ``table`` if it is a partitioned PostgreSQL table, else None."""
+    if op.get_context().as_sql:
+        return None  # Offline mode cannot read the catalog
+    connection = op.get_bind()
+    kind = connection.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"), {"table": table}
+    ).scalar()
+    if kind != "p":
+        return None
+    return list(connection.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(:table) ORDER BY c.relname"
+    ), {"table": table}).scalars())
+
+
+def _create_index_sql(name: str, table: str, columns: List[str], **kwargs) -> str:
+    """``CREATE INDEX IF NOT EXISTS`` for ``table`` as the dialect renders it (USING, WHERE...)."""
+    target = Table(table, MetaData(), *(Column(column) for column in columns))
+    index = Index(name, *(target.c[column] for column in columns), **kwargs)
+    return str(CreateIndex(index, if_not_exists=True).compile(dialect=op.get_context().dialect))
+
+
+def _create_partitioned_index(name: str, table: str, partitions: List[str], columns: List[str],
+                              **kwargs) -> None:
+    """
+    Index a partitioned table without blocking writes.
+
+    The parent index is created ``ON ONLY`` the parent (catalog only, and
+    INVALID until complete), each partition's index is built
+    CONCURRENTLY, then attached; the parent turns valid once every
+    partition has one. Partitions created later get the index
+    automatically. Each step is skipped on a rerun if already done.
+    """
+    op.execute(_create_index_sql(name, table, columns, **kwargs).replace(
+        f" ON {table} ", f" ON ONLY {table} ", 1
+    ))
+    connection = op.get_bind()
+    for partition in partitions:
+        child = f"{partition}_{name}"[:63]
+        with op.get_context().autocommit_block():
+            op.execute(_create_index_sql(child, partition, columns, **kwargs).replace(
+                "CREATE INDEX ", "CREATE INDEX CONCURRENTLY ", 1
+            ))
+        attached = connection.execute(text(
+            "SELECT 1 FROM pg_inherits WHERE inhrelid = to_regclass(:child) AND inhparent = to_regclass(:name)"
+        ), {"child": child, "name": name}).scalar()
+        if not attached:
+            op.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+
+
+def create_index_concurrently(name: str, table: str, columns: List[str], **kwargs) -> None:
+    """
+    Build an index without blocking writes.
+
+    PostgreSQL cannot run CONCURRENTLY inside a transaction, so the
+    statement runs in an autocommit block. ``if_not_exists`` makes a
+    rerun after an interrupted build pick up where it left off (drop an
+    INVALID leftover index first). A partitioned table gets one index per
+    partition instead (see ``_create_partitioned_index``).
+    """
+    if _dialect() != "postgresql":
+        op.create_index(name, table, columns, if_not_exists=True, **kwargs)
+        return
+    partitions = _partitions(table)
+    if partitions is not None:
+        _create_partitioned_index(name, table, partitions, columns, **kwargs)
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True, **kwargs)
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    """
+    Drop an index without blocking reads or writes on ``table``.
+
+    An index of a partitioned table cannot be dropped CONCURRENTLY; it is
+    dropped with its partitions' indexes in one plain DROP, a catalog
+    update that briefly takes ACCESS EXCLUSIVE on the table.
+    """
+    if _dialect() != "postgresql":
+        op.drop_index(name, table_name=table, if_exists=True)
+        return
+    if _partitions(table) is not None:
+        op.drop_index(name, table_name=table, if_exists=True)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def add_foreign_key_not_valid(name: str, source: str, referent: str, local_cols: List[str],
+                              remote_cols: List[str], ondelete: Optional[str] = None) -> None:
+    """
+    Add a foreign key without scanning the table under lock.
+
+    New rows are checked immediately; existing rows are checked later by
+    ``validate_constraint``, which only takes a SHARE UPDATE EXCLUSIVE lock.
+    SQLite cannot add constraints to an existing table, so this is a no-op
+    there (its foreign keys are not enforced by default either).
+    """
+    if _dialect() != "postgresql":
+        return
+    action = f" ON DELETE {ondelete}" if ondelete else ""
+    op.execute(
+        f"ALTER TABLE {source} ADD CONSTRAINT {name} FOREIGN KEY ({', '.join(local_cols)}) "
+        f"REFERENCES {referent} ({', '.join(remote_cols)}){action} NOT VALID"
+    )
+
+
+def validate_constraint(name: str, table: str) -> None:
+    """Check existing rows against a NOT VALID constraint (PostgreSQL only)."""
+    if _dialect() != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def batched_backfill(table: str, assignments: str, where: str, batch_size: int = 5_000,
+                     duty_cycle: float = 0.5, key: str = "id") -> int:
+    """
+    Backfill rows in short transactions that throttle themselves.
+
+    Runs ``UPDATE table SET assignments WHERE key IN (SELECT key ... WHERE
+    where LIMIT batch_size)`` until a batch comes back short. After each
+    batch it sleeps so the backfill uses at most ``duty_cycle`` of wall
+    time, leaving room for foreground traffic, replication and vacuum.
+
+    Args:
+        table: Table to update
+        assignments: SQL for the SET clause
+        where: SQL selecting rows still to do; must stop matching once updated
+        batch_size: Rows per transaction
+        duty_cycle: Fraction of time spent updating (0 < duty_cycle <= 1)
+        key: Indexed unique column used to pick each batch
+
+    Returns:
+        Rows updated (0 in offline ``--sql`` mode, which emits one batch)
+    """
+    statement = (
+        f"UPDATE {table} SET {assignments} WHERE {key} IN "
+        f"(SELECT {key} FROM {table} WHERE {where} LIMIT {batch_size})"
+    )
+    context = op.get_context()
+    if context.as_sql:
+        op.execute(f"-- repeat until no rows are updated\n{statement}")
+        return 0
+
+    updated = 0
+    with context.autocommit_block():
+        connection = op.get_bind()
+        while True:
+            started = time.monotonic()
+            rowcount = connection.execute(text(statement)).rowcount
+            updated += rowcount
+            if rowcount < batch_size:
+                return updated
+            elapsed = time.monotonic() - started
+            time.sleep(elapsed * (1 - duty_cycle) / duty_cycle)
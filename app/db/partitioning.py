@@ -0,0 +1,107 @@
+"""
+Task Table Partitioning (PostgreSQL)
+
+Converts ``tasks`` into a table hash-partitioned by ``board_id``. Each
+partition has its own heap and indexes, so vacuum and index maintenance
+on a hot board only touch one slice of the data.
+
+The ORM mapping does not change: ``id`` stays the mapper's identity and
+is still unique (it comes from the same sequence), but the table's
+primary key becomes ``(id, board_id)`` because PostgreSQL requires the
+partition key in every unique constraint. Task queries in the services
+filter on ``board_id`` (``= ?``, or ``IN (...)`` the user's boards), lookups
+by id included, so the planner prunes to the partitions of the boards
+involved. The reminder scheduler is the exception: its claim reads the
+(small) pending-reminder index of every partition, and firing or
+releasing claimed reminders looks them up by id in every partition.
+
+The conversion rewrites the table in one transaction and holds an
+exclusive lock on ``tasks`` while it runs; schedule it as maintenance.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.models.task import Task
+
+# Column list for the copy; search_vector is generated and must not be inserted
+_COPY_COLUMNS = ", ".join(column.name for column in Task.__table__.columns)
+
+
+def is_partitioned(connection: Connection) -> bool:
+    """Whether ``tasks`` is already a partitioned table."""
+    if connection.dialect.name != "postgresql":
+        return False
+    kind = connection.execute(text(
+        "SELECT relkind FROM pg_class WHERE oid = to_regclass('tasks')"
+    )).scalar()
+    return kind == "p"
+
+
+def partition_tasks(connection: Connection, partitions: int) -> None:
+    """
+    Rebuild ``tasks`` as ``PARTITION BY HASH (board_id)`` with ``partitions`` slices.
+
+    Existing rows, the id sequence, foreign keys, indexes and the full-text
+    search column are carried over. Run inside a transaction
+    (``engine.begin()``); a failure leaves the original table untouched.
+
+    Raises:
+        ValueError: If the database is not PostgreSQL, ``partitions`` < 2,
+            or the table is already partitioned
+    """
+    if connection.dialect.name != "postgresql":
+        raise ValueError("Task partitioning requires PostgreSQL")
+    if partitions < 2:
+        raise ValueError("Use at least 2 partitions")
+    if is_partitioned(connection):
+        raise ValueError("tasks is already partitioned")
+
+    # Move the old table and its index names out of the way
+    connection.execute(text("ALTER TABLE tasks RENAME TO tasks_unpartitioned"))
+    connection.execute(text("ALTER INDEX tasks_pkey RENAME TO tasks_pkey_old"))
+    for index in Task.__table__.indexes:
+        connection.execute(text(f"ALTER INDEX IF EXISTS {index.name} RENAME TO {index.name}_old"))
+    connection.execute(text("ALTER INDEX IF EXISTS ix_tasks_search_vector RENAME TO ix_tasks_search_vector_old"))
+
+    connection.execute(text(
+        "CREATE TABLE tasks (LIKE tasks_unpartitioned INCLUDING DEFAULTS INCLUDING GENERATED) "
+        "PARTITION BY HASH (board_id)"
+    ))
+    for remainder in range(partitions):
+        connection.execute(text(
+            f"CREATE TABLE tasks_p{remainder} PARTITION OF tasks "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        ))
+
+    connection.execute(text("ALTER TABLE tasks ALTER COLUMN board_id SET NOT NULL"))
+    connection.execute(text("ALTER TABLE tasks ADD CONSTRAINT tasks_pkey PRIMARY KEY (id, board_id)"))
+    connection.execute(text(
+        "ALTER TABLE tasks ADD CONSTRAINT tasks_lane_id_fkey "
+        "FOREIGN KEY (lane_id) REFERENCES lanes (id) ON DELETE CASCADE"
+    ))
+    connection.execute(text(
+        "ALTER TABLE tasks ADD CONSTRAINT tasks_board_id_fkey "
+        "FOREIGN KEY (board_id) REFERENCES boards (id) ON DELETE CASCADE"
+    ))
+    connection.execute(text(
+        "ALTER TABLE tasks ADD CONSTRAINT tasks_owner_id_fkey "
+        "FOREIGN KEY (owner_id) REFERENCES users (id)"
+    ))
+
+    connection.execute(text(
+        f"INSERT INTO tasks ({_COPY_COLUMNS}) SELECT {_COPY_COLUMNS} FROM tasks_unpartitioned"
+    ))
+
+    # The sequence belongs to the old column; re-home it before the drop
+    connection.execute(text("ALTER SEQUENCE tasks_id_seq OWNED BY tasks.id"))
+    connection.execute(text("DROP TABLE tasks_unpartitioned"))
+
+    # Indexes on the parent cascade to every partition
+    for index in Task.__table__.indexes:
+        index.create(connection)
+    connection.execute(text(
+        "CREATE INDEX ix_tasks_search_vector ON tasks USING GIN (search_vector)"
+    ))
+    connection.execute(text("ANALYZE tasks"))
+
@@ -7,20 +7,49 @@ Features:
 - PostgreSQL database with SQLAlchemy ORM
 - Redis caching for optimized performance
 - RESTful API design with versioning
+
+Importing this module has no side effects on external services: the
+schema is managed with ``python manage.py migrate``, and the
+database pool, Redis client and mail config are created on first use.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from app.core.config import settings
-from app.db.connection import Base, engine
+from app.core.breaker import breaker_stats
+from app.core.cache import AsyncCacheClient, CacheClient
+from app.core.near_cache import near_cache
+from app.db.connection import engine
+from app.services.audit_service import audit_log
 from app.api.v1 import tasks_router, users_router, auth_router, boards_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan.
+
+    Nothing is connected eagerly, so workers boot even while Postgres or
+    Redis are still starting; the database and Redis pools open on first
+    use. On shutdown the activity log buffer is flushed, then every pool
+    (database, sync and asyncio Redis) is closed.
+    """
+    yield
+    audit_log.close()
+    await AsyncCacheClient.close()
+    CacheClient.close()
+    engine.dispose()
+
+
 # Initialize FastAPI application
 app = FastAPI(
     title=settings.app_name,
     description="A professional task management API",
     version=settings.api_version,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Include routers with API versioning
@@ -29,9 +58,6 @@ app.include_router(users_router, prefix="/users", tags=["Users"])
 app.include_router(boards_router, prefix="/boards", tags=["Boards"])
 app.include_router(tasks_router, prefix="/tasks", tags=["Tasks"])
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 
 # ========================
 # Health Check Endpoints
@@ -48,19 +74,24 @@ async def health_check():
     return {"status": "healthy", "app_name": settings.app_name}
 
 
-# ========================
-# Startup Events
-# ========================
+@app.get("/health/cache", tags=["Health"])
+async def cache_metrics():
+    """
+    Near-cache metrics of this worker.
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize resources on application startup."""
-    # You can add database connection checks, cache warming, etc.
-    pass
+    Returns:
+        Hits, misses, hit ratio, evictions, size and limit per namespace
+    """
+    return near_cache.stats()
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up resources on application shutdown."""
-    from app.core.cache import CacheClient
-    CacheClient.close()
+@app.get("/health/breakers", tags=["Health"])
+async def breaker_metrics():
+    """
+    Circuit breakers of this worker (Redis, SMTP).
+
+    Returns:
+        State, rolling failure and slow-call rates, and lifetime counters per dependency
+    """
+    return breaker_stats()
+
@@ -0,0 +1,27 @@
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, JSON, Index, text
+from app.db.connection import Base
+
+
+class ActivityEvent(Base):
+    """
+    Append-only audit log of board, lane and card changes.
+
+    Rows are never updated. There are no foreign keys: history outlives
+    the boards and cards it describes, and inserts stay cheap.
+    """
+    __tablename__ = "activity_events"
+    __table_args__ = (
+        # Keyset pages per board / per card, newest first
+        Index("ix_activity_board_occurred", "board_id", "occurred_at", "id"),
+        Index("ix_activity_task_occurred", "task_id", "occurred_at", "id",
+              postgresql_where=text("task_id IS NOT NULL"), sqlite_where=text("task_id IS NOT NULL")),
+    )
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    occurred_at = Column(DateTime, nullable=False)  # Set by the writer, not at flush time
+    action = Column(String, nullable=False)  # e.g. task.moved, lane.deleted, board.member_added
+    actor_id = Column(Integer, nullable=True)
+    board_id = Column(Integer, nullable=False)
+    lane_id = Column(Integer, nullable=True)
+    task_id = Column(Integer, nullable=True)
+    data = Column(JSON, nullable=True)
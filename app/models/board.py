@@ -1,34 +1,118 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, DateTime, Index, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.connection import Base
 
 class Board(Base):
     __tablename__ = "boards"
+    # Lets the purge job find soft-deleted boards without scanning live ones
+    __table_args__ = (
+        Index("ix_boards_deleted", "deleted_at",
+              postgresql_where=text("deleted_at IS NOT NULL"), sqlite_where=text("deleted_at IS NOT NULL")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     description = Column(String, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
+    # Soft delete: set on DELETE, rows are removed later by the purge job
+    deleted_at = Column(DateTime, nullable=True)
+    # Tasks untouched for this many days move to tasks_archive (None = never)
+    archive_after_days = Column(Integer, nullable=True)
     
-    # Ownership
-    owner_id = Column(Integer, ForeignKey("users.id"))
+    # Ownership (indexed: access lookups and digest chunks go by owner)
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
     owner = relationship("User", back_populates="boards")
     
-    # Relationships
-    lanes = relationship("Lane", back_populates="board", cascade="all, delete-orphan")
+    # Relationships (children are removed by ON DELETE CASCADE / the purge job,
+    # never loaded just to be deleted). Soft-deleted lanes are hidden.
+    lanes = relationship(
+        "Lane",
+        primaryjoin="and_(Board.id == Lane.board_id, Lane.deleted_at.is_(None))",
+        back_populates="board",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+    members = relationship("BoardMember", back_populates="board", cascade="all, delete-orphan", passive_deletes=True)
+    labels = relationship("Label", back_populates="board", order_by="Label.id",
+                          cascade="all, delete-orphan", passive_deletes=True)
 
 
 class Lane(Base):
     """Represents a column/list in Trello (e.g. Todo, Done)"""
     __tablename__ = "lanes"
+    __table_args__ = (
+        Index("ix_lanes_deleted", "deleted_at",
+              postgresql_where=text("deleted_at IS NOT NULL"), sqlite_where=text("deleted_at IS NOT NULL")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String)
     position = Column(Integer, default=0) # To order columns (0, 1, 2...)
+    deleted_at = Column(DateTime, nullable=True)
+    archive_after_days = Column(Integer, nullable=True) # Overrides the board policy
+    version = Column(Integer, nullable=False, default=1, server_default="1") # Bumped by every write
     
-    board_id = Column(Integer, ForeignKey("boards.id"))
+    board_id = Column(Integer, ForeignKey("boards.id", ondelete="CASCADE"), index=True)
     board = relationship("Board", back_populates="lanes")
     
     # Relationships
-    tasks = relationship("Task", back_populates="lane", cascade="all, delete-orphan")
+    tasks = relationship("Task", back_populates="lane", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class BoardMember(Base):
+    """Grants a user a role on a board they do not own (team boards)."""
+    __tablename__ = "board_members"
+    __table_args__ = (UniqueConstraint("board_id", "user_id", name="uq_board_members_board_user"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    role = Column(String, default="viewer") # 'viewer', 'editor'
+    created_at = Column(DateTime, server_default=func.now())
+
+    board_id = Column(Integer, ForeignKey("boards.id", ondelete="CASCADE"), index=True)
+    board = relationship("Board", back_populates="members")
+
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    user = relationship("User")
+
+
+class Label(Base):
+    """
+    A board's card label. Cards carry the ids of their labels in
+    ``tasks.label_ids``; ids are global, so a label filter never matches
+    cards of another board.
+    """
+    __tablename__ = "labels"
+    __table_args__ = (UniqueConstraint("board_id", "name", name="uq_labels_board_name"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    color = Column(String, nullable=True)  # e.g. "#61bd4f"
+    created_at = Column(DateTime, server_default=func.now())
+
+    board_id = Column(Integer, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    board = relationship("Board", back_populates="labels")
+
+
+class BoardTaskCount(Base):
+    """
+    Live card count per (board, lane, priority), maintained by TaskService in
+    the same transaction as the card write. Board stats read these rows
+    (O(lanes x priorities)) instead of counting tasks.
+    """
+    __tablename__ = "board_task_counts"
+
+    board_id = Column(Integer, ForeignKey("boards.id", ondelete="CASCADE"), primary_key=True)
+    lane_id = Column(Integer, ForeignKey("lanes.id", ondelete="CASCADE"), primary_key=True)
+    priority = Column(Integer, primary_key=True)  # 0 stands for no priority
+    count = Column(Integer, nullable=False, default=0)
+
+
+class BoardFlowSnapshot(Base):
+    """Cards per lane at the end of a day: the cumulative-flow history."""
+    __tablename__ = "board_flow_snapshots"
+
+    board_id = Column(Integer, ForeignKey("boards.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    lane_id = Column(Integer, ForeignKey("lanes.id", ondelete="CASCADE"), primary_key=True)
+    count = Column(Integer, nullable=False)
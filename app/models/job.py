@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, text
+from sqlalchemy.sql import func
+from app.db.connection import Base
+
+# Job lifecycle: queued -> running -> done, or back to queued with a
+# backoff until max_attempts, then dead (the dead-letter queue)
+JOB_STATUSES = ("queued", "running", "done", "dead")
+
+
+class Job(Base):
+    """Deferred work run by `manage.py worker` instead of the web process."""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Claim query: next runnable jobs, oldest first; only queued rows are indexed
+        Index("ix_jobs_queued_run_at", "run_at", "id",
+              postgresql_where=text("status = 'queued'"), sqlite_where=text("status = 'queued'")),
+        # Lease recovery: jobs whose worker died mid-run
+        Index("ix_jobs_running_locked_at", "locked_at",
+              postgresql_where=text("status = 'running'"), sqlite_where=text("status = 'running'")),
+    )
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String, nullable=False, default="queued", server_default="queued")
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime, nullable=False)
+    locked_at = Column(DateTime, nullable=True)
+    locked_by = Column(String, nullable=True)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    finished_at = Column(DateTime, nullable=True)
@@ -1,10 +1,35 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Index, JSON, DDL, event, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.connection import Base
 
+# Label ids of a card: integer[] on PostgreSQL (GIN-indexed for @>),
+# a JSON array elsewhere (SQLite filters with json_each, unindexed)
+LabelIds = JSON().with_variant(ARRAY(Integer), "postgresql")
+
+# Materialized subtask paths are compared bytewise (C collation on
+# PostgreSQL, SQLite's default BINARY), so a subtree is one index range
+SubtaskPath = String().with_variant(String(collation="C"), "postgresql")
+
 class Task(Base):
     __tablename__ = "tasks"
+    # Composite indexes backing the listing API (see app/services/task_query.py).
+    # Layout is (equality column, order column, id) so filter, sort and the
+    # keyset cursor are all served from one index range scan.
+    __table_args__ = (
+        Index("ix_tasks_lane_position", "lane_id", "position", "id"),
+        Index("ix_tasks_board_updated", "board_id", "updated_at", "id"),
+        Index("ix_tasks_board_priority", "board_id", "priority", "id"),
+        Index("ix_tasks_board_created", "board_id", "created_at", "id"),
+        Index("ix_tasks_board_owner_updated", "board_id", "owner_id", "updated_at", "id"),
+        # Pending reminders only: the scheduler's claim is a range scan over
+        # this small index, however many cards (or past due dates) there are.
+        Index("ix_tasks_remind_pending", "remind_at", "id",
+              postgresql_where=text("remind_at IS NOT NULL"), sqlite_where=text("remind_at IS NOT NULL")),
+        # "Cards with labels A and B": label_ids @> ARRAY[A, B]
+        Index("ix_tasks_label_ids", "label_ids", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -16,12 +41,145 @@ class Task(Base):
     
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # Optimistic concurrency: bumped by every write, checked against If-Match
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    due_at = Column(DateTime, nullable=True)
+    # When the due reminder is next looked at: due_at while pending, the
+    # claim's lease expiry while a scheduler holds it, NULL once sent (or
+    # with no future due date). See app/services/reminder_service.py.
+    remind_at = Column(DateTime, nullable=True)
+
+    # Sorted ids of the board's labels on this card (see Label)
+    label_ids = Column(LabelIds, nullable=True, default=list)
 
     # Task belongs to a specific Lane (List)
-    lane_id = Column(Integer, ForeignKey("lanes.id"), nullable=True)
+    lane_id = Column(Integer, ForeignKey("lanes.id", ondelete="CASCADE"), nullable=True)
     lane = relationship("Lane", back_populates="tasks")
 
+    # Denormalized from lane.board_id so ownership checks need no join.
+    # Kept in sync whenever the task changes lane. Indexed through the
+    # composite board_* indexes above.
+    board_id = Column(Integer, ForeignKey("boards.id", ondelete="CASCADE"), nullable=True)
+
     # Access to Board directly (optional but useful)
     # owner_id is kept for tracking who created it, or who is assigned
     owner_id = Column(Integer, ForeignKey("users.id"))
-    owner = relationship("User", back_populates="tasks")
\ No newline at end of file
+    owner = relationship("User", back_populates="tasks")
+
+
+# --- Full-text search ---
+# The search index lives outside the ORM mapping so the model stays portable:
+#   PostgreSQL: generated, weighted tsvector column with a GIN index
+#   SQLite:     external-content FTS5 table kept in sync by triggers
+
+TASK_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+event.listen(Task.__table__, "after_create", DDL(
+    f"ALTER TABLE tasks ADD COLUMN search_vector tsvector "
+    f"GENERATED ALWAYS AS ({TASK_SEARCH_VECTOR}) STORED"
+).execute_if(dialect="postgresql"))
+event.listen(Task.__table__, "after_create", DDL(
+    "CREATE INDEX ix_tasks_search_vector ON tasks USING GIN (search_vector)"
+).execute_if(dialect="postgresql"))
+
+for _statement in (
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id')",
+    "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+):
+    event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(Task.__table__, "before_drop", DDL(
+    "DROP TABLE IF EXISTS tasks_fts"
+).execute_if(dialect="sqlite"))
+
+
+class Subtask(Base):
+    """
+    Checklist item of a card; items nest under other items of the same card.
+
+    The tree is a materialized path: ``path`` lists the ids of the item's
+    ancestors, root first, each followed by ``/`` (``""`` at the top
+    level, ``"12/34/"`` under item 34 under item 12). The subtree of item
+    ``x`` is ``x`` plus the rows whose path starts with ``x.path + "x/"``,
+    one range of ``ix_subtasks_task_path``; see app/services/subtask_service.py.
+
+    ``task_id`` has no foreign key (``tasks`` may be partitioned, with a
+    composite primary key; see app/db/partitioning.py): every statement
+    that deletes cards removes their items in the same transaction.
+    """
+    __tablename__ = "subtasks"
+    __table_args__ = (
+        Index("ix_subtasks_task_path", "task_id", "path"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    task_id = Column(Integer, nullable=False)
+    path = Column(SubtaskPath, nullable=False, default="")
+    title = Column(String, nullable=False)
+    done = Column(Boolean, nullable=False, default=False)
+    position = Column(Integer, default=0)  # Order among siblings
+
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    @property
+    def parent_id(self):
+        """Id of the enclosing item, None at the top level."""
+        return int(self.path.rsplit("/", 2)[-2]) if self.path else None
+
+    @property
+    def depth(self) -> int:
+        """Ancestors of the item (0 at the top level)."""
+        return self.path.count("/")
+
+
+class ArchivedTask(Base):
+    """
+    Cold-storage copy of a task moved out of ``tasks`` by the archive job.
+
+    Same columns as Task plus ``archived_at``. There are no foreign keys:
+    rows outlive lane renames and moves, and are removed with their board
+    by the purge job. On PostgreSQL the table is range-partitioned by
+    month of ``archived_at`` (see ArchiveService.ensure_partitions).
+    """
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        Index("ix_tasks_archive_board_archived", "board_id", "archived_at", "id"),
+        Index("ix_tasks_archive_lane", "lane_id"),
+        {"postgresql_partition_by": "RANGE (archived_at)"},
+    )
+
+    # Partitioned tables need the partition key in the primary key
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    archived_at = Column(DateTime, primary_key=True, server_default=func.now())
+
+    title = Column(String)
+    description = Column(String, nullable=True)
+    position = Column(Integer, default=0)
+    priority = Column(Integer, default=1)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    lane_id = Column(Integer, nullable=True)
+    board_id = Column(Integer, nullable=True)
+    owner_id = Column(Integer)
+    due_at = Column(DateTime, nullable=True)
+    label_ids = Column(LabelIds, nullable=True)
+
+
+# Archive search is on demand, so PostgreSQL gets an expression GIN index
+# (no stored vector); SQLite falls back to LIKE over the board's rows.
+event.listen(ArchivedTask.__table__, "after_create", DDL(
+    f"CREATE INDEX ix_tasks_archive_search ON tasks_archive USING GIN (({TASK_SEARCH_VECTOR}))"
+).execute_if(dialect="postgresql"))
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class ActivityEventResponse(BaseModel):
+    id: int
+    occurred_at: datetime
+    action: str  # e.g. task.moved, lane.deleted, board.member_set
+    actor_id: Optional[int] = None
+    board_id: int
+    lane_id: Optional[int] = None
+    task_id: Optional[int] = None
+    data: Optional[Dict[str, Any]] = None
+
+    class Config:
+        from_attributes = True
+
+class ActivityPage(BaseModel):
+    items: List[ActivityEventResponse]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
@@ -1,12 +1,13 @@
-from typing import List, Optional
-from datetime import datetime
-from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+from datetime import date, datetime
+from pydantic import BaseModel, Field
 from app.schemas.task import TaskResponse
 
 # --- Lane Schemas ---
 class LaneBase(BaseModel):
     title: str
     position: int = 0
+    archive_after_days: Optional[int] = Field(None, ge=1)  # None = use the board policy
 
 class LaneCreate(LaneBase):
     pass
@@ -14,19 +15,38 @@ class LaneCreate(LaneBase):
 class LaneUpdate(BaseModel):
     title: Optional[str] = None
     position: Optional[int] = None
+    archive_after_days: Optional[int] = Field(None, ge=1)
 
 class LaneResponse(LaneBase):
     id: int
     board_id: int
+    version: int = 1
     tasks: List[TaskResponse] = [] # Nested tasks
 
     class Config:
         from_attributes = True
 
+# --- Label Schemas ---
+class LabelCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=50)
+    color: Optional[str] = Field(None, max_length=20)
+
+class LabelUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=50)
+    color: Optional[str] = Field(None, max_length=20)
+
+class LabelResponse(LabelCreate):
+    id: int
+    board_id: int
+
+    class Config:
+        from_attributes = True
+
 # --- Board Schemas ---
 class BoardBase(BaseModel):
     title: str
     description: Optional[str] = None
+    archive_after_days: Optional[int] = Field(None, ge=1)  # None = never archive
 
 class BoardCreate(BoardBase):
     pass
@@ -36,6 +56,41 @@ class BoardResponse(BoardBase):
     owner_id: int
     created_at: datetime
     lanes: List[LaneResponse] = [] # Nested lanes with tasks
+    labels: List[LabelResponse] = [] # Cards refer to these by id (label_ids)
 
     class Config:
         from_attributes = True
+
+class ArchivePolicyUpdate(BaseModel):
+    archive_after_days: Optional[int] = Field(None, ge=1)  # None disables archiving
+
+# --- Membership Schemas ---
+class BoardMemberCreate(BaseModel):
+    user_id: int
+    role: Literal["viewer", "editor"] = "editor"
+
+class BoardMemberResponse(BoardMemberCreate):
+    id: int
+    board_id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+# --- Stats Schemas ---
+class LaneStats(BaseModel):
+    lane_id: int
+    title: Optional[str] = None
+    position: Optional[int] = None
+    count: int
+
+class FlowPoint(BaseModel):
+    day: date
+    counts: Dict[int, int]  # lane_id -> cards at the end of the day (empty lanes omitted)
+
+class BoardStatsResponse(BaseModel):
+    board_id: int
+    total: int
+    lanes: List[LaneStats]
+    priorities: Dict[int, int]  # priority (0 = none) -> cards
+    flow: List[FlowPoint]  # cumulative flow, oldest day first
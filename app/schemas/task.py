@@ -1,6 +1,23 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
+
+
+def _local_time(value: Optional[datetime]) -> Optional[datetime]:
+    # Timestamps are stored naive in server local time (like created_at)
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+
+def _label_set(value: Optional[List[int]]) -> Optional[List[int]]:
+    # Stored sorted and distinct, so equal label sets compare equal
+    return sorted(set(value)) if value is not None else value
+
+
+def _no_labels(value: Optional[List[int]]) -> List[int]:
+    # Cards created before labels existed have NULL
+    return value or []
 
 
 class TaskCreate(BaseModel):
@@ -9,6 +26,50 @@ class TaskCreate(BaseModel):
     priority: int = 1
     lane_id: int  # Task must belong to a lane
     position: int = 0  # Default to top/bottom
+    due_at: Optional[datetime] = None  # A reminder is emailed to the owner when it passes
+    label_ids: List[int] = Field(default=[], max_length=20)  # Labels of the lane's board
+
+    _due_at_local = field_validator("due_at")(_local_time)
+    _label_ids_set = field_validator("label_ids")(_label_set)
+
+class SubtaskCreate(BaseModel):
+    title: str = Field(min_length=1, max_length=200)
+    parent_id: Optional[int] = None  # Item of the same card to nest under; None for the top level
+    position: int = 0  # Order among siblings
+    done: bool = False
+
+class SubtaskUpdate(BaseModel):
+    title: Optional[str] = Field(None, min_length=1, max_length=200)
+    done: Optional[bool] = None
+    position: Optional[int] = None
+
+class SubtaskMove(BaseModel):
+    task_id: Optional[int] = None  # Card to move to (default: the new parent's card, else the item's own)
+    parent_id: Optional[int] = None  # New enclosing item; None for the top level
+    position: int = 0
+
+class SubtaskProgress(BaseModel):
+    done: int = 0
+    total: int = 0
+
+class SubtaskResponse(BaseModel):
+    id: int
+    task_id: int
+    parent_id: Optional[int] = None
+    title: str
+    done: bool
+    position: int
+
+    class Config:
+        from_attributes = True
+
+class SubtaskNode(SubtaskResponse):
+    progress: SubtaskProgress  # Items nested below this one
+    children: List["SubtaskNode"] = []
+
+class SubtaskTree(BaseModel):
+    items: List[SubtaskNode]  # Top-level items, in order
+    progress: SubtaskProgress  # Every item of the card
 
 class TaskResponse(BaseModel):
     id: int
@@ -19,7 +80,16 @@ class TaskResponse(BaseModel):
     owner_id: int
     
     lane_id: Optional[int] = None
+    board_id: Optional[int] = None
     position: int
+    due_at: Optional[datetime] = None
+    label_ids: List[int] = []
+    version: int = 1  # Send back as If-Match to detect concurrent edits
+    # Only with ?expand=subtasks
+    subtasks: Optional[List[SubtaskNode]] = None
+    progress: Optional[SubtaskProgress] = None
+
+    _label_ids_list = field_validator("label_ids", mode="before")(_no_labels)
 
     class Config:
         from_attributes = True
@@ -29,4 +99,27 @@ class TaskUpdate(BaseModel):
     description: Optional[str] = None
     priority: Optional[int] = None
     lane_id: Optional[int] = None  # For moving to another column
-    position: Optional[int] = None  # For reordering
\ No newline at end of file
+    position: Optional[int] = None  # For reordering
+    due_at: Optional[datetime] = None  # null clears the due date
+    label_ids: Optional[List[int]] = Field(None, max_length=20)  # Replaces the card's labels
+
+    _due_at_local = field_validator("due_at")(_local_time)
+    _label_ids_set = field_validator("label_ids")(_label_set)
+
+class TaskPage(BaseModel):
+    items: List[TaskResponse]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
+
+class TaskSearchHit(TaskResponse):
+    rank: float  # Relevance, higher is better
+
+class ArchivedTaskResponse(TaskResponse):
+    archived_at: datetime
+
+class ArchivedTaskPage(BaseModel):
+    items: List[ArchivedTaskResponse]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
+
+class TaskSearchPage(BaseModel):
+    items: List[TaskSearchHit]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
@@ -0,0 +1,175 @@
+"""
+Archive Service - Moves stale tasks from ``tasks`` into ``tasks_archive``.
+
+Boards and lanes carry an ``archive_after_days`` policy (a lane's value
+overrides its board's). Tasks whose ``updated_at`` is older than the
+policy are copied into the archive and deleted from ``tasks`` in the same
+transaction, ``batch_size`` rows at a time, so board snapshots only carry
+live cards. Archived tasks stay searchable through
+``SearchService.search_archive``.
+
+Run it with ``python manage.py archive`` (once, or ``--loop`` as a worker),
+or queue a run for the job worker with ``archive --enqueue``.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import DateTime, delete, func, insert, literal, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.connection import SessionLocal
+from app.models.board import Board, Lane
+from app.models.task import Task, ArchivedTask, Subtask
+from app.services.snapshot_service import BoardSnapshot
+from app.services.stats_service import StatsService, count_key
+
+# Columns copied verbatim from tasks to tasks_archive
+ARCHIVED_COLUMNS = (
+    "id", "title", "description", "position", "priority",
+    "created_at", "updated_at", "lane_id", "board_id", "owner_id", "due_at",
+    "label_ids",
+)
+
+
+def _month_start(moment: datetime) -> datetime:
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(moment: datetime) -> datetime:
+    return _month_start(_month_start(moment) + timedelta(days=32))
+
+
+class ArchiveService:
+    """Service class for the archive job."""
+
+    def __init__(self, db: Session, batch_size: Optional[int] = None):
+        """
+        Args:
+            db: SQLAlchemy database session
+            batch_size: Tasks moved per transaction (defaults to ARCHIVE_BATCH_SIZE)
+        """
+        self.db = db
+        self.batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+        self.stats = StatsService(db)
+
+    def policies(self) -> List[Tuple[int, int, int]]:
+        """
+        Effective policy of every live lane that has one.
+
+        Returns:
+            List of (board_id, lane_id, days)
+        """
+        days = func.coalesce(Lane.archive_after_days, Board.archive_after_days)
+        stmt = (
+            select(Board.id, Lane.id, days)
+            .join(Lane, Lane.board_id == Board.id)
+            .where(Board.deleted_at.is_(None), Lane.deleted_at.is_(None), days.is_not(None))
+        )
+        return [tuple(row) for row in self.db.execute(stmt)]
+
+    def ensure_partitions(self, now: Optional[datetime] = None) -> None:
+        """
+        Create the monthly archive partitions for this month and the next.
+
+        PostgreSQL only; a no-op elsewhere. Called before each run so an
+        insert never lands on a missing partition around a month boundary.
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        start = _month_start(now or datetime.now())
+        for lower in (start, _next_month(start)):
+            upper = _next_month(lower)
+            self.db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS tasks_archive_y{lower:%Y}m{lower:%m} "
+                f"PARTITION OF tasks_archive "
+                f"FOR VALUES FROM ('{lower:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+            ))
+        self.db.commit()
+
+    def archive_lane(self, board_id: int, lane_id: int, cutoff: datetime, archived_at: datetime) -> int:
+        """
+        Move a lane's tasks last updated before ``cutoff`` into the archive.
+
+        Each batch selects at most ``batch_size`` ids (served by
+        ix_tasks_board_updated), copies them with INSERT ... SELECT,
+        deletes them and their subtasks, decrements the lane's counters,
+        then commits. The ids are locked with ``FOR UPDATE SKIP LOCKED``:
+        a card being edited is left for the next run, and one edited
+        after the select waits for the batch to commit (then finds it
+        gone) instead of being archived with its older copy.
+
+        Args:
+            archived_at: Stamp for the archived rows (picks the partition)
+
+        Returns:
+            Number of tasks archived
+        """
+        columns = [getattr(Task, name) for name in ARCHIVED_COLUMNS]
+        columns.append(literal(archived_at, DateTime))
+        moved = 0
+        while True:
+            ids = self.db.execute(
+                select(Task.id)
+                .where(Task.board_id == board_id, Task.updated_at < cutoff, Task.lane_id == lane_id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            ).scalars().all()
+            if not ids:
+                return moved
+
+            self.db.execute(
+                insert(ArchivedTask).from_select(
+                    [*ARCHIVED_COLUMNS, "archived_at"],
+                    select(*columns).where(Task.board_id == board_id, Task.id.in_(ids))
+                )
+            )
+            # Checklists are not archived
+            self.db.execute(
+                delete(Subtask).where(Subtask.task_id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            priorities = self.db.execute(
+                delete(Task).where(Task.board_id == board_id, Task.id.in_(ids))
+                .returning(Task.priority)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            deltas = {}
+            for priority in priorities:
+                key = count_key(board_id, lane_id, priority)
+                deltas[key] = deltas.get(key, 0) - 1
+            self.stats.apply(deltas)
+            self.db.commit()
+            BoardSnapshot.invalidate([board_id])
+            moved += len(ids)
+            if len(ids) < self.batch_size:
+                return moved
+
+    def run(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Apply every archive policy once.
+
+        Returns:
+            Counts of lanes visited and tasks archived
+        """
+        now = now or datetime.now()
+        self.ensure_partitions(now)
+
+        archived = 0
+        policies = self.policies()
+        for board_id, lane_id, days in policies:
+            archived += self.archive_lane(board_id, lane_id, now - timedelta(days=days), now)
+        return {"lanes": len(policies), "tasks": archived}
+
+
+def run_archive() -> Dict[str, int]:
+    """Job entry point (``archive``); opens its own session."""
+    db = SessionLocal()
+    try:
+        return ArchiveService(db).run()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,203 @@
+"""
+Audit Service - Activity log with buffered, batched writes.
+
+Services call ``audit_log.record(...)`` after their commit. The event
+goes into an in-process buffer (a deque append, no I/O). A daemon thread
+writes the buffer every ``AUDIT_FLUSH_SECONDS``, or as soon as
+``AUDIT_FLUSH_SIZE`` events are waiting, with one multi-row INSERT per
+flush. The card write itself pays no extra round trip.
+
+Trade-offs:
+    - Events reach ``activity_events`` up to one flush interval late.
+    - A crash loses at most the unflushed buffer; shutdown flushes it
+      (see the lifespan in ``app.main``).
+    - If the database rejects a flush, the events are retried on the next
+      one. The buffer is capped at ``AUDIT_MAX_BUFFER``; beyond that the
+      oldest events are dropped and counted, so memory stays bounded.
+
+``ActivityService`` reads the log per board or per card, newest first,
+with a keyset cursor on ``(occurred_at, id)``.
+"""
+
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.connection import engine
+from app.models.activity import ActivityEvent
+from app.services.permission_service import PermissionResolver
+
+
+class AuditLog:
+    """Process-wide event buffer with a background flusher."""
+
+    def __init__(self, flush_seconds: Optional[float] = None, flush_size: Optional[int] = None,
+                 max_buffer: Optional[int] = None):
+        self.flush_seconds = flush_seconds or settings.AUDIT_FLUSH_SECONDS
+        self.flush_size = flush_size or settings.AUDIT_FLUSH_SIZE
+        self.max_buffer = max_buffer or settings.AUDIT_MAX_BUFFER
+        self.enabled = settings.AUDIT_ENABLED
+        self._events: deque = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"recorded": 0, "flushed": 0, "dropped": 0, "flushes": 0, "failures": 0}
+
+    def record(self, action: str, board_id: int, actor_id: Optional[int] = None,
+               lane_id: Optional[int] = None, task_id: Optional[int] = None,
+               data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Buffer one event; returns immediately.
+
+        Args:
+            action: Dotted event name, e.g. ``task.moved``
+            board_id: Board the event belongs to (the log is partitioned by it for reads)
+            actor_id: User who made the change
+            lane_id: Lane involved, if any
+            task_id: Card involved, if any
+            data: Small JSON-serializable details (changed fields, from/to lane)
+        """
+        if not self.enabled or board_id is None:
+            return
+        event = {
+            "occurred_at": datetime.now(), "action": action, "actor_id": actor_id,
+            "board_id": board_id, "lane_id": lane_id, "task_id": task_id, "data": data,
+        }
+        with self._lock:
+            self._events.append(event)
+            self.stats["recorded"] += 1
+            overflow = len(self._events) - self.max_buffer
+            for _ in range(max(overflow, 0)):
+                self._events.popleft()
+                self.stats["dropped"] += 1
+            pending = len(self._events)
+        if self._thread is None:
+            self._start()
+        if pending >= self.flush_size:
+            self._wake.set()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            # Started on first use, so importing the app spawns no thread
+            self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write every buffered event now.
+
+        Returns:
+            Events written (0 if the buffer was empty or the write failed)
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._events:
+                    return 0
+                batch: List[dict] = list(self._events)
+                self._events.clear()
+            try:
+                with engine.begin() as connection:
+                    connection.execute(insert(ActivityEvent), batch)
+            except Exception as e:
+                with self._lock:
+                    # Put the batch back in front of newer events; the cap still applies
+                    self._events.extendleft(reversed(batch))
+                    while len(self._events) > self.max_buffer:
+                        self._events.popleft()
+                        self.stats["dropped"] += 1
+                    self.stats["failures"] += 1
+                print(f"Audit flush of {len(batch)} events failed: {e}")
+                return 0
+            with self._lock:
+                self.stats["flushed"] += len(batch)
+                self.stats["flushes"] += 1
+            return len(batch)
+
+    def close(self) -> None:
+        """Flush what is left (called on application shutdown)."""
+        self.flush()
+
+
+audit_log = AuditLog()
+
+
+class ActivityService:
+    """Service class for reading the activity log."""
+
+    def __init__(self, db: Session, user_id: int):
+        """
+        Args:
+            db: SQLAlchemy database session
+            user_id: ID of the current user
+        """
+        self.db = db
+        self.user_id = user_id
+        self.permissions = PermissionResolver(db, user_id)
+
+    def _page(self, condition, limit: int, cursor: Optional[str]) -> dict:
+        stmt = select(ActivityEvent).where(condition)
+        after = decode_cursor(cursor, 2)
+        if after is not None:
+            try:
+                occurred_at, event_id = datetime.fromisoformat(after[0]), int(after[1])
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            stmt = stmt.where(or_(
+                ActivityEvent.occurred_at < occurred_at,
+                and_(ActivityEvent.occurred_at == occurred_at, ActivityEvent.id < event_id),
+            ))
+        events = self.db.execute(
+            stmt.order_by(ActivityEvent.occurred_at.desc(), ActivityEvent.id.desc()).limit(limit + 1)
+        ).scalars().all()
+        next_cursor = None
+        if len(events) > limit:
+            last = events[limit - 1]
+            next_cursor = encode_cursor([last.occurred_at.isoformat(), last.id])
+        return {"items": events[:limit], "next_cursor": next_cursor}
+
+    def board_activity(self, board_id: int, limit: int = 50, cursor: Optional[str] = None) -> dict:
+        """
+        Events of one board, newest first.
+
+        Returns:
+            Dictionary with ``items`` and ``next_cursor``
+        """
+        self.permissions.require(board_id)
+        return self._page(ActivityEvent.board_id == board_id, limit, cursor)
+
+    def task_activity(self, task_id: int, limit: int = 50, cursor: Optional[str] = None) -> dict:
+        """
+        Events of one card, newest first (also after the card was deleted).
+
+        Access follows the board of the card's latest event, and only the
+        events on boards the user can see are listed (a card moved from
+        another board keeps that board's history to itself).
+        """
+        board_id = self.db.execute(
+            select(ActivityEvent.board_id)
+            .where(ActivityEvent.task_id == task_id)
+            .order_by(ActivityEvent.occurred_at.desc(), ActivityEvent.id.desc())
+            .limit(1)
+        ).scalar()
+        if board_id is None or not self.permissions.role(board_id):
+            raise HTTPException(status_code=404, detail="Task not found")
+        return self._page(
+            and_(ActivityEvent.task_id == task_id, ActivityEvent.board_id.in_(self.permissions.board_ids())),
+            limit, cursor
+        )
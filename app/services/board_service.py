@@ -1,17 +1,45 @@
 """
 Board Service - Business logic for Boards and Lanes.
+
+Access checks go through ``PermissionResolver``: viewers may read a board,
+editors may change lanes and cards, and only the owner may delete the
+board or manage its members.
+
+Deleting a board or lane is a soft delete: one UPDATE stamps ``deleted_at``
+and the rows disappear from every read at once. ``PurgeService`` removes
+them later in bounded batches (see ``app/services/purge_service.py``).
+
+Changes are recorded in the activity log after each commit
+(``audit_log.record``, buffered; see ``app/services/audit_service.py``),
+and changes to what ``GET /boards/{id}`` shows bump the board's snapshot
+version (``BoardSnapshot``, see ``app/services/snapshot_service.py``).
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from fastapi import HTTPException
-from app.models.board import Board, Lane
-from app.schemas.board import BoardCreate, LaneCreate, LaneUpdate
+from sqlalchemy import Integer, func, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, selectinload
+from fastapi import HTTPException, Response
+from app.models.board import Board, Lane, BoardMember, Label
+from app.models.task import Task, ArchivedTask
+from app.models.user import User
+from app.core.content_encoding import json_body
+from app.schemas.board import (
+    BoardResponse, BoardCreate, LaneCreate, LaneUpdate, BoardMemberCreate, ArchivePolicyUpdate,
+    LabelCreate, LabelUpdate
+)
+from app.services.audit_service import audit_log
+from app.services.loader import RequestLoaders
+from app.services.permission_service import PermissionResolver
+from app.services.snapshot_service import BoardSnapshot
+from app.services.stats_service import StatsService
+from app.services.task_query import labels_filter
 
 class BoardService:
     def __init__(self, db: Session, user_id: int):
         self.db = db
         self.user_id = user_id
+        self.permissions = PermissionResolver(db, user_id)
 
     # --- BOARD OPERATIONS ---
     def create_board(self, board_data: BoardCreate) -> Board:
@@ -22,40 +50,181 @@ class BoardService:
         self.db.add(new_board)
         self.db.commit()
         self.db.refresh(new_board)
-        
+
         # Create default lanes for a new board
         default_lanes = ["Todo", "In Progress", "Done"]
         for i, title in enumerate(default_lanes):
             lane = Lane(title=title, board_id=new_board.id, position=i)
             self.db.add(lane)
-        
+
         self.db.commit()
         self.db.refresh(new_board)
+        PermissionResolver.invalidate([self.user_id])
+        audit_log.record("board.created", new_board.id, self.user_id)
         return new_board
 
     def get_my_boards(self) -> List[Board]:
-        return self.db.query(Board).filter(Board.owner_id == self.user_id).all()
+        board_ids = self.permissions.board_ids()
+        if not board_ids:
+            return []
+        return (
+            self.db.query(Board)
+            .options(selectinload(Board.labels))
+            .filter(Board.id.in_(board_ids), Board.deleted_at.is_(None))
+            .all()
+        )
 
-    def get_board(self, board_id: int) -> Board:
-        board = self.db.query(Board).filter(
-            Board.id == board_id,
-            Board.owner_id == self.user_id
-        ).first()
+    async def get_boards_by_ids(self, board_ids: List[int]) -> Response:
+        """
+        Several boards with their lanes and cards, in one response.
+
+        Boards whose current snapshot is built come from Redis in one
+        MGET; the rest are loaded together through the request's
+        ``RequestLoaders`` (one query each for boards, lanes, cards and labels).
+        Ids the user cannot see, or that are gone, are left out.
+
+        Args:
+            board_ids: Board IDs, in the order to return them
+
+        Returns:
+            JSON array matching ``List[BoardResponse]``
+        """
+        roles = self.permissions.roles()
+        visible = [board_id for board_id in board_ids if board_id in roles]
+        bodies = await BoardSnapshot.bodies(visible)
+        missing = [board_id for board_id in visible if board_id not in bodies]
+        for board in await RequestLoaders.of(self.db).boards.load_many(missing):
+            if board is not None:
+                bodies[board.id] = json_body(BoardResponse.model_validate(board).model_dump(mode="json"))
+        content = b"[" + b",".join(bodies[board_id] for board_id in visible if board_id in bodies) + b"]"
+        return Response(content=content, media_type="application/json")
+
+    def get_board(self, board_id: int, min_role: str = "viewer") -> Board:
+        self.permissions.require(board_id, min_role)
+        board = self.db.query(Board).filter(Board.id == board_id, Board.deleted_at.is_(None)).first()
         if not board:
             raise HTTPException(status_code=404, detail="Board not found")
         return board
-    
+
+    async def get_board_snapshot(self, board_id: int, accept_encoding: Optional[str] = None) -> Response:
+        """
+        The board with its lanes and cards, served precompressed from the snapshot cache.
+
+        Args:
+            board_id: Board ID
+            accept_encoding: The request's ``Accept-Encoding`` header
+
+        Raises:
+            HTTPException 404: If the user cannot see the board or it is gone
+        """
+        self.permissions.require(board_id)
+        response = await BoardSnapshot.respond(board_id, accept_encoding)
+        if response is None:
+            raise HTTPException(status_code=404, detail="Board not found")
+        return response
+
+    def get_board_stats(self, board_id: int, days: int = 30) -> dict:
+        """Lane counts, priority distribution and cumulative flow, from counters."""
+        self.permissions.require(board_id)
+        return StatsService(self.db).board_stats(board_id, days)
+
     def delete_board(self, board_id: int):
-        board = self.get_board(board_id)
-        self.db.delete(board)
+        """
+        Soft-delete a board (owner only).
+
+        Lanes, tasks and memberships are left for the purge job, so this is
+        a single UPDATE regardless of the board's size.
+        """
+        self.permissions.require(board_id, min_role="owner")
+        deleted = self.db.execute(
+            update(Board)
+            .where(Board.id == board_id, Board.deleted_at.is_(None))
+            .values(deleted_at=func.now())
+            .returning(Board.id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if deleted is None:
+            self.db.rollback()
+            raise HTTPException(status_code=404, detail="Board not found")
+
+        member_ids = self.db.execute(
+            select(BoardMember.user_id).where(BoardMember.board_id == board_id)
+        ).scalars().all()
         self.db.commit()
+        PermissionResolver.invalidate([self.user_id, *member_ids])
+        BoardSnapshot.invalidate([board_id])
+        audit_log.record("board.deleted", board_id, self.user_id)
         return {"message": "Board deleted"}
 
+    def set_archive_policy(self, board_id: int, policy: ArchivePolicyUpdate) -> Board:
+        """Set how many idle days before the board's tasks are archived (owner only)."""
+        self.permissions.require(board_id, min_role="owner")
+        board = self.db.execute(
+            update(Board)
+            .where(Board.id == board_id, Board.deleted_at.is_(None))
+            .values(archive_after_days=policy.archive_after_days)
+            .returning(Board)
+            .execution_options(synchronize_session=False)
+        ).scalars().first()
+        if not board:
+            self.db.rollback()
+            raise HTTPException(status_code=404, detail="Board not found")
+
+        self.db.commit()
+        BoardSnapshot.invalidate([board_id])
+        audit_log.record("board.archive_policy_set", board_id, self.user_id,
+                         data={"archive_after_days": policy.archive_after_days})
+        return board
+
+    # --- MEMBERSHIP OPERATIONS ---
+    def get_members(self, board_id: int) -> List[BoardMember]:
+        self.permissions.require(board_id)
+        return self.db.query(BoardMember).filter(BoardMember.board_id == board_id).all()
+
+    def set_member(self, board_id: int, member_data: BoardMemberCreate) -> BoardMember:
+        """Add a member to a board, or change the role of an existing one."""
+        board = self.get_board(board_id, min_role="owner")
+        if member_data.user_id == board.owner_id:
+            raise HTTPException(status_code=400, detail="The owner already has full access")
+        if not self.db.query(User.id).filter(User.id == member_data.user_id).first():
+            raise HTTPException(status_code=404, detail="User not found")
+
+        member = self.db.query(BoardMember).filter(
+            BoardMember.board_id == board_id,
+            BoardMember.user_id == member_data.user_id
+        ).first()
+        if member:
+            member.role = member_data.role
+        else:
+            member = BoardMember(board_id=board_id, **member_data.model_dump())
+            self.db.add(member)
+
+        self.db.commit()
+        self.db.refresh(member)
+        PermissionResolver.invalidate([member.user_id])
+        audit_log.record("board.member_set", board_id, self.user_id,
+                         data={"user_id": member.user_id, "role": member.role})
+        return member
+
+    def remove_member(self, board_id: int, user_id: int):
+        self.permissions.require(board_id, min_role="owner")
+        deleted = self.db.query(BoardMember).filter(
+            BoardMember.board_id == board_id,
+            BoardMember.user_id == user_id
+        ).delete(synchronize_session=False)
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Member not found")
+
+        self.db.commit()
+        PermissionResolver.invalidate([user_id])
+        audit_log.record("board.member_removed", board_id, self.user_id, data={"user_id": user_id})
+        return {"message": "Member removed"}
+
     # --- LANE OPERATIONS ---
     def create_lane(self, board_id: int, lane_data: LaneCreate) -> Lane:
-        # Verify board ownership
-        self.get_board(board_id) 
-        
+        # Verify edit access
+        self.permissions.require(board_id, min_role="editor")
+
         new_lane = Lane(
             **lane_data.model_dump(),
             board_id=board_id
@@ -63,33 +232,167 @@ class BoardService:
         self.db.add(new_lane)
         self.db.commit()
         self.db.refresh(new_lane)
+        BoardSnapshot.invalidate([board_id])
+        audit_log.record("lane.created", board_id, self.user_id, lane_id=new_lane.id)
         return new_lane
 
-    def update_lane(self, lane_id: int, lane_data: LaneUpdate) -> Lane:
-        lane = self.db.query(Lane).filter(Lane.id == lane_id).first()
-        if not lane:
-            raise HTTPException(status_code=404, detail="Lane not found")
-        
-        # Verify board ownership (via lane -> board)
-        if lane.board.owner_id != self.user_id:
+    def _raise_lane_failure(self, lane_id: int, expected_version: Optional[int] = None):
+        """Distinguish a missing or concurrently changed lane from one the user may not change."""
+        row = self.db.query(Lane.board_id, Lane.version).filter(
+            Lane.id == lane_id,
+            Lane.deleted_at.is_(None)
+        ).first()
+        role = self.permissions.role(row.board_id) if row else None
+        if role in ("editor", "owner") and expected_version not in (None, row.version):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Lane was modified concurrently (current version {row.version}); reload and retry."
+            )
+        if role:
             raise HTTPException(status_code=403, detail="Not authorized")
+        raise HTTPException(status_code=404, detail="Lane not found")
 
+    def update_lane(self, lane_id: int, lane_data: LaneUpdate, expected_version: Optional[int] = None) -> Lane:
+        """
+        Rename, reorder or change the archive policy of a lane.
+
+        Raises:
+            HTTPException 409: If ``expected_version`` (If-Match) is stale
+        """
         update_data = lane_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(lane, key, value)
-            
+
+        # Access is checked in the UPDATE itself (no lazy load of lane.board)
+        stmt = update(Lane).where(
+            Lane.id == lane_id,
+            Lane.board_id.in_(self.permissions.board_ids("editor")),
+            Lane.deleted_at.is_(None)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(Lane.version == expected_version)
+        if update_data:
+            lane = self.db.execute(
+                stmt.values(**update_data, version=Lane.version + 1)
+                .returning(Lane)
+                .execution_options(synchronize_session=False)
+            ).scalars().first()
+        else:
+            lane = self.db.query(Lane).filter(stmt.whereclause).first()
+
+        if not lane:
+            self.db.rollback()
+            self._raise_lane_failure(lane_id, expected_version)
+
         self.db.commit()
-        self.db.refresh(lane)
+        if update_data:
+            BoardSnapshot.invalidate([lane.board_id])
+            audit_log.record("lane.updated", lane.board_id, self.user_id, lane_id=lane.id,
+                             data={"fields": sorted(update_data)})
         return lane
-        
+
     def delete_lane(self, lane_id: int):
-        lane = self.db.query(Lane).filter(Lane.id == lane_id).first()
-        if not lane:
-            raise HTTPException(status_code=404, detail="Lane not found")
-        
-        if lane.board.owner_id != self.user_id:
-             raise HTTPException(status_code=403, detail="Not authorized")
-             
-        self.db.delete(lane)
+        """Soft-delete a lane; its tasks are hidden at once and purged later."""
+        deleted = self.db.execute(
+            update(Lane)
+            .where(
+                Lane.id == lane_id,
+                Lane.board_id.in_(self.permissions.board_ids("editor")),
+                Lane.deleted_at.is_(None)
+            )
+            .values(deleted_at=func.now())
+            .returning(Lane.board_id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if deleted is None:
+            self.db.rollback()
+            self._raise_lane_failure(lane_id)
+
         self.db.commit()
+        BoardSnapshot.invalidate([deleted])
+        audit_log.record("lane.deleted", deleted, self.user_id, lane_id=lane_id)
         return {"message": "Lane deleted"}
+
+    # --- LABEL OPERATIONS ---
+    def get_labels(self, board_id: int) -> List[Label]:
+        self.permissions.require(board_id)
+        return self.db.query(Label).filter(Label.board_id == board_id).order_by(Label.id).all()
+
+    def _editable_label(self, label_id: int) -> Label:
+        label = self.db.query(Label).filter(Label.id == label_id).first()
+        if not label:
+            raise HTTPException(status_code=404, detail="Label not found")
+        self.permissions.require(label.board_id, min_role="editor")
+        return label
+
+    def _require_unique_label(self, board_id: int, name: str, label_id: Optional[int] = None):
+        clash = self.db.query(Label.id).filter(Label.board_id == board_id, Label.name == name)
+        if label_id is not None:
+            clash = clash.filter(Label.id != label_id)
+        if clash.first():
+            raise HTTPException(status_code=409, detail="The board already has a label with this name")
+
+    def create_label(self, board_id: int, label_data: LabelCreate) -> Label:
+        self.permissions.require(board_id, min_role="editor")
+        self._require_unique_label(board_id, label_data.name)
+
+        label = Label(**label_data.model_dump(), board_id=board_id)
+        self.db.add(label)
+        self.db.commit()
+        self.db.refresh(label)
+        BoardSnapshot.invalidate([board_id])
+        audit_log.record("label.created", board_id, self.user_id, data={"label_id": label.id, "name": label.name})
+        return label
+
+    def update_label(self, label_id: int, label_data: LabelUpdate) -> Label:
+        label = self._editable_label(label_id)
+        update_data = label_data.model_dump(exclude_unset=True)
+        if update_data.get("name") is not None:
+            self._require_unique_label(label.board_id, update_data["name"], label.id)
+        for field, value in update_data.items():
+            if field != "name" or value is not None:
+                setattr(label, field, value)
+
+        self.db.commit()
+        self.db.refresh(label)
+        BoardSnapshot.invalidate([label.board_id])
+        audit_log.record("label.updated", label.board_id, self.user_id,
+                         data={"label_id": label.id, "fields": sorted(update_data)})
+        return label
+
+    def delete_label(self, label_id: int):
+        """
+        Delete a label and take it off every card of its board.
+
+        One UPDATE over the board's cards that carry it (found through the
+        label index on PostgreSQL), and one over its archived cards, in the
+        same transaction as the delete. Live cards get a new version, so
+        copies read before (If-Match, ETags) are stale.
+        """
+        label = self._editable_label(label_id)
+        board_id = label.board_id
+        dialect = self.db.get_bind().dialect.name
+
+        def remaining(column):
+            if dialect == "postgresql":
+                return func.array_remove(type_coerce(column, ARRAY(Integer)), label_id)
+            labels = func.json_each(column).table_valued("value")
+            return select(func.json_group_array(labels.c.value)).where(labels.c.value != label_id).scalar_subquery()
+
+        cards = self.db.execute(
+            update(Task)
+            .where(Task.board_id == board_id, labels_filter(dialect, [label_id]))
+            # Not an edit of the cards: updated_at stays
+            .values(label_ids=remaining(Task.label_ids), version=Task.version + 1, updated_at=Task.updated_at)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.execute(
+            update(ArchivedTask)
+            .where(ArchivedTask.board_id == board_id, labels_filter(dialect, [label_id], ArchivedTask.label_ids))
+            .values(label_ids=remaining(ArchivedTask.label_ids))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.delete(label)
+
+        self.db.commit()
+        BoardSnapshot.invalidate([board_id])
+        audit_log.record("label.deleted", board_id, self.user_id, data={"label_id": label_id, "cards": cards})
+        return {"message": "Label deleted"}
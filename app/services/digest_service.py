@@ -0,0 +1,176 @@
+"""
+Digest Service - Per-user daily activity digests, computed set-based.
+
+A digest lists, for every board a user can see (owned or shared), how
+many cards were created and how many were moved or edited during the
+day. Looping over users and their boards would cost queries per user per
+board; instead users are walked in id-ordered chunks and each chunk is
+one aggregate query:
+
+    access(user, board) = owned boards UNION memberships, for the chunk
+    JOIN tasks ON board_id AND updated_at in the window   -- (board_id, updated_at, id) index
+    GROUP BY user, board
+
+Memory is bounded by the chunk (``DIGEST_CHUNK_SIZE`` users and their
+active boards), whatever the number of users; each chunk runs in its own
+short read transaction. Batches of digests are handed to a sink, by
+default one ``send_digests`` job per ``DIGEST_SEND_BATCH`` digests.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Integer, case, func, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.connection import SessionLocal
+from app.models.board import Board, BoardMember
+from app.models.task import Task
+from app.models.user import User
+from app.services.task_query import IN_DELETED_LANE
+
+
+def day_window(day: date) -> Tuple[datetime, datetime]:
+    """[midnight, next midnight) of ``day``."""
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+class DigestService:
+    """Service class for building activity digests in user-id chunks."""
+
+    def __init__(self, db: Session, chunk_size: Optional[int] = None):
+        """
+        Args:
+            db: SQLAlchemy database session
+            chunk_size: Users aggregated per query
+        """
+        self.db = db
+        self.chunk_size = chunk_size or settings.DIGEST_CHUNK_SIZE
+
+    def _next_chunk_end(self, after_id: int) -> Optional[int]:
+        """Highest id of the next ``chunk_size`` active users after ``after_id``."""
+        ids = (
+            select(User.id)
+            .where(User.id > after_id, User.is_active.is_(True))
+            .order_by(User.id)
+            .limit(self.chunk_size)
+            .subquery()
+        )
+        return self.db.execute(select(func.max(ids.c.id))).scalar()
+
+    def chunk(self, first_id: int, last_id: int, start: datetime, end: datetime) -> List[Dict]:
+        """
+        Digests of active users with ids in ``[first_id, last_id]`` that had activity.
+
+        Returns:
+            Digests ordered by user id, each with per-board counts
+        """
+        owned = select(Board.owner_id.label("user_id"), Board.id.label("board_id")).where(
+            Board.owner_id.between(first_id, last_id), Board.deleted_at.is_(None)
+        )
+        shared = (
+            select(BoardMember.user_id.label("user_id"), BoardMember.board_id.label("board_id"))
+            .join(Board, Board.id == BoardMember.board_id)
+            .where(BoardMember.user_id.between(first_id, last_id), Board.deleted_at.is_(None))
+        )
+        access = union_all(owned, shared).subquery()
+
+        created = func.sum(case((Task.created_at >= start, 1), else_=0)).cast(Integer)
+        updated = func.sum(case((Task.created_at >= start, 0), else_=1)).cast(Integer)
+        rows = self.db.execute(
+            select(
+                access.c.user_id, User.email, User.full_name,
+                access.c.board_id, Board.title, created.label("created"), updated.label("updated"),
+            )
+            .select_from(access)
+            .join(User, User.id == access.c.user_id)
+            .join(Board, Board.id == access.c.board_id)
+            .join(Task, Task.board_id == access.c.board_id)
+            .where(
+                User.is_active.is_(True),
+                Task.updated_at >= start, Task.updated_at < end,
+                ~IN_DELETED_LANE,
+            )
+            .group_by(access.c.user_id, User.email, User.full_name, access.c.board_id, Board.title)
+            .order_by(access.c.user_id, access.c.board_id)
+        ).all()
+
+        digests: List[Dict] = []
+        for user_id, email, name, board_id, title, created_count, updated_count in rows:
+            if not digests or digests[-1]["user_id"] != user_id:
+                digests.append({"user_id": user_id, "email": email, "name": name,
+                                "created": 0, "updated": 0, "boards": []})
+            digest = digests[-1]
+            digest["created"] += created_count
+            digest["updated"] += updated_count
+            digest["boards"].append({"board_id": board_id, "title": title,
+                                     "created": created_count, "updated": updated_count})
+        return digests
+
+    def iter_batches(self, start: datetime, end: datetime) -> Iterator[List[Dict]]:
+        """Yield the digests of each user-id chunk (chunks without activity are skipped)."""
+        last_id = 0
+        while True:
+            chunk_end = self._next_chunk_end(last_id)
+            if chunk_end is None:
+                return
+            digests = self.chunk(last_id + 1, chunk_end, start, end)
+            # End the read transaction: no snapshot is held across the whole run
+            self.db.commit()
+            if digests:
+                yield digests
+            last_id = chunk_end
+
+    def run(self, start: datetime, end: datetime,
+            sink: Optional[Callable[[List[Dict]], None]] = None) -> Dict[str, int]:
+        """
+        Build every digest for the window and hand them to ``sink`` in batches.
+
+        Args:
+            start: Window start (inclusive)
+            end: Window end (exclusive)
+            sink: Receives lists of at most DIGEST_SEND_BATCH digests;
+                defaults to queueing ``send_digests`` jobs
+
+        Returns:
+            Counts of digests and batches
+        """
+        sink = sink or enqueue_digest_batch
+        counts = {"digests": 0, "batches": 0}
+        for digests in self.iter_batches(start, end):
+            for offset in range(0, len(digests), settings.DIGEST_SEND_BATCH):
+                sink(digests[offset:offset + settings.DIGEST_SEND_BATCH])
+                counts["batches"] += 1
+            counts["digests"] += len(digests)
+        return counts
+
+
+def enqueue_digest_batch(digests: List[Dict]) -> None:
+    """Default sink: one retryable job per batch, so a mail outage only delays it."""
+    from app.services.job_service import JobService
+
+    db = SessionLocal()
+    try:
+        JobService(db).enqueue("send_digests", {"digests": digests})
+    finally:
+        db.close()
+
+
+def run_daily_digest(day: Optional[str] = None) -> Dict[str, int]:
+    """
+    Job entry point (``daily_digest``); opens its own session.
+
+    Args:
+        day: ISO date to summarize (default: yesterday)
+    """
+    target = date.fromisoformat(day) if day else date.today() - timedelta(days=1)
+    db = SessionLocal()
+    try:
+        return DigestService(db).run(*day_window(target))
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,322 @@
+"""
+Job Service - Database-backed queue for deferred work.
+
+Requests enqueue a row in ``jobs`` and return; ``python manage.py worker``
+claims runnable rows with ``FOR UPDATE SKIP LOCKED`` (so any number of
+workers can share the table without blocking each other), runs them on a
+bounded thread pool and records the outcome:
+
+    - success: ``done``
+    - failure: back to ``queued`` with exponential backoff, until
+      ``max_attempts`` is reached, then ``dead`` (the dead-letter queue,
+      inspected and requeued with ``manage.py requeue-dead``)
+    - worker crash: rows stuck in ``running`` past the lease are requeued
+
+A worker renews the lease (``locked_at``) of its running jobs every
+third of the lease, so only jobs of a stopped worker expire, however
+long a job runs. The outcome is only recorded while the row is still
+this run's claim: a job requeued meanwhile keeps its new state.
+
+Handlers are referenced by name in ``JOB_HANDLERS`` and imported on first
+use, so enqueueing from the API does not import mail or archive code.
+Handlers take the payload as keyword arguments, open their own sessions
+and must be idempotent (a job may run again after a crash).
+"""
+
+import asyncio
+import importlib
+import os
+import random
+import socket
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.connection import SessionLocal
+from app.models.job import Job
+
+JOB_HANDLERS = {
+    "send_welcome_email": "app.services.notification_service:send_welcome_email",
+    "purge": "app.services.purge_service:purge_in_background",
+    "archive": "app.services.archive_service:run_archive",
+    "daily_digest": "app.services.digest_service:run_daily_digest",
+    "send_digests": "app.services.notification_service:send_digest_emails",
+    "send_due_reminders": "app.services.notification_service:send_due_reminders",
+    "snapshot_stats": "app.services.stats_service:snapshot_board_stats",
+}
+
+MAX_ERROR_LENGTH = 2_000
+
+
+def resolve_handler(name: str) -> Callable:
+    """Import the callable registered for a job name."""
+    module_name, attribute = JOB_HANDLERS[name].split(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before retry number ``attempts``: exponential, capped, with jitter."""
+    delay = min(settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class JobService:
+    """Service class for enqueueing and bookkeeping of jobs."""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def enqueue(self, name: str, payload: Optional[Dict[str, Any]] = None,
+                delay_seconds: float = 0, max_attempts: Optional[int] = None) -> int:
+        """
+        Queue a job for the worker.
+
+        Args:
+            name: Key of JOB_HANDLERS
+            payload: JSON-serializable keyword arguments for the handler
+            delay_seconds: Earliest start, relative to now
+            max_attempts: Runs before the job is dead-lettered
+
+        Returns:
+            The job id
+        """
+        if name not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job: {name}")
+        job = Job(
+            name=name,
+            payload=payload or {},
+            max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+            run_at=datetime.now() + timedelta(seconds=delay_seconds),
+        )
+        self.db.add(job)
+        self.db.commit()
+        return job.id
+
+    def claim(self, worker_id: str, limit: int) -> List[Any]:
+        """
+        Mark up to ``limit`` runnable jobs as running by this worker.
+
+        One UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED):
+        rows another worker is claiming are skipped, not waited for.
+
+        Returns:
+            Rows of (id, name, payload, attempts, max_attempts)
+        """
+        now = datetime.now()
+        runnable = (
+            select(Job.id)
+            .where(Job.status == "queued", Job.run_at <= now)
+            .order_by(Job.run_at, Job.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = self.db.execute(
+            update(Job)
+            .where(Job.id.in_(runnable.scalar_subquery()))
+            .values(status="running", locked_at=now, locked_by=worker_id, attempts=Job.attempts + 1)
+            .returning(Job.id, Job.name, Job.payload, Job.attempts, Job.max_attempts)
+            .execution_options(synchronize_session=False)
+        ).all()
+        self.db.commit()
+        return rows
+
+    @staticmethod
+    def _leased(job_id: int, worker_id: str, attempts: int):
+        """WHERE clause for a job still running under the claim that made ``attempts``."""
+        return (Job.id == job_id) & (Job.status == "running") & (Job.locked_by == worker_id) & (
+            Job.attempts == attempts
+        )
+
+    def heartbeat(self, worker_id: str, job_ids: List[int]) -> int:
+        """
+        Renew the lease of jobs this worker is running.
+
+        Returns:
+            Jobs renewed (fewer than given if some lease was lost)
+        """
+        result = self.db.execute(
+            update(Job)
+            .where(Job.id.in_(job_ids), Job.status == "running", Job.locked_by == worker_id)
+            .values(locked_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def complete(self, job_id: int, worker_id: str, attempts: int) -> bool:
+        """
+        Mark a job done.
+
+        Returns:
+            False if the lease was lost (the job was requeued or claimed again)
+        """
+        result = self.db.execute(
+            update(Job).where(self._leased(job_id, worker_id, attempts))
+            .values(status="done", finished_at=datetime.now(), last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def fail(self, job_id: int, worker_id: str, attempts: int, max_attempts: int, error: str,
+             dead: bool = False) -> Optional[str]:
+        """
+        Schedule a retry, or dead-letter the job once attempts are used up.
+
+        Args:
+            job_id: Failed job
+            worker_id: Worker that claimed it
+            attempts: Attempts made, including this one
+            max_attempts: Attempts allowed
+            error: Traceback to keep in ``last_error``
+            dead: Dead-letter right away
+
+        Returns:
+            The new status, or None if the lease was lost
+        """
+        now = datetime.now()
+        if dead or attempts >= max_attempts:
+            values = {"status": "dead", "finished_at": now}
+        else:
+            values = {"status": "queued", "run_at": now + timedelta(seconds=retry_delay(attempts))}
+        result = self.db.execute(
+            update(Job).where(self._leased(job_id, worker_id, attempts))
+            .values(last_error=error[-MAX_ERROR_LENGTH:], locked_by=None, **values)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return values["status"] if result.rowcount == 1 else None
+
+    def recover_stale(self, lease_seconds: int) -> int:
+        """Requeue (or dead-letter) jobs whose worker stopped renewing them."""
+        result = self.db.execute(
+            update(Job)
+            .where(Job.status == "running", Job.locked_at < datetime.now() - timedelta(seconds=lease_seconds))
+            .values(
+                status=case((Job.attempts >= Job.max_attempts, "dead"), else_="queued"),
+                last_error="lease expired (worker stopped)",
+                locked_by=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def requeue_dead(self, name: Optional[str] = None) -> int:
+        """Give dead-lettered jobs a fresh set of attempts."""
+        statement = update(Job).where(Job.status == "dead")
+        if name:
+            statement = statement.where(Job.name == name)
+        result = self.db.execute(
+            statement.values(status="queued", attempts=0, run_at=datetime.now(), finished_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        rows = self.db.execute(select(Job.status, func.count()).group_by(Job.status)).all()
+        return {status: count for status, count in rows}
+
+
+def run_job(name: str, payload: Dict[str, Any]) -> None:
+    """Call a handler; coroutine handlers get their own event loop."""
+    handler = resolve_handler(name)
+    result = handler(**payload)
+    if asyncio.iscoroutine(result):
+        asyncio.run(result)
+
+
+class JobWorker:
+    """Claims and runs jobs with at most ``concurrency`` in flight."""
+
+    def __init__(self, concurrency: Optional[int] = None, poll_seconds: Optional[float] = None,
+                 lease_seconds: Optional[int] = None):
+        """
+        Args:
+            concurrency: Jobs run in parallel (threads)
+            poll_seconds: Sleep when the queue is empty
+            lease_seconds: Running jobs not renewed for this long are presumed orphaned
+        """
+        self.concurrency = concurrency or settings.JOB_CONCURRENCY
+        self.poll_seconds = poll_seconds if poll_seconds is not None else settings.JOB_POLL_SECONDS
+        self.lease_seconds = lease_seconds or settings.JOB_LEASE_SECONDS
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = False
+
+    def _execute(self, job) -> str:
+        try:
+            if job.name not in JOB_HANDLERS:
+                raise LookupError(f"No handler registered for job {job.name!r}")
+            run_job(job.name, job.payload or {})
+        except Exception:
+            error = traceback.format_exc()
+            db = SessionLocal()
+            try:
+                # Unknown jobs can never succeed: dead-letter right away
+                status = JobService(db).fail(job.id, self.worker_id, job.attempts, job.max_attempts, error,
+                                             dead=job.name not in JOB_HANDLERS)
+            finally:
+                db.close()
+            print(f"Job {job.id} ({job.name}) failed on attempt {job.attempts}: {status or 'lease lost'}")
+            return status or "lost"
+
+        db = SessionLocal()
+        try:
+            completed = JobService(db).complete(job.id, self.worker_id, job.attempts)
+        finally:
+            db.close()
+        if not completed:
+            print(f"Job {job.id} ({job.name}) finished after its lease was lost; outcome not recorded")
+            return "lost"
+        return "done"
+
+    def run(self, drain: bool = False) -> Dict[str, int]:
+        """
+        Process jobs until stopped (or, with ``drain``, until nothing is runnable).
+
+        Returns:
+            Jobs finished per outcome (done / queued for retry / dead / lost lease)
+        """
+        outcomes: Dict[str, int] = {}
+        in_flight: Dict[Any, int] = {}  # Future -> job id
+        last_recovery = last_heartbeat = 0.0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="job") as pool:
+            while not self.stopping or in_flight:
+                db = SessionLocal()
+                try:
+                    if in_flight and time.monotonic() - last_heartbeat > self.lease_seconds / 3:
+                        JobService(db).heartbeat(self.worker_id, list(in_flight.values()))
+                        last_heartbeat = time.monotonic()
+                    if time.monotonic() - last_recovery > self.lease_seconds / 2:
+                        JobService(db).recover_stale(self.lease_seconds)
+                        last_recovery = time.monotonic()
+                    claimed = []
+                    if not self.stopping and len(in_flight) < self.concurrency:
+                        claimed = JobService(db).claim(self.worker_id, self.concurrency - len(in_flight))
+                finally:
+                    db.close()
+
+                in_flight.update((pool.submit(self._execute, job), job.id) for job in claimed)
+                if drain and not claimed and not in_flight:
+                    break
+                if in_flight:
+                    done, _ = wait(in_flight, timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        del in_flight[future]
+                        outcome = future.result()
+                        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+                elif not claimed:
+                    time.sleep(self.poll_seconds)
+        return outcomes
@@ -0,0 +1,155 @@
+"""
+Request Loaders - Batched by-id lookups within one request (DataLoader style).
+
+A handler that needs many rows by id (``GET /boards?ids=``, profiles of
+the owners of a board's cards) would otherwise issue one query per id.
+A ``Loader`` collects every ``load(id)`` awaited during the same
+event-loop turn and answers all of them with one query, ``WHERE id =
+ANY(:ids)`` on PostgreSQL (one array parameter, one plan whatever the
+batch size) and ``IN (...)`` elsewhere. Results, misses included, are
+kept for the rest of the request, so asking twice costs nothing.
+
+Loaders are request-scoped: ``RequestLoaders.of(db)`` keeps one set on
+the request's session (``Session.info``), so every service built on the
+same session shares the batches and the memo, and nothing outlives the
+request. Rows are loaded through that session; the memo is not
+invalidated by writes, so use loaders for reads only.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import settings
+from app.models.board import Board, Lane
+from app.models.user import User
+
+Fetch = Callable[[List[Hashable]], Dict[Hashable, Any]]
+
+
+def ids_filter(db: Session, column, ids: List[int]):
+    """
+    ``column = ANY(:ids)`` on PostgreSQL, ``column IN (...)`` elsewhere.
+
+    Args:
+        db: Session (for the dialect)
+        column: Integer column to match
+        ids: Values to match
+
+    Returns:
+        SQL expression for a WHERE clause
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return column == bindparam(None, list(ids), type_=ARRAY(Integer)).any_()
+    return column.in_(ids)
+
+
+def parse_ids(value: Optional[str], limit: Optional[int] = None) -> Optional[List[int]]:
+    """
+    Parse a comma-separated ``ids`` query parameter.
+
+    Args:
+        value: Raw parameter (None when absent)
+        limit: Most ids accepted (default ``BATCH_MAX_IDS``)
+
+    Returns:
+        Distinct positive ids in the order given, or None if the parameter is absent
+
+    Raises:
+        HTTPException 400: If an id is not a positive integer or there are too many
+    """
+    if value is None:
+        return None
+    limit = settings.BATCH_MAX_IDS if limit is None else limit
+    try:
+        ids = list(dict.fromkeys(int(part) for part in value.split(",") if part.strip()))
+        if any(item <= 0 for item in ids):
+            raise ValueError(value)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be positive integers")
+    if len(ids) > limit:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {limit} ids per request")
+    return ids
+
+
+class Loader:
+    """Coalesces ``load(key)`` calls of one event-loop turn into one ``fetch``."""
+
+    def __init__(self, fetch: Fetch):
+        """
+        Args:
+            fetch: Called with the distinct keys of a batch; returns ``{key: value}``
+                for the keys found (missing keys resolve to None)
+        """
+        self.fetch = fetch
+        self._results: Dict[Hashable, Any] = {}
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._scheduled = False
+        self.batches = 0
+
+    async def load(self, key: Hashable) -> Optional[Any]:
+        """The value for ``key``, fetched in the batch of this loop turn."""
+        if key in self._results:
+            return self._results[key]
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if not self._scheduled:
+                # Runs after every coroutine of this turn has asked for its keys
+                self._scheduled = True
+                loop.call_soon(self._dispatch)
+        return await future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Optional[Any]]:
+        """Values for ``keys`` in order (None where missing), in one batch."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        pending, self._pending, self._scheduled = self._pending, {}, False
+        self.batches += 1
+        try:
+            found = self.fetch(list(pending))
+        except Exception as exc:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key, future in pending.items():
+            value = self._results[key] = found.get(key)
+            if not future.done():
+                future.set_result(value)
+
+
+class RequestLoaders:
+    """The loaders of one request, one per entity type."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.boards = Loader(self._boards)
+        self.users = Loader(self._users)
+
+    @classmethod
+    def of(cls, db: Session) -> "RequestLoaders":
+        """The loaders bound to ``db`` (created on first use)."""
+        loaders = db.info.get("loaders")
+        if loaders is None:
+            loaders = db.info["loaders"] = cls(db)
+        return loaders
+
+    def _boards(self, ids: List[int]) -> Dict[int, Board]:
+        # Lanes, cards and labels come with their boards: one more query each, for the whole batch
+        boards = self.db.execute(
+            select(Board)
+            .options(selectinload(Board.lanes).selectinload(Lane.tasks), selectinload(Board.labels))
+            .where(ids_filter(self.db, Board.id, ids), Board.deleted_at.is_(None))
+        ).scalars().all()
+        return {board.id: board for board in boards}
+
+    def _users(self, ids: List[int]) -> Dict[int, User]:
+        users = self.db.execute(select(User).where(ids_filter(self.db, User.id, ids))).scalars().all()
+        return {user.id: user for user in users}
@@ -1,32 +1,53 @@
 """
 Notification Service - Handles real email notifications.
+
+``fastapi_mail`` and its connection config are loaded on the first send,
+not at import, so app startup does not pay for (or validate) SMTP settings.
+
+Sends run under ``mail_breaker``: while the SMTP server keeps failing or
+timing out, sends raise ``CircuitOpenError`` at once and the job worker
+retries them later, instead of every job waiting for ``MAIL_TIMEOUT``.
 """
 
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
+from functools import lru_cache
+from html import escape
+from typing import Dict, List
+
+from app.core.breaker import CircuitBreaker
 from app.core.config import settings
-from pathlib import Path
-
-# Email setup configuration
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True
-)
+
+# Any send error counts; mail volume is low, so judge after a few sends
+mail_breaker = CircuitBreaker("smtp", slow_call_seconds=settings.MAIL_SLOW_CALL_SECONDS, min_calls=5)
+
+
+@lru_cache(maxsize=1)
+def get_mail_config():
+    """Build the SMTP connection config once, on first use."""
+    from fastapi_mail import ConnectionConfig
+
+    return ConnectionConfig(
+        MAIL_USERNAME=settings.MAIL_USERNAME,
+        MAIL_PASSWORD=settings.MAIL_PASSWORD,
+        MAIL_FROM=settings.MAIL_FROM,
+        MAIL_PORT=settings.MAIL_PORT,
+        MAIL_SERVER=settings.MAIL_SERVER,
+        MAIL_STARTTLS=settings.MAIL_STARTTLS,
+        MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
+        USE_CREDENTIALS=True,
+        VALIDATE_CERTS=True,
+        TIMEOUT=settings.MAIL_TIMEOUT
+    )
 
 async def send_welcome_email(email_to: str, name: str):
     """
-    Sends a real welcome email using SMTP.
+    Sends a real welcome email using SMTP (``send_welcome_email`` job).
     """
     if not settings.MAIL_USERNAME or not settings.MAIL_PASSWORD:
         print("Email credentials not set in .env. Skipping email.")
         return
 
+    from fastapi_mail import FastMail, MessageSchema, MessageType
+
     html_content = f"""
     <html>
         <body>
@@ -47,9 +68,79 @@ async def send_welcome_email(email_to: str, name: str):
         subtype=MessageType.html
     )
 
-    try:
-        fm = FastMail(conf)
+    # Errors propagate: this runs as a job and the worker retries it
+    fm = FastMail(get_mail_config())
+    with mail_breaker.guard():
         await fm.send_message(message)
-        print(f"Email successfully sent to {email_to}")
-    except Exception as e:
-        print(f"Failed to send email: {e}")
+    print(f"Email successfully sent to {email_to}")
+
+
+async def send_digest_emails(digests: List[Dict]):
+    """
+    Sends one batch of daily digests (``send_digests`` job) over a single
+    SMTP connection setup. Each digest is a dict built by ``DigestService``.
+    """
+    if not settings.MAIL_USERNAME or not settings.MAIL_PASSWORD:
+        print(f"Email credentials not set in .env. Skipping {len(digests)} digests.")
+        return
+
+    from fastapi_mail import FastMail, MessageSchema, MessageType
+
+    fm = FastMail(get_mail_config())
+    for digest in digests:
+        rows = "".join(
+            f"<li>{escape(board['title'] or '')}: {board['created']} new, {board['updated']} moved or edited</li>"
+            for board in digest["boards"]
+        )
+        html_content = f"""
+        <html>
+            <body>
+                <h1>Your TaskMaster day, {escape(digest['name'] or '')}</h1>
+                <p>{digest['created']} cards created and {digest['updated']} moved or edited on your boards.</p>
+                <ul>{rows}</ul>
+            </body>
+        </html>
+        """
+        message = MessageSchema(
+            subject="Your TaskMaster daily digest",
+            recipients=[digest["email"]],
+            body=html_content,
+            subtype=MessageType.html
+        )
+        with mail_breaker.guard():
+            await fm.send_message(message)
+    print(f"Sent {len(digests)} digests")
+
+
+async def send_due_reminders(reminders: List[Dict]):
+    """
+    Sends one batch of due-date reminders (``send_due_reminders`` job,
+    queued by the reminder scheduler). Each reminder is a dict built by
+    ``ReminderService``.
+    """
+    if not settings.MAIL_USERNAME or not settings.MAIL_PASSWORD:
+        print(f"Email credentials not set in .env. Skipping {len(reminders)} reminders.")
+        return
+
+    from fastapi_mail import FastMail, MessageSchema, MessageType
+
+    fm = FastMail(get_mail_config())
+    for reminder in reminders:
+        due = reminder["due_at"].replace("T", " ")[:16]
+        html_content = f"""
+        <html>
+            <body>
+                <h1>Due now: {escape(reminder['title'] or '')}</h1>
+                <p>Hi {escape(reminder['name'] or '')}, this card on {escape(reminder['board'] or '')} was due at {due}.</p>
+            </body>
+        </html>
+        """
+        message = MessageSchema(
+            subject=f"Due: {reminder['title'] or 'a card'}",
+            recipients=[reminder["email"]],
+            body=html_content,
+            subtype=MessageType.html
+        )
+        with mail_breaker.guard():
+            await fm.send_message(message)
+    print(f"Sent {len(reminders)} due-date reminders")
@@ -0,0 +1,151 @@
+"""
+Permission Service - Resolves a user's role on each board.
+
+A user's access is a small ``{board_id: role}`` map (owned boards plus
+memberships), cached in Redis under ``acl:roles:{user_id}:{version}``.
+
+The version lives in Redis (``acl:version:{user_id}``) and is bumped
+whenever the user's access changes. Both keys are in the ``acl``
+near-cache namespace, so a warm lookup needs no round trip at all; the
+bump is published to every worker with the increment (see
+``app/core/near_cache.py``). If Redis is unavailable the map is loaded
+from the database on every request.
+
+A bump that fails (Redis down or timing out) leaves the old map valid, so
+the user is kept in a per-process pending set: this worker loads their
+map from the database, and retries the bump before every lookup until
+it lands. Other workers cannot read a stale map while Redis is
+unreachable (their near cache is off without its listener, and the
+version read fails); once it is back, they serve the old map only until
+the next request on the worker that holds the pending bump.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from fastapi import HTTPException, status
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache, set_cache, get_counter, incr_counter
+from app.models.board import Board, BoardMember
+
+# Higher rank includes the permissions of the lower ones
+ROLE_RANK = {"viewer": 1, "editor": 2, "owner": 3}
+
+
+def _version_key(user_id: int) -> str:
+    return f"acl:version:{user_id}"
+
+
+def _roles_key(user_id: int, version: int) -> str:
+    return f"acl:roles:{user_id}:{version}"
+
+
+# Users whose version bump failed and must be retried (see module docstring)
+_pending: Set[int] = set()
+_pending_lock = threading.Lock()
+
+
+class PermissionResolver:
+    """Answers "what may this user do on this board" from a cached role map."""
+
+    def __init__(self, db: Session, user_id: int):
+        self.db = db
+        self.user_id = user_id
+        self._roles: Optional[Dict[int, str]] = None
+
+    # --- LOOKUPS ---
+    def roles(self) -> Dict[int, str]:
+        """
+        Return the user's ``{board_id: role}`` map.
+
+        Resolved once per resolver instance (i.e. per request).
+        """
+        if self._roles is None:
+            self._roles = self._resolve()
+        return self._roles
+
+    def role(self, board_id: int) -> Optional[str]:
+        """Role of the user on ``board_id``, or None without access."""
+        return self.roles().get(board_id)
+
+    def board_ids(self, min_role: str = "viewer") -> List[int]:
+        """Ids of boards on which the user has at least ``min_role``."""
+        needed = ROLE_RANK[min_role]
+        return [board_id for board_id, role in self.roles().items() if ROLE_RANK[role] >= needed]
+
+    def require(self, board_id: int, min_role: str = "viewer") -> str:
+        """
+        Ensure the user has at least ``min_role`` on a board.
+
+        Raises:
+            HTTPException 404: If the user cannot see the board
+            HTTPException 403: If the user can see it but the role is too low
+        """
+        role = self.role(board_id)
+        if role is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Board not found")
+        if ROLE_RANK[role] < ROLE_RANK[min_role]:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+        return role
+
+    # --- CACHE LAYERS ---
+    def _resolve(self) -> Dict[int, str]:
+        if _pending and self.user_id in self.retry_pending():
+            return self._load()
+        version = get_counter(_version_key(self.user_id))
+        if version is None:
+            return self._load()
+
+        cached = get_cache(_roles_key(self.user_id, version))
+        if cached is not None:
+            return {int(board_id): role for board_id, role in cached.items()}
+        roles = self._load()
+        set_cache(_roles_key(self.user_id, version), roles)
+        return roles
+
+    def _load(self) -> Dict[int, str]:
+        """Owned boards and memberships in a single query (soft-deleted boards excluded)."""
+        stmt = union_all(
+            select(BoardMember.board_id, BoardMember.role)
+            .join(Board, Board.id == BoardMember.board_id)
+            .where(BoardMember.user_id == self.user_id, Board.deleted_at.is_(None)),
+            select(Board.id, literal("owner"))
+            .where(Board.owner_id == self.user_id, Board.deleted_at.is_(None)),
+        )
+        roles: Dict[int, str] = {}
+        for board_id, role in self.db.execute(stmt):
+            if ROLE_RANK[role] > ROLE_RANK.get(roles.get(board_id), 0):
+                roles[board_id] = role
+        return roles
+
+    # --- INVALIDATION ---
+    @classmethod
+    def invalidate(cls, user_ids: Iterable[int]) -> None:
+        """
+        Bump the ACL version of every affected user.
+
+        Call after the change is committed. The increment is published to
+        every worker, which drop their cached version of the counter.
+        Users whose bump fails are retried by ``retry_pending``.
+        """
+        failed = {user_id for user_id in set(user_ids) if incr_counter(_version_key(user_id)) is None}
+        if failed:
+            with _pending_lock:
+                _pending.update(failed)
+
+    @classmethod
+    def retry_pending(cls) -> Set[int]:
+        """
+        Retry the version bumps that failed in this process.
+
+        Returns:
+            Users still pending (their cached map may be stale)
+        """
+        with _pending_lock:
+            users = list(_pending)
+        bumped = {user_id for user_id in users if incr_counter(_version_key(user_id)) is not None}
+        with _pending_lock:
+            _pending.difference_update(bumped)
+            return set(_pending)
@@ -0,0 +1,169 @@
+"""
+Purge Service - Removes soft-deleted boards and lanes in bounded batches.
+
+Deleting a board or lane through the API only stamps ``deleted_at`` (the
+rows disappear from every read immediately). This service removes the
+rows afterwards with set-based DELETEs of at most ``batch_size`` tasks,
+committing between batches so no statement holds locks for long and no
+rows are loaded into the ORM.
+"""
+
+import time
+from typing import List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.db.connection import SessionLocal
+from app.models.board import Board, Lane, BoardMember, BoardTaskCount, BoardFlowSnapshot, Label
+from app.models.task import Task, ArchivedTask, Subtask
+
+PURGE_BATCH_SIZE = 5_000
+
+
+class PurgeService:
+    """Service class for purging soft-deleted data."""
+
+    def __init__(self, db: Session, batch_size: int = PURGE_BATCH_SIZE, pause_seconds: float = 0.0):
+        """
+        Args:
+            db: SQLAlchemy database session
+            batch_size: Maximum rows removed per DELETE statement
+            pause_seconds: Sleep between batches to leave room for foreground traffic
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+
+    def _delete_tasks_batched(self, board_ids, condition) -> int:
+        """
+        DELETE tasks matching ``condition`` (and their subtasks) in batches.
+
+        Args:
+            board_ids: Boards the tasks are on (lets PostgreSQL prune partitions)
+            condition: Which of their tasks to remove
+
+        Returns:
+            Number of tasks removed
+        """
+        removed = 0
+        while True:
+            batch = select(Task.id).where(Task.board_id.in_(board_ids), condition).limit(self.batch_size)
+            ids = self.db.execute(
+                delete(Task)
+                .where(Task.board_id.in_(board_ids), Task.id.in_(batch))
+                .returning(Task.id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            if ids:
+                self.db.execute(
+                    delete(Subtask)
+                    .where(Subtask.task_id.in_(ids))
+                    .execution_options(synchronize_session=False)
+                )
+            self.db.commit()
+            removed += len(ids)
+            if len(ids) < self.batch_size:
+                return removed
+            if self.pause_seconds:
+                time.sleep(self.pause_seconds)
+
+    def purge_lanes(self, lane_ids: List[int]) -> int:
+        """
+        Remove soft-deleted lanes and their tasks.
+
+        Ids of lanes that are not (or no longer) soft-deleted are ignored.
+
+        Returns:
+            Number of tasks removed
+        """
+        rows = self.db.execute(
+            select(Lane.id, Lane.board_id).where(Lane.id.in_(lane_ids), Lane.deleted_at.is_not(None))
+        ).all() if lane_ids else []
+        if not rows:
+            return 0
+        lane_ids = [row.id for row in rows]
+        board_ids = sorted({row.board_id for row in rows})
+        removed = self._delete_tasks_batched(board_ids, Task.lane_id.in_(lane_ids))
+        for model in (ArchivedTask, BoardTaskCount, BoardFlowSnapshot):
+            self.db.execute(
+                delete(model)
+                .where(model.lane_id.in_(lane_ids))
+                .execution_options(synchronize_session=False)
+            )
+        self.db.execute(
+            delete(Lane)
+            .where(Lane.id.in_(lane_ids), Lane.deleted_at.is_not(None))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return removed
+
+    def purge_board(self, board_id: int) -> int:
+        """
+        Remove a soft-deleted board with its lanes, tasks, archive, stats and memberships.
+
+        Returns:
+            Number of tasks removed
+        """
+        is_deleted = self.db.query(Board.id).filter(
+            Board.id == board_id,
+            Board.deleted_at.is_not(None)
+        ).first()
+        if not is_deleted:
+            return 0
+
+        removed = self._delete_tasks_batched([board_id], Task.board_id == board_id)
+        for model, column in (
+            (ArchivedTask, ArchivedTask.board_id),
+            (BoardTaskCount, BoardTaskCount.board_id),
+            (BoardFlowSnapshot, BoardFlowSnapshot.board_id),
+            (Lane, Lane.board_id),
+            (BoardMember, BoardMember.board_id),
+            (Label, Label.board_id),
+        ):
+            self.db.execute(
+                delete(model).where(column == board_id).execution_options(synchronize_session=False)
+            )
+        self.db.execute(
+            delete(Board).where(Board.id == board_id).execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return removed
+
+    def purge_all(self) -> dict:
+        """
+        Sweep everything still marked as deleted (crash recovery, cron).
+
+        Returns:
+            Counts of purged boards, lanes and tasks
+        """
+        board_ids = self.db.execute(
+            select(Board.id).where(Board.deleted_at.is_not(None))
+        ).scalars().all()
+        tasks = sum(self.purge_board(board_id) for board_id in board_ids)
+
+        lane_ids = self.db.execute(
+            select(Lane.id).where(Lane.deleted_at.is_not(None))
+        ).scalars().all()
+        tasks += self.purge_lanes(lane_ids)
+        return {"boards": len(board_ids), "lanes": len(lane_ids), "tasks": tasks}
+
+
+def purge_in_background(board_id: Optional[int] = None, lane_id: Optional[int] = None) -> None:
+    """
+    Job entry point (``purge``); opens its own session. Failures propagate
+    so the worker retries (purging is idempotent).
+    """
+    db = SessionLocal()
+    try:
+        service = PurgeService(db)
+        if board_id is not None:
+            service.purge_board(board_id)
+        if lane_id is not None:
+            service.purge_lanes([lane_id])
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
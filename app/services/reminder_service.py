@@ -0,0 +1,334 @@
+"""
+Reminder Service - Due-date reminders, claimed in batches and fired on time.
+
+Polling ``SELECT ... WHERE due_at < now()`` every minute would scan every
+card that ever had a due date. Instead each card keeps ``remind_at``:
+
+    due_at          while its reminder is pending
+    lease expiry    while a scheduler holds it (claimed, not yet sent)
+    NULL            once sent, or without a future due date
+
+and only non-NULL values are indexed (``ix_tasks_remind_pending``), so a
+claim reads just the reminders still to send.
+
+``python manage.py scheduler`` runs a ``ReminderScheduler``. Every
+``REMINDER_POLL_SECONDS`` it claims the reminders due within the next
+``REMINDER_WINDOW_SECONDS`` in batches (one UPDATE ... WHERE id IN
+(SELECT ... FOR UPDATE SKIP LOCKED), which moves ``remind_at`` to the
+lease expiry) and files them in an in-memory ``TimingWheel``. Each tick
+fires the slot that came due: ``remind_at`` is cleared where it still
+holds that claim's lease, and one ``send_due_reminders`` job (see
+``notification_service``) is queued in the same transaction, so every
+reminder is handed over once, and not at all if its due date was changed
+or its card deleted in the meantime.
+
+Any number of schedulers can share the table: SKIP LOCKED gives them
+disjoint batches without waiting on each other, and the lease keeps a
+claimed reminder away from the others. If a scheduler dies, its claims
+come due again when their lease expires and another one sends them late.
+"""
+
+import math
+import os
+import socket
+import time
+import traceback
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.connection import SessionLocal
+from app.models.board import Board
+from app.models.task import Task
+from app.models.user import User
+from app.services.job_service import JobService
+from app.services.loader import ids_filter
+from app.services.task_query import IN_DELETED_LANE
+
+Entry = Tuple[datetime, int]  # (lease, task id)
+
+
+def remind_at_for(due_at: Optional[datetime], now: Optional[datetime] = None) -> Optional[datetime]:
+    """``remind_at`` for a new due date: pending if it is still ahead, else none."""
+    if due_at is None or due_at <= (now or datetime.now()):
+        return None
+    return due_at
+
+
+class TimingWheel:
+    """
+    Hashed timing wheel: deadlines bucketed into ``slots`` slots of ``tick`` seconds.
+
+    Adding and firing cost O(1) per entry however many are held. An
+    entry fires at the first tick boundary at or after its deadline
+    (never early, at most one tick late); deadlines must lie within the
+    span of the wheel.
+    """
+
+    def __init__(self, tick: float, slots: int, start: float):
+        """
+        Args:
+            tick: Slot width in seconds
+            slots: Number of slots (the wheel spans ``tick * slots`` seconds)
+            start: Current time (``time.time()``)
+        """
+        self.tick = tick
+        self.slots: List[List[Any]] = [[] for _ in range(slots)]
+        self.current = math.ceil(start / tick)  # Next tick to fire
+        self.size = 0
+
+    def add(self, deadline: float, entry: Any) -> None:
+        """File ``entry`` to fire at ``deadline`` (past deadlines fire on the next tick)."""
+        tick = max(math.ceil(deadline / self.tick), self.current)
+        if tick - self.current >= len(self.slots):
+            raise ValueError("Deadline beyond the span of the wheel")
+        self.slots[tick % len(self.slots)].append(entry)
+        self.size += 1
+
+    def advance(self, now: float) -> List[Any]:
+        """Entries of every tick up to ``now``, in deadline order."""
+        last = math.floor(now / self.tick)
+        due: List[Any] = []
+        # Past one revolution every slot has been visited
+        for tick in range(self.current, min(last, self.current + len(self.slots) - 1) + 1):
+            bucket = self.slots[tick % len(self.slots)]
+            due.extend(bucket)
+            bucket.clear()
+        self.current = max(self.current, last + 1)
+        self.size -= len(due)
+        return due
+
+    def drain(self) -> List[Any]:
+        """Remove and return every entry."""
+        entries = [entry for bucket in self.slots for entry in bucket]
+        for bucket in self.slots:
+            bucket.clear()
+        self.size = 0
+        return entries
+
+
+class ReminderService:
+    """Service class for claiming and handing over due reminders."""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def claim(self, horizon: datetime, lease: datetime, limit: int) -> List[Any]:
+        """
+        Claim up to ``limit`` reminders due by ``horizon``, earliest first.
+
+        One UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) over
+        the pending index: rows another scheduler is claiming are skipped,
+        not waited for. Expired leases are due again and claimed too.
+
+        Args:
+            horizon: End of the window to claim
+            lease: Expiry of the claim, stored as ``remind_at`` (later than ``horizon``)
+            limit: Most reminders claimed
+
+        Returns:
+            Rows of (id, due_at)
+        """
+        pending = (
+            select(Task.id)
+            .where(Task.remind_at <= horizon)
+            .order_by(Task.remind_at, Task.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = self.db.execute(
+            update(Task)
+            .where(Task.id.in_(pending.scalar_subquery()))
+            # Bookkeeping only: the card is not edited
+            .values(remind_at=lease, updated_at=Task.updated_at)
+            .returning(Task.id, Task.due_at)
+            .execution_options(synchronize_session=False)
+        ).all()
+        self.db.commit()
+        return rows
+
+    def fire(self, lease: datetime, task_ids: List[int]) -> int:
+        """
+        Mark claimed reminders sent and queue their emails, in one transaction.
+
+        Only rows still holding ``lease`` are sent: a due date changed
+        since the claim reset ``remind_at``, and a deleted card is gone.
+
+        Returns:
+            Reminders queued
+        """
+        sent = self.db.execute(
+            update(Task)
+            .where(ids_filter(self.db, Task.id, task_ids), Task.remind_at == lease)
+            .values(remind_at=None, updated_at=Task.updated_at)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        reminders = self._reminders(sent) if sent else []
+        if reminders:
+            # Commits the UPDATE with the job
+            JobService(self.db).enqueue("send_due_reminders", {"reminders": reminders})
+        else:
+            self.db.commit()
+        return len(reminders)
+
+    def release(self, lease: datetime, task_ids: List[int]) -> int:
+        """Return unsent claims to pending, for another scheduler to pick up now."""
+        result = self.db.execute(
+            update(Task)
+            .where(ids_filter(self.db, Task.id, task_ids), Task.remind_at == lease)
+            .values(remind_at=Task.due_at, updated_at=Task.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def _reminders(self, task_ids: List[int]) -> List[Dict[str, Any]]:
+        """Email fields of the reminders to send (active owners, live boards and lanes)."""
+        rows = self.db.execute(
+            select(Task.id, Task.title, Task.due_at, Board.title.label("board_title"), User.email, User.full_name)
+            .join(Board, Board.id == Task.board_id)
+            .join(User, User.id == Task.owner_id)
+            .where(
+                ids_filter(self.db, Task.id, task_ids),
+                Board.deleted_at.is_(None),
+                ~IN_DELETED_LANE,
+                User.is_active.is_(True)
+            )
+            .order_by(Task.due_at, Task.id)
+        ).all()
+        return [
+            {"task_id": row.id, "title": row.title, "board": row.board_title,
+             "due_at": row.due_at.isoformat(), "email": row.email, "name": row.full_name}
+            for row in rows
+        ]
+
+
+class ReminderScheduler:
+    """Claims reminders one window ahead and fires them from a timing wheel."""
+
+    def __init__(self, window_seconds: Optional[int] = None, poll_seconds: Optional[float] = None,
+                 tick_seconds: Optional[float] = None, batch_size: Optional[int] = None,
+                 lease_seconds: Optional[int] = None, max_pending: Optional[int] = None):
+        """
+        Args:
+            window_seconds: How far ahead reminders are claimed
+            poll_seconds: Pause between claims
+            tick_seconds: Firing precision (slot width of the wheel)
+            batch_size: Reminders per claim statement and per send job
+            lease_seconds: Grace after the window before unsent claims are claimed again
+            max_pending: Most reminders held in memory
+        """
+        self.window_seconds = window_seconds or settings.REMINDER_WINDOW_SECONDS
+        self.poll_seconds = poll_seconds or settings.REMINDER_POLL_SECONDS
+        self.tick_seconds = tick_seconds or settings.REMINDER_TICK_SECONDS
+        self.batch_size = batch_size or settings.REMINDER_BATCH_SIZE
+        self.lease_seconds = lease_seconds or settings.REMINDER_LEASE_SECONDS
+        self.max_pending = max_pending or settings.REMINDER_MAX_PENDING
+        # Claims reach one window past the last claim, which may be one poll ago
+        span = math.ceil((self.window_seconds + self.poll_seconds) / self.tick_seconds) + 2
+        self.wheel = TimingWheel(self.tick_seconds, span, time.time())
+        self.scheduler_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.counts = {"claimed": 0, "sent": 0, "skipped": 0, "released": 0}
+        self.stopping = False
+
+    def claim(self, now: float) -> int:
+        """
+        Claim what comes due within the window, batch by batch, into the wheel.
+
+        Returns:
+            Reminders claimed
+        """
+        horizon = now + self.window_seconds
+        lease = datetime.fromtimestamp(horizon + self.lease_seconds)
+        claimed = 0
+        while self.wheel.size < self.max_pending:
+            limit = min(self.batch_size, self.max_pending - self.wheel.size)
+            db = SessionLocal()
+            try:
+                rows = ReminderService(db).claim(datetime.fromtimestamp(horizon), lease, limit)
+            finally:
+                db.close()
+            for row in rows:
+                deadline = row.due_at.timestamp() if row.due_at else now
+                self.wheel.add(min(deadline, horizon), (lease, row.id))
+            claimed += len(rows)
+            if len(rows) < limit:
+                break
+        self.counts["claimed"] += claimed
+        return claimed
+
+    def fire(self, now: float) -> int:
+        """
+        Send the reminders whose tick has come.
+
+        Returns:
+            Reminders queued
+        """
+        sent = 0
+        for lease, task_ids in self._by_lease(self.wheel.advance(now)):
+            db = SessionLocal()
+            try:
+                queued = ReminderService(db).fire(lease, task_ids)
+            finally:
+                db.close()
+            sent += queued
+            self.counts["sent"] += queued
+            self.counts["skipped"] += len(task_ids) - queued
+        return sent
+
+    def release(self) -> int:
+        """Hand every reminder still in the wheel back to pending."""
+        released = 0
+        for lease, task_ids in self._by_lease(self.wheel.drain()):
+            db = SessionLocal()
+            try:
+                released += ReminderService(db).release(lease, task_ids)
+            finally:
+                db.close()
+        self.counts["released"] += released
+        return released
+
+    def _by_lease(self, entries: List[Entry]):
+        """(lease, task ids) groups of at most ``batch_size``."""
+        groups: Dict[datetime, List[int]] = {}
+        for lease, task_id in entries:
+            groups.setdefault(lease, []).append(task_id)
+        for lease, task_ids in groups.items():
+            for start in range(0, len(task_ids), self.batch_size):
+                yield lease, task_ids[start:start + self.batch_size]
+
+    def run(self, until: Optional[float] = None) -> Dict[str, int]:
+        """
+        Claim and fire until stopped (or until ``time.time()`` passes ``until``).
+
+        Claims not fired by then are released on the way out.
+
+        Returns:
+            Reminders claimed, sent, skipped (changed or deleted since the claim) and released
+        """
+        next_claim = 0.0
+        try:
+            while not self.stopping and (until is None or time.time() < until):
+                now = time.time()
+                try:
+                    if now >= next_claim:
+                        self.claim(now)
+                        next_claim = now + self.poll_seconds
+                    self.fire(time.time())
+                except Exception:
+                    # Unsent claims stay leased and are claimed again later
+                    print(f"Scheduler {self.scheduler_id} step failed:\n{traceback.format_exc()}")
+                    next_claim = time.time() + self.poll_seconds
+                wake = min(next_claim, self.wheel.current * self.tick_seconds)
+                time.sleep(max(0.0, wake - time.time()))
+        finally:
+            self.release()
+        return self.counts
@@ -0,0 +1,230 @@
+"""
+Search Service - Full-text search over task titles and descriptions.
+
+Backed by the search index declared next to the Task model:
+    - PostgreSQL: ``tasks.search_vector`` (tsvector, GIN), ranked with ts_rank_cd
+    - SQLite: ``tasks_fts`` (FTS5), ranked with bm25
+
+Results are ordered by relevance and paginated with a keyset cursor on
+``(rank, id)``, so every page is an index-driven query scoped to the
+boards the user can see.
+
+Archived tasks (``tasks_archive``) are searched separately and on demand,
+newest archive first.
+"""
+
+import re
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, column, func, literal_column, or_, select, table
+from sqlalchemy.orm import Session
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.task import Task, ArchivedTask, TASK_SEARCH_VECTOR
+from app.schemas.task import TaskResponse, TaskSearchHit
+from app.services.permission_service import PermissionResolver
+from app.services.task_query import IN_DELETED_LANE
+
+MAX_TERMS = 8
+
+
+def _terms(query: str) -> List[str]:
+    """Split user input into plain word tokens (no operator syntax reaches the engine)."""
+    return re.findall(r"[^\W_]+", query.lower())[:MAX_TERMS]
+
+
+class SearchService:
+    """Service class for task search."""
+
+    def __init__(self, db: Session, user_id: int):
+        self.db = db
+        self.user_id = user_id
+        self.permissions = PermissionResolver(db, user_id)
+
+    def _match(self, terms: List[str]):
+        """
+        Build the dialect-specific match predicate and relevance score.
+
+        Every term must match; the last term also matches as a prefix so
+        search-as-you-type works.
+
+        Returns:
+            Tuple of (select statement, score expression)
+        """
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            tsquery = func.to_tsquery(
+                "english", " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+            )
+            vector = literal_column("tasks.search_vector")
+            score = func.ts_rank_cd(vector, tsquery)
+            stmt = select(Task, score.label("rank")).where(vector.op("@@")(tsquery))
+            return stmt, score
+
+        if dialect == "sqlite":
+            fts = table("tasks_fts", column("rowid"))
+            expression = " ".join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+            # bm25 is "lower is better"; negate so both backends rank descending
+            score = -func.bm25(literal_column("tasks_fts"))
+            stmt = (
+                select(Task, score.label("rank"))
+                .join(fts, fts.c.rowid == Task.id)
+                .where(literal_column("tasks_fts").op("MATCH")(expression))
+            )
+            return stmt, score
+
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"Search is not supported on {dialect}"
+        )
+
+    def search_tasks(
+        self,
+        query: str,
+        board_id: Optional[int] = None,
+        lane_id: Optional[int] = None,
+        min_priority: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """
+        Search the user's tasks.
+
+        Args:
+            query: Free text; every word must match
+            board_id: Restrict to one board
+            lane_id: Restrict to one lane
+            min_priority: Only tasks with priority >= this value
+            limit: Page size
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Dictionary with ``items`` (best match first) and ``next_cursor``
+
+        Raises:
+            HTTPException 400: If the query has no searchable words or the cursor is invalid
+            HTTPException 404: If ``board_id`` is not visible to the user
+        """
+        terms = _terms(query)
+        if not terms:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search query must contain at least one word."
+            )
+
+        if board_id is not None:
+            self.permissions.require(board_id)
+            board_ids = [board_id]
+        else:
+            board_ids = self.permissions.board_ids()
+        if not board_ids:
+            return {"items": [], "next_cursor": None}
+
+        stmt, score = self._match(terms)
+        stmt = stmt.where(Task.board_id.in_(board_ids), ~IN_DELETED_LANE)
+        if lane_id is not None:
+            stmt = stmt.where(Task.lane_id == lane_id)
+        if min_priority is not None:
+            stmt = stmt.where(Task.priority >= min_priority)
+
+        after = decode_cursor(cursor, 2)
+        if after:
+            try:
+                last_rank, last_id = float(after[0]), int(after[1])
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+            stmt = stmt.where(or_(
+                score < last_rank,
+                and_(score == last_rank, Task.id < last_id)
+            ))
+
+        rows = self.db.execute(
+            stmt.order_by(score.desc(), Task.id.desc()).limit(limit + 1)
+        ).all()
+
+        items = [
+            TaskSearchHit(**TaskResponse.model_validate(task).model_dump(), rank=rank)
+            for task, rank in rows[:limit]
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last_task, last_rank = rows[limit - 1]
+            next_cursor = encode_cursor([last_rank, last_task.id])
+        return {"items": items, "next_cursor": next_cursor}
+
+    def _match_archive(self, terms: List[str]):
+        """Match predicate over tasks_archive (expression GIN on PostgreSQL, LIKE elsewhere)."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            tsquery = func.to_tsquery(
+                "english", " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+            )
+            return literal_column(f"({TASK_SEARCH_VECTOR})").op("@@")(tsquery)
+
+        return and_(*[
+            or_(ArchivedTask.title.ilike(f"%{term}%"), ArchivedTask.description.ilike(f"%{term}%"))
+            for term in terms
+        ])
+
+    def search_archive(
+        self,
+        query: Optional[str] = None,
+        board_id: Optional[int] = None,
+        lane_id: Optional[int] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """
+        Search (or browse, without ``query``) archived tasks.
+
+        Args:
+            query: Free text; every word must match
+            board_id: Restrict to one board
+            lane_id: Restrict to the lane the task was archived from
+            limit: Page size
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Dictionary with ``items`` (most recently archived first) and ``next_cursor``
+
+        Raises:
+            HTTPException 400: If the cursor is invalid
+            HTTPException 404: If ``board_id`` is not visible to the user
+        """
+        if board_id is not None:
+            self.permissions.require(board_id)
+            board_ids = [board_id]
+        else:
+            board_ids = self.permissions.board_ids()
+        if not board_ids:
+            return {"items": [], "next_cursor": None}
+
+        stmt = select(ArchivedTask).where(ArchivedTask.board_id.in_(board_ids))
+        terms = _terms(query or "")
+        if terms:
+            stmt = stmt.where(self._match_archive(terms))
+        if lane_id is not None:
+            stmt = stmt.where(ArchivedTask.lane_id == lane_id)
+
+        after = decode_cursor(cursor, 2)
+        if after:
+            try:
+                last_archived, last_id = datetime.fromisoformat(after[0]), int(after[1])
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+            stmt = stmt.where(or_(
+                ArchivedTask.archived_at < last_archived,
+                and_(ArchivedTask.archived_at == last_archived, ArchivedTask.id < last_id)
+            ))
+
+        rows = self.db.execute(
+            stmt.order_by(ArchivedTask.archived_at.desc(), ArchivedTask.id.desc()).limit(limit + 1)
+        ).scalars().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor([last.archived_at.isoformat(), last.id])
+        return {"items": rows[:limit], "next_cursor": next_cursor}
@@ -0,0 +1,226 @@
+"""
+Snapshot Service - Cached, precompressed read model of a whole board.
+
+``GET /boards/{id}`` returns the board with every lane and card, the most
+expensive read in the API and the one every open browser tab polls. Large
+boards serialize to hundreds of KB, so the response body is built once per
+board version and stored ready to send: the JSON bytes and one compressed
+copy per encoding (see ``app/core/content_encoding.py``) under
+
+    snapshot:board:{board_id}:{version}:{encoding}
+
+A request picks the variant its ``Accept-Encoding`` prefers and gets those
+bytes from Redis as they are: no validation, serialization or compression
+per request. A small manifest (``snapshot:board:{board_id}:{version}``,
+the encodings stored) goes through ``cached()``, so when a new version is
+first read one worker builds the variants while the others wait for it,
+and when a hot manifest nears expiry its variants are kept alive (their
+TTL extended) without rebuilding anything (see ``app/core/cache.py``).
+
+The version lives in Redis (``board:version:{board_id}``, in the ``board``
+near-cache namespace; snapshots are too large to keep in process)
+and is bumped after every committed change to the board, its lanes or
+its cards; a new version is a new key, so readers never see a snapshot
+older than their own write. Access is checked before the snapshot is
+read, and the snapshot itself is the same for every user. If Redis is
+unavailable the board is loaded from the database and sent uncompressed
+on every request.
+
+A bump that fails after a committed change (Redis down or timing out)
+leaves the old snapshot current, so the board is kept in a per-process
+pending set: this worker serves it from the database and retries the
+bump before every snapshot read until it lands. Other workers cannot
+read the old snapshot while Redis is unreachable; once it is back, they
+serve it only until the next snapshot read on the worker that holds the
+pending bump.
+"""
+
+import asyncio
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from fastapi import Response
+from sqlalchemy.orm import selectinload
+
+from app.core.cache import aget_raw, aget_raw_many, cached, get_counter, incr_counter, set_raw, touch_raw
+from app.core.config import settings
+from app.core.content_encoding import ENCODERS, IDENTITY, encode_variants, json_body, negotiate
+from app.db.connection import SessionLocal
+from app.models.board import Board, Lane
+from app.schemas.board import BoardResponse
+
+
+def _version_key(board_id: int) -> str:
+    return f"board:version:{board_id}"
+
+
+# Boards whose version bump failed and must be retried (see module docstring)
+_pending: Set[int] = set()
+_pending_lock = threading.Lock()
+
+
+def _snapshot_key(board_id: int, version: int) -> str:
+    return f"snapshot:board:{board_id}:{version}"
+
+
+def _variant_key(board_id: int, version: int, encoding: str) -> str:
+    return f"snapshot:board:{board_id}:{version}:{encoding}"
+
+
+def _variant_ttl() -> float:
+    # Variants outlive the manifest that lists them, stale window included
+    return settings.CACHE_EXPIRE_MINUTES * 60 + settings.CACHE_STALE_SECONDS
+
+
+def _body(content: bytes, encoding: str) -> Response:
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+class BoardSnapshot:
+    """The ``BoardResponse`` of a board, stored precompressed per board version."""
+
+    @staticmethod
+    def load(board_id: int) -> Optional[dict]:
+        """
+        Build the snapshot from the database (four queries).
+
+        Opens its own session: the load may finish after the request that
+        started it (background refresh).
+
+        Returns:
+            Dictionary matching ``BoardResponse``, or None if the board is gone
+        """
+        db = SessionLocal()
+        try:
+            board = (
+                db.query(Board)
+                .options(selectinload(Board.lanes).selectinload(Lane.tasks), selectinload(Board.labels))
+                .filter(Board.id == board_id, Board.deleted_at.is_(None))
+                .first()
+            )
+            if board is None:
+                return None
+            return BoardResponse.model_validate(board).model_dump(mode="json")
+        finally:
+            db.close()
+
+    @classmethod
+    def build(cls, board_id: int, version: int) -> Optional[Dict[str, bytes]]:
+        """
+        Load the board, encode its body once per encoding and store every variant.
+
+        Returns:
+            ``{encoding: body}``, or None if the board is gone
+        """
+        snapshot = cls.load(board_id)
+        if snapshot is None:
+            return None
+        variants = encode_variants(json_body(snapshot))
+        set_raw(
+            {_variant_key(board_id, version, encoding): body for encoding, body in variants.items()},
+            _variant_ttl()
+        )
+        return variants
+
+    @classmethod
+    def _manifest(cls, board_id: int, version: int) -> Optional[dict]:
+        """
+        ``cached()`` loader: the encodings stored for this version.
+
+        Variants that are still in Redis are only given a new TTL: the
+        body cannot change within a version, so it is compressed again
+        only if they were evicted.
+        """
+        wanted = [IDENTITY] + [encoding for encoding in settings.SNAPSHOT_ENCODINGS if encoding in ENCODERS]
+        keys = {_variant_key(board_id, version, encoding): encoding for encoding in wanted}
+        kept = touch_raw(keys, _variant_ttl())
+        if _variant_key(board_id, version, IDENTITY) in kept:
+            return {"encodings": [keys[key] for key in keys if key in kept]}
+        variants = cls.build(board_id, version)
+        return None if variants is None else {"encodings": list(variants)}
+
+    @classmethod
+    async def respond(cls, board_id: int, accept_encoding: Optional[str] = None) -> Optional[Response]:
+        """
+        The snapshot response of a board (the caller has checked access).
+
+        Args:
+            board_id: Board ID
+            accept_encoding: The request's ``Accept-Encoding`` header
+
+        Returns:
+            JSON response in the best encoding both sides support, or None if the board is gone
+        """
+        version = None if _pending and board_id in cls.retry_pending() else get_counter(_version_key(board_id))
+        if version is None:
+            snapshot = await asyncio.to_thread(cls.load, board_id)
+            return None if snapshot is None else _body(json_body(snapshot), IDENTITY)
+
+        manifest = await cached(_snapshot_key(board_id, version), lambda: cls._manifest(board_id, version))
+        if manifest is None:
+            return None
+        encoding = negotiate(accept_encoding, manifest["encodings"])
+        content = await aget_raw(_variant_key(board_id, version, encoding))
+        if content is None:
+            # Evicted since the manifest was read (or Redis just went away)
+            variants = await asyncio.to_thread(cls.build, board_id, version)
+            if variants is None:
+                return None
+            encoding = negotiate(accept_encoding, variants)
+            content = variants[encoding]
+        return _body(content, encoding)
+
+    @classmethod
+    async def bodies(cls, board_ids: List[int]) -> Dict[int, bytes]:
+        """
+        Uncompressed JSON of the boards whose current version is already built.
+
+        One MGET for all of them; nothing is loaded or built here, the
+        caller loads the rest (e.g. through ``RequestLoaders``).
+
+        Returns:
+            ``{board_id: body}`` for the boards found
+        """
+        keys = {}
+        pending = cls.retry_pending() if _pending else set()
+        for board_id in set(board_ids) - pending:
+            version = get_counter(_version_key(board_id))
+            if version is not None:
+                keys[_variant_key(board_id, version, IDENTITY)] = board_id
+        found = await aget_raw_many(keys)
+        return {keys[key]: body for key, body in found.items()}
+
+    @classmethod
+    def invalidate(cls, board_ids: Iterable[Optional[int]]) -> None:
+        """
+        Bump the version of every affected board.
+
+        Call after the change is committed, so a reader that sees the new
+        version also sees the change. Boards whose bump fails are retried
+        by ``retry_pending``.
+        """
+        failed = {
+            board_id for board_id in set(board_ids)
+            if board_id is not None and incr_counter(_version_key(board_id)) is None
+        }
+        if failed:
+            with _pending_lock:
+                _pending.update(failed)
+
+    @classmethod
+    def retry_pending(cls) -> Set[int]:
+        """
+        Retry the version bumps that failed in this process.
+
+        Returns:
+            Boards still pending (their stored snapshot may be stale)
+        """
+        with _pending_lock:
+            board_ids = list(_pending)
+        bumped = {board_id for board_id in board_ids if incr_counter(_version_key(board_id)) is not None}
+        with _pending_lock:
+            _pending.difference_update(bumped)
+            return set(_pending)
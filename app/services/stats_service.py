@@ -0,0 +1,187 @@
+"""
+Stats Service - Board analytics from precomputed counters.
+
+``board_task_counts`` holds one row per (board, lane, priority) with the
+number of live cards. Every write that changes those counts applies its
+delta with an upsert in the writer's own transaction (``TaskService``,
+``ArchiveService``), so counters and cards commit or roll back together.
+``board_flow_snapshots`` copies the per-lane counts once per day for
+cumulative-flow charts.
+
+Reading a board's stats touches its lanes' counter rows and snapshot
+rows only, never ``tasks``. ``rebuild`` recounts from ``tasks`` to
+backfill or repair drift (e.g. after bulk loads that bypass the services).
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import and_, delete, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.db.connection import SessionLocal
+from app.models.board import Lane, BoardTaskCount, BoardFlowSnapshot
+from app.models.task import Task
+
+# (board_id, lane_id, priority) -> change in card count
+CountDeltas = Dict[Tuple[int, int, int], int]
+
+
+def count_key(board_id: int, lane_id: int, priority: Optional[int]) -> Tuple[int, int, int]:
+    """Counter key of a card (cards without a priority count under 0)."""
+    return board_id, lane_id, priority or 0
+
+
+class StatsService:
+    """Service class for board counters and cumulative-flow snapshots."""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def _insert(self, model):
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(model)
+        if dialect == "sqlite":
+            return sqlite.insert(model)
+        raise NotImplementedError(f"Board counters need upserts, not supported on {dialect}")
+
+    def apply(self, deltas: CountDeltas) -> None:
+        """
+        Add ``deltas`` to the counters; the caller commits.
+
+        One upsert statement for all keys, so a move (-1 old lane, +1 new)
+        costs a single round trip.
+        """
+        rows = [
+            {"board_id": board_id, "lane_id": lane_id, "priority": priority, "count": delta}
+            for (board_id, lane_id, priority), delta in deltas.items()
+            if delta and board_id is not None and lane_id is not None
+        ]
+        if not rows:
+            return
+        stmt = self._insert(BoardTaskCount)
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["board_id", "lane_id", "priority"],
+                set_={"count": BoardTaskCount.count + stmt.excluded.count},
+            ),
+            rows,
+        )
+
+    def rebuild(self, board_id: Optional[int] = None) -> int:
+        """
+        Recount cards from ``tasks`` (all boards, or one) and replace the counters.
+
+        Returns:
+            Counter rows written
+        """
+        priority = func.coalesce(Task.priority, 0)
+        counts = (
+            select(Task.board_id, Task.lane_id, priority, func.count())
+            .where(Task.board_id.is_not(None), Task.lane_id.is_not(None))
+            .group_by(Task.board_id, Task.lane_id, priority)
+        )
+        clear = delete(BoardTaskCount)
+        if board_id is not None:
+            counts = counts.where(Task.board_id == board_id)
+            clear = clear.where(BoardTaskCount.board_id == board_id)
+        self.db.execute(clear.execution_options(synchronize_session=False))
+        result = self.db.execute(
+            self._insert(BoardTaskCount).from_select(["board_id", "lane_id", "priority", "count"], counts)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def snapshot(self, day: Optional[date] = None) -> int:
+        """
+        Record every live lane's card count for ``day`` (default today).
+
+        Rerunning on the same day overwrites that day's point, so the job
+        can run as often as wanted; the last run of a day wins.
+
+        Returns:
+            Snapshot rows written
+        """
+        day = day or date.today()
+        stmt = self._insert(BoardFlowSnapshot)
+        per_lane = (
+            select(BoardTaskCount.board_id, literal(day, BoardFlowSnapshot.day.type),
+                   BoardTaskCount.lane_id, func.sum(BoardTaskCount.count))
+            .join(Lane, Lane.id == BoardTaskCount.lane_id)
+            .where(Lane.deleted_at.is_(None))
+            .group_by(BoardTaskCount.board_id, BoardTaskCount.lane_id)
+        )
+        result = self.db.execute(
+            stmt.from_select(["board_id", "day", "lane_id", "count"], per_lane)
+            .on_conflict_do_update(
+                index_elements=["board_id", "day", "lane_id"],
+                set_={"count": stmt.excluded.count},
+            )
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def board_stats(self, board_id: int, days: int = 30) -> dict:
+        """
+        Lane counts, priority distribution and cumulative flow of one board.
+
+        Args:
+            board_id: Board to describe (access is checked by the caller)
+            days: Days of flow history to include
+
+        Returns:
+            Dictionary matching ``BoardStatsResponse``
+        """
+        rows = self.db.execute(
+            select(Lane.id, Lane.title, Lane.position, BoardTaskCount.priority, BoardTaskCount.count)
+            .outerjoin(BoardTaskCount, and_(
+                BoardTaskCount.board_id == board_id, BoardTaskCount.lane_id == Lane.id
+            ))
+            .where(Lane.board_id == board_id, Lane.deleted_at.is_(None))
+            .order_by(Lane.position, Lane.id)
+        ).all()
+
+        lanes: Dict[int, dict] = {}
+        priorities: Dict[int, int] = defaultdict(int)
+        for lane_id, title, position, priority, count in rows:
+            lane = lanes.setdefault(lane_id, {"lane_id": lane_id, "title": title, "position": position, "count": 0})
+            if count:
+                lane["count"] += count
+                priorities[priority] += count
+
+        flow: Dict[date, Dict[int, int]] = {}
+        for day, lane_id, count in self.db.execute(
+            select(BoardFlowSnapshot.day, BoardFlowSnapshot.lane_id, BoardFlowSnapshot.count)
+            .where(BoardFlowSnapshot.board_id == board_id,
+                   BoardFlowSnapshot.day >= date.today() - timedelta(days=days))
+            .order_by(BoardFlowSnapshot.day)
+        ):
+            if lane_id in lanes:
+                flow.setdefault(day, {})[lane_id] = count
+
+        return {
+            "board_id": board_id,
+            "total": sum(lane["count"] for lane in lanes.values()),
+            "lanes": list(lanes.values()),
+            "priorities": dict(sorted(priorities.items())),
+            "flow": [{"day": day, "counts": counts} for day, counts in flow.items()],
+        }
+
+
+def snapshot_board_stats() -> int:
+    """Job entry point (``snapshot_stats``); opens its own session."""
+    db = SessionLocal()
+    try:
+        return StatsService(db).snapshot()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
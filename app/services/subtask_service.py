@@ -0,0 +1,298 @@
+"""
+Subtask Service - Nested checklists on cards, read and moved a subtree at a time.
+
+Items are stored with a materialized path (``Subtask.path``, the ids of
+the item's ancestors: ``"12/34/"``), so
+
+    a card's tree         WHERE task_id = ? ORDER BY path
+    an item's subtree     WHERE id = x OR task_id = ? AND path >= 'p/x/' AND path < 'p/x0'
+
+are each one range of ``ix_subtasks_task_path`` (plus a primary-key
+lookup for the item) however deep the tree, and progress counts are
+added up from the same rows. The trees of a whole page of cards come
+from one ``task_id IN (...)`` query (``expand``), instead of a lazy
+load per item and level.
+
+Moving an item, within its card or to another one, rewrites the path
+prefix (and card) of its whole subtree in one UPDATE; deleting one
+removes its subtree in one DELETE. Both lock the item first, and writes
+that add under an item share-lock its branch (the item and its
+ancestors), so a concurrent move or delete of an ancestor waits for
+them or is seen by them, never half of each.
+
+Items take the permissions of their card: reading needs access to its
+board, changes need editor. They are not part of board snapshots.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, case, delete, func, literal, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.task import Subtask, Task
+from app.schemas.task import SubtaskCreate, SubtaskMove, SubtaskUpdate
+from app.services.audit_service import audit_log
+from app.services.loader import ids_filter
+from app.services.permission_service import PermissionResolver
+from app.services.task_query import IN_DELETED_LANE
+
+# Sorts right after "/": paths below "p/x/" are exactly those in ["p/x/", "p/x0")
+_PATH_END = chr(ord("/") + 1)
+
+
+def subtree_filter(item: Subtask):
+    """WHERE clause for ``item`` and every item nested below it."""
+    prefix = f"{item.path}{item.id}/"
+    # Two index lookups: the item by primary key, the rest as one range of the card's paths
+    return or_(
+        Subtask.id == item.id,
+        and_(Subtask.task_id == item.task_id, Subtask.path >= prefix, Subtask.path < prefix[:-1] + _PATH_END)
+    )
+
+
+def build_tree(items) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Nest the items of one card and count progress at every level.
+
+    Args:
+        items: ``(id, task_id, path, title, done, position)`` rows
+
+    Returns:
+        (top-level nodes with nested ``children``, ``{done, total}`` over all items)
+    """
+    nodes = {}  # Path of an item's children ("p/x/") -> (item's path, its node)
+    done = 0
+    for item_id, task_id, path, title, item_done, position in items:
+        nodes[f"{path}{item_id}/"] = (path, {
+            "id": item_id, "task_id": task_id, "parent_id": None, "title": title, "done": item_done,
+            "position": position, "progress": {"done": 0, "total": 0}, "children": [],
+        })
+        done += bool(item_done)
+    roots = []
+    # A path extends its ancestors' paths, so in reverse order every node
+    # comes before its parent, with its own counts already complete
+    for path, node in sorted(nodes.values(), key=lambda entry: entry[0], reverse=True):
+        parent = nodes.get(path)
+        if parent is None:
+            roots.append(node)
+            continue
+        parent = parent[1]
+        node["parent_id"] = parent["id"]
+        parent["children"].append(node)
+        parent["progress"]["total"] += 1 + node["progress"]["total"]
+        parent["progress"]["done"] += bool(node["done"]) + node["progress"]["done"]
+    for _, node in nodes.values():
+        node["children"].sort(key=lambda child: (child["position"], child["id"]))
+    roots.sort(key=lambda node: (node["position"], node["id"]))
+    return roots, {"done": done, "total": len(nodes)}
+
+
+class SubtaskService:
+    """Service class for the checklists of cards."""
+
+    def __init__(self, db: Session, user_id: int):
+        """
+        Args:
+            db: SQLAlchemy database session
+            user_id: Current user
+        """
+        self.db = db
+        self.user_id = user_id
+        self.permissions = PermissionResolver(db, user_id)
+
+    def _card_board_id(self, task_id: int, min_role: str = "viewer", lock: bool = False) -> int:
+        """
+        Board of a card the user may read (or change, with ``min_role="editor"``).
+
+        ``lock`` share-locks the card so it cannot be deleted before the
+        caller commits the items it adds.
+        """
+        stmt = select(Task.board_id).where(
+            Task.id == task_id,
+            Task.board_id.in_(self.permissions.board_ids()),
+            ~IN_DELETED_LANE
+        )
+        if lock:
+            stmt = stmt.with_for_update(read=True)
+        board_id = self.db.execute(stmt).scalar()
+        if board_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+        self.permissions.require(board_id, min_role=min_role)
+        return board_id
+
+    def _item(self, subtask_id: int, lock: bool = False) -> Tuple[Subtask, int]:
+        """An item the user may change, with its card's board id; ``lock`` locks it for update."""
+        stmt = (
+            select(Subtask, Task.board_id)
+            .join(Task, and_(Task.id == Subtask.task_id, Task.board_id.in_(self.permissions.board_ids())))
+            .where(Subtask.id == subtask_id, ~IN_DELETED_LANE)
+        )
+        if lock:
+            stmt = stmt.with_for_update(of=Subtask)
+        row = self.db.execute(stmt).first()
+        if not row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
+        self.permissions.require(row.board_id, min_role="editor")
+        return row.Subtask, row.board_id
+
+    def _lock_branch(self, item: Subtask) -> Subtask:
+        """
+        Share-lock ``item`` and its ancestors, then re-read it.
+
+        A move or delete of any of them holds that row's update lock, so
+        this waits for it to commit and sees where the branch went.
+
+        Raises:
+            HTTPException 404: If the item was deleted meanwhile
+        """
+        branch = [int(part) for part in item.path.split("/") if part] + [item.id]
+        self.db.execute(select(Subtask.id).where(Subtask.id.in_(branch)).with_for_update(read=True)).all()
+        current = self.db.execute(
+            select(Subtask).where(Subtask.id == item.id).execution_options(populate_existing=True)
+        ).scalar()
+        if current is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
+        return current
+
+    def _check_depth(self, depth: int) -> None:
+        if depth >= settings.SUBTASK_MAX_DEPTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Subtasks nest at most {settings.SUBTASK_MAX_DEPTH} levels deep"
+            )
+
+    def load_trees(self, task_ids: List[int]) -> Dict[int, Tuple[List[Dict[str, Any]], Dict[str, int]]]:
+        """
+        Subtask trees of several cards in one query (no permission check).
+
+        Returns:
+            ``{task_id: (top-level nodes, progress)}`` for every id given
+        """
+        # Plain rows: thousands of items need no identity map
+        items = self.db.execute(
+            select(Subtask.id, Subtask.task_id, Subtask.path, Subtask.title, Subtask.done, Subtask.position)
+            .where(ids_filter(self.db, Subtask.task_id, task_ids))
+            .order_by(Subtask.task_id, Subtask.path)
+        ).all()
+        by_card: Dict[int, list] = {}
+        for item in items:
+            by_card.setdefault(item.task_id, []).append(item)
+        return {task_id: build_tree(by_card.get(task_id, [])) for task_id in task_ids}
+
+    def expand(self, tasks: List[Task]) -> List[Task]:
+        """Attach ``subtasks`` and ``progress`` (see TaskResponse) to cards already authorized."""
+        trees = self.load_trees([task.id for task in tasks]) if tasks else {}
+        for task in tasks:
+            task.subtasks, task.progress = trees[task.id]
+        return tasks
+
+    def get_tree(self, task_id: int) -> Dict[str, Any]:
+        """
+        Every item of a card, nested, with progress counts.
+
+        Returns:
+            Dictionary with ``items`` (top level) and ``progress``
+        """
+        self._card_board_id(task_id)
+        items, progress = self.load_trees([task_id])[task_id]
+        return {"items": items, "progress": progress}
+
+    def create_subtask(self, task_id: int, data: SubtaskCreate) -> Subtask:
+        """
+        Add an item to a card, at the top level or under ``data.parent_id``.
+
+        Raises:
+            HTTPException 400: If the parent is on another card or nesting gets too deep
+        """
+        board_id = self._card_board_id(task_id, min_role="editor", lock=True)
+        path = ""
+        if data.parent_id is not None:
+            parent = self._lock_branch(self._item(data.parent_id)[0])
+            if parent.task_id != task_id:
+                raise HTTPException(status_code=400, detail="The parent item belongs to another card")
+            path = f"{parent.path}{parent.id}/"
+        self._check_depth(path.count("/"))
+
+        item = Subtask(task_id=task_id, path=path, title=data.title, done=data.done, position=data.position)
+        self.db.add(item)
+        self.db.commit()
+        self.db.refresh(item)
+        audit_log.record("subtask.created", board_id, self.user_id, task_id=task_id,
+                         data={"subtask_id": item.id, "title": item.title})
+        return item
+
+    def update_subtask(self, subtask_id: int, data: SubtaskUpdate) -> Subtask:
+        item, board_id = self._item(subtask_id)
+        update_data = data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            if value is not None:
+                setattr(item, field, value)
+
+        self.db.commit()
+        self.db.refresh(item)
+        audit_log.record("subtask.updated", board_id, self.user_id, task_id=item.task_id,
+                         data={"subtask_id": item.id, "fields": sorted(update_data)})
+        return item
+
+    def move_subtask(self, subtask_id: int, move: SubtaskMove) -> Subtask:
+        """
+        Move an item and everything nested below it in one UPDATE.
+
+        The subtree's path prefix is swapped for the new parent's and its
+        card changed if need be; the rows keep their order and progress.
+
+        Raises:
+            HTTPException 400: If the target is inside the item, the parent
+                is not on ``move.task_id``, or nesting gets too deep
+        """
+        item, board_id = self._item(subtask_id, lock=True)
+        parent = None
+        if move.parent_id is not None:
+            parent = self._lock_branch(self._item(move.parent_id)[0])
+            if item.id in [int(part) for part in parent.path.split("/") if part] + [parent.id]:
+                raise HTTPException(status_code=400, detail="An item cannot move under itself")
+            if move.task_id is not None and parent.task_id != move.task_id:
+                raise HTTPException(status_code=400, detail="The parent item belongs to another card")
+        task_id = parent.task_id if parent else (move.task_id or item.task_id)
+        path = f"{parent.path}{parent.id}/" if parent else ""
+        if task_id != item.task_id:
+            board_id = self._card_board_id(task_id, min_role="editor", lock=True)
+
+        if path.count("/") > item.depth:
+            # Moving down: the deepest item below (slashes in its path) must still fit
+            depth = func.length(Subtask.path) - func.length(func.replace(Subtask.path, "/", ""))
+            deepest = self.db.execute(select(func.max(depth)).where(subtree_filter(item))).scalar()
+            self._check_depth(path.count("/") + deepest - item.depth)
+
+        from_task_id = item.task_id
+        moved = self.db.execute(
+            update(Subtask)
+            .where(subtree_filter(item))
+            .values(
+                task_id=task_id,
+                path=literal(path) + func.substr(Subtask.path, len(item.path) + 1),
+                position=case((Subtask.id == item.id, move.position), else_=Subtask.position),
+                # Only the moved item changed; the rest just came along
+                updated_at=case((Subtask.id == item.id, func.now()), else_=Subtask.updated_at)
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.commit()
+        self.db.refresh(item)
+        audit_log.record("subtask.moved", board_id, self.user_id, task_id=task_id,
+                         data={"subtask_id": item.id, "from_task": from_task_id, "items": moved})
+        return item
+
+    def delete_subtask(self, subtask_id: int) -> dict:
+        """Delete an item and everything nested below it in one DELETE."""
+        item, board_id = self._item(subtask_id, lock=True)
+        task_id = item.task_id
+        removed = self.db.execute(
+            delete(Subtask).where(subtree_filter(item)).execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.commit()
+        audit_log.record("subtask.deleted", board_id, self.user_id, task_id=task_id,
+                         data={"subtask_id": subtask_id, "items": removed})
+        return {"message": "Subtask deleted"}
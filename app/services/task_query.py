@@ -0,0 +1,228 @@
+"""
+Task Query Builder - Filtered and sorted task listings.
+
+Only filter/sort combinations that a composite index on ``tasks`` can
+serve directly are accepted. Each ``IndexPlan`` names an index laid out
+as ``(equality columns..., order column, id)``; a request matches a plan
+when its equality filters are exactly the plan's equality columns, its
+range filter (if any) and its sort are both on the plan's order column.
+Such a query is a single index range scan that stops after ``limit``
+rows, including on deep pages thanks to the ``(order column, id)``
+keyset cursor. Every plan is scoped to one board (directly or through
+its lane), so access checks never widen the scan.
+
+``labels`` (cards carrying all of the given labels) combines with any
+plan. On PostgreSQL it is ``label_ids @> ARRAY[...]`` over the GIN index
+``ix_tasks_label_ids``: the planner either walks the plan's index and
+checks each card, or, for rare labels, reads the matching cards from the
+GIN index and sorts just those. Label ids belong to one board, so the
+GIN lookup never reaches other boards' cards. SQLite checks each card of
+the plan's range with ``json_each``.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, and_, bindparam, exists, func, or_, select, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import Select
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.board import Lane
+from app.models.task import Task
+
+# Tasks of a soft-deleted lane stay in the table until the purge job removes
+# them; reads and writes exclude them with this correlated primary-key probe.
+IN_DELETED_LANE = select(Lane.id).where(
+    Lane.id == Task.lane_id, Lane.deleted_at.is_not(None)
+).exists()
+
+# Equality filters map to their column; range filters to the column they bound
+EQUALITY_FILTERS = {"board_id": Task.board_id, "lane_id": Task.lane_id, "owner_id": Task.owner_id}
+RANGE_FILTERS = {"min_priority": "priority", "updated_since": "updated_at"}
+LABEL_FILTER = "labels"
+SORT_COLUMNS = {
+    "position": Task.position,
+    "priority": Task.priority,
+    "updated_at": Task.updated_at,
+    "created_at": Task.created_at,
+}
+
+
+@dataclass(frozen=True)
+class IndexPlan:
+    """A composite index and the query shape it serves."""
+    index: str
+    equality: FrozenSet[str]
+    order: str
+    default_descending: bool = True
+
+
+INDEX_PLANS: Tuple[IndexPlan, ...] = (
+    IndexPlan("ix_tasks_lane_position", frozenset({"lane_id"}), "position", default_descending=False),
+    IndexPlan("ix_tasks_board_updated", frozenset({"board_id"}), "updated_at"),
+    IndexPlan("ix_tasks_board_priority", frozenset({"board_id"}), "priority"),
+    IndexPlan("ix_tasks_board_created", frozenset({"board_id"}), "created_at"),
+    IndexPlan("ix_tasks_board_owner_updated", frozenset({"board_id", "owner_id"}), "updated_at"),
+)
+
+
+def labels_filter(dialect: str, label_ids: List[int], column=Task.label_ids):
+    """
+    Cards carrying every label in ``label_ids``.
+
+    Args:
+        dialect: Database dialect name
+        label_ids: Label ids (all required)
+        column: Label id column (``ArchivedTask.label_ids`` for archived cards)
+
+    Returns:
+        SQL expression for a WHERE clause
+    """
+    if dialect == "postgresql":
+        return type_coerce(column, ARRAY(Integer)).contains(
+            bindparam(None, list(label_ids), type_=ARRAY(Integer))
+        )
+    probes = []
+    for label_id in label_ids:
+        labels = func.json_each(column).table_valued("value")
+        probes.append(exists(select(1).select_from(labels).where(labels.c.value == label_id)))
+    return and_(*probes)
+
+
+def _describe(plan: IndexPlan) -> str:
+    ranges = [name for name, column in RANGE_FILTERS.items() if column == plan.order]
+    extra = f" [+{ranges[0]}]" if ranges else ""
+    return f"{'+'.join(sorted(plan.equality))}{extra} sort=[-]{plan.order}"
+
+
+class TaskQuery:
+    """
+    Validated task listing query.
+
+    Args:
+        filters: Mapping of filter name to value (None values are ignored)
+        sort: Sort key, optionally prefixed with "-" for descending
+        dialect: Database dialect name (for the labels filter)
+
+    Raises:
+        HTTPException 400: If no index serves the combination
+    """
+
+    def __init__(self, filters: Dict[str, object], sort: Optional[str] = None, dialect: str = "postgresql"):
+        self.filters = {name: value for name, value in filters.items() if value is not None}
+        self.dialect = dialect
+        unknown = set(self.filters) - set(EQUALITY_FILTERS) - set(RANGE_FILTERS) - {LABEL_FILTER}
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown filters: {', '.join(sorted(unknown))}"
+            )
+        self.plan = self._choose_plan(sort)
+        if sort:
+            self.descending = sort.startswith("-")
+        else:
+            self.descending = self.plan.default_descending
+
+    def _choose_plan(self, sort: Optional[str]) -> IndexPlan:
+        equality = frozenset(name for name in self.filters if name in EQUALITY_FILTERS)
+        range_columns = {RANGE_FILTERS[name] for name in self.filters if name in RANGE_FILTERS}
+        sort_column = sort.lstrip("-") if sort else None
+        if sort_column is not None and sort_column not in SORT_COLUMNS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown sort: {sort}. Allowed: {', '.join(SORT_COLUMNS)}"
+            )
+
+        for plan in INDEX_PLANS:
+            if plan.equality != equality:
+                continue
+            if range_columns - {plan.order}:
+                continue
+            if sort_column not in (None, plan.order):
+                continue
+            # Without an explicit sort, a range filter picks the plan on its column
+            if sort_column is None and range_columns and plan.order not in range_columns:
+                continue
+            return plan
+
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported filter/sort combination. Supported: "
+                   + "; ".join(_describe(plan) for plan in INDEX_PLANS)
+        )
+
+    @property
+    def order_column(self):
+        return SORT_COLUMNS[self.plan.order]
+
+    def statement(self, board_ids: List[int], limit: int, cursor: Optional[str] = None) -> Select:
+        """
+        Build the SELECT for one page.
+
+        Args:
+            board_ids: Boards the user may read (access scope)
+            limit: Page size; one extra row is fetched to detect a next page
+            cursor: ``next_cursor`` of the previous page
+        """
+        stmt = select(Task).where(Task.board_id.in_(board_ids), ~IN_DELETED_LANE)
+        for name, column in EQUALITY_FILTERS.items():
+            if name in self.filters:
+                stmt = stmt.where(column == self.filters[name])
+        if "min_priority" in self.filters:
+            stmt = stmt.where(Task.priority >= self.filters["min_priority"])
+        if "updated_since" in self.filters:
+            stmt = stmt.where(Task.updated_at >= self.filters["updated_since"])
+        if self.filters.get(LABEL_FILTER):
+            stmt = stmt.where(labels_filter(self.dialect, self.filters[LABEL_FILTER]))
+
+        column = self.order_column
+        after = decode_cursor(cursor, 2)
+        if after:
+            value, last_id = self._parse_cursor(after)
+            if self.descending:
+                stmt = stmt.where(or_(column < value, and_(column == value, Task.id < last_id)))
+            else:
+                stmt = stmt.where(or_(column > value, and_(column == value, Task.id > last_id)))
+
+        if self.descending:
+            stmt = stmt.order_by(column.desc(), Task.id.desc())
+        else:
+            stmt = stmt.order_by(column.asc(), Task.id.asc())
+        return stmt.limit(limit + 1)
+
+    def _parse_cursor(self, after: list):
+        value, last_id = after
+        try:
+            if self.plan.order in ("updated_at", "created_at"):
+                value = datetime.fromisoformat(value)
+            else:
+                value = int(value)
+            return value, int(last_id)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    def next_cursor(self, last_task: Task) -> str:
+        value = getattr(last_task, self.plan.order)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return encode_cursor([value, last_task.id])
+
+
+def allowed_combinations() -> Iterator[Tuple[IndexPlan, Dict[str, bool], str]]:
+    """
+    Enumerate every accepted (filters, sort) shape with its index plan.
+
+    Yields:
+        Tuples of (plan, filter names present, sort string)
+    """
+    for plan in INDEX_PLANS:
+        ranges = [name for name, column in RANGE_FILTERS.items() if column == plan.order]
+        for use_range in ([False, True] if ranges else [False]):
+            names = dict.fromkeys(plan.equality, True)
+            if use_range:
+                names[ranges[0]] = True
+            for sort in (plan.order, f"-{plan.order}"):
+                yield plan, names, sort
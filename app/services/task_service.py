@@ -1,26 +1,79 @@
 """
 Task Service - Business logic for task (Card) operations.
+
+Tasks carry a denormalized ``board_id`` so every mutation can be a single
+conditional statement (``... WHERE id = ? AND board_id IN (editable boards)
+RETURNING *``) instead of fetch, verify, update and refresh. The board ids
+come from the cached ``PermissionResolver`` map, not a join.
+
+Writes are optimistic: every UPDATE bumps ``version``, and callers that
+pass ``expected_version`` (the client's If-Match) add ``AND version = ?``.
+A concurrent edit then turns into a 409 instead of a lost update, without
+row locks or an extra round trip.
+
+Card counts per (board, lane, priority) are kept in ``board_task_counts``
+by ``StatsService.apply`` before each commit. Creates and deletes know
+their keys from the write itself; an update that changes the lane or
+priority first locks and reads the old key (one extra round trip, only
+for those updates).
+
+Successful writes are recorded in the activity log after the commit
+(``audit_log.record``, a buffered append; see ``audit_service``) and bump
+the board's snapshot version (``BoardSnapshot.invalidate``).
+
+Labels are stored on the card as ``label_ids`` and must belong to its
+board; a card moved to another board loses its labels.
+
+Checklists (``Subtask``) belong to the card: ``expand=True`` loads the
+trees of every card read in one more query (see ``subtask_service``),
+and deleting a card deletes its items in the same transaction.
+
+Setting ``due_at`` also (re)arms the card's reminder (``remind_at``, see
+``reminder_service``) in the same statement.
 """
 
 from typing import Optional, List
 from fastapi import HTTPException, status
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session
-from app.models.task import Task
-from app.models.board import Lane, Board
+from app.models.task import Subtask, Task
+from app.models.board import Label, Lane
 from app.schemas.task import TaskCreate, TaskUpdate
+from app.services.audit_service import audit_log
+from app.services.permission_service import PermissionResolver
+from app.services.reminder_service import remind_at_for
+from app.services.snapshot_service import BoardSnapshot
+from app.services.stats_service import StatsService, count_key
+from app.services.subtask_service import SubtaskService
+from app.services.task_query import IN_DELETED_LANE, TaskQuery
 
 class TaskService:
     def __init__(self, db: Session, user_id: int):
         self.db = db
         self.user_id = user_id
-    
+        self.permissions = PermissionResolver(db, user_id)
+        self.stats = StatsService(db)
+
+    def _editable_board_ids(self) -> List[int]:
+        """Boards on which the current user may change cards."""
+        return self.permissions.board_ids("editor")
+
+    def _editable_lane_board_id(self, lane_id: int):
+        """Scalar subquery resolving a lane to its board id, if the user may edit that board."""
+        return select(Lane.board_id).where(
+            Lane.id == lane_id,
+            Lane.board_id.in_(self._editable_board_ids()),
+            Lane.deleted_at.is_(None)
+        ).scalar_subquery()
+
     def _verify_lane_access(self, lane_id: int):
-        """Ensure the user owns the board that contains this lane."""
-        lane = self.db.query(Lane).join(Board).filter(
+        """Ensure the user may edit the board that contains this lane."""
+        lane = self.db.query(Lane).filter(
             Lane.id == lane_id,
-            Board.owner_id == self.user_id
+            Lane.board_id.in_(self._editable_board_ids()),
+            Lane.deleted_at.is_(None)
         ).first()
-        
+
         if not lane:
             raise HTTPException(
                 status_code=400,
@@ -28,53 +81,247 @@ class TaskService:
             )
         return lane
 
+    def _labels_board_id(self, label_ids: List[int]) -> int:
+        """The board all of ``label_ids`` belong to (one grouped lookup by primary key)."""
+        rows = self.db.execute(
+            select(Label.board_id, func.count())
+            .where(Label.id.in_(label_ids))
+            .group_by(Label.board_id)
+        ).all()
+        if len(rows) != 1 or rows[0][1] != len(label_ids):
+            raise HTTPException(status_code=400, detail="Unknown labels, or labels of several boards")
+        return rows[0][0]
+
+    def _raise_update_failure(self, task_id: int, expected_version: Optional[int] = None,
+                              labels_board_id: Optional[int] = None):
+        """
+        Explain why a conditional update matched no row.
+
+        Only runs on the failure path, so successful writes stay at one
+        round trip.
+        """
+        row = self.db.query(Task.board_id, Task.version).filter(
+            Task.id == task_id,
+            Task.board_id.in_(self.permissions.board_ids()),
+            ~IN_DELETED_LANE
+        ).first()
+        board_id, version = row if row else (None, None)
+        role = self.permissions.role(board_id) if board_id is not None else None
+        if role == "viewer":
+            raise HTTPException(status_code=403, detail="Not authorized")
+        if role and expected_version is not None and version != expected_version:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Task was modified concurrently (current version {version}); reload and retry."
+            )
+        if role and labels_board_id is not None and board_id != labels_board_id:
+            raise HTTPException(status_code=400, detail="Labels must belong to the card's board")
+        if role:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid Lane ID or you don't have access to this board."
+            )
+        raise HTTPException(status_code=404, detail="Task not found")
+
     def create_task(self, task_data: TaskCreate) -> Task:
         # Verify lane access
-        self._verify_lane_access(task_data.lane_id)
-        
+        lane = self._verify_lane_access(task_data.lane_id)
+        if task_data.label_ids and self._labels_board_id(task_data.label_ids) != lane.board_id:
+            raise HTTPException(status_code=400, detail="Labels must belong to the card's board")
+
         new_task = Task(
             **task_data.model_dump(),
-            owner_id=self.user_id
+            board_id=lane.board_id,
+            owner_id=self.user_id,
+            remind_at=remind_at_for(task_data.due_at)
         )
         self.db.add(new_task)
+        self.stats.apply({count_key(lane.board_id, lane.id, new_task.priority): 1})
         self.db.commit()
         self.db.refresh(new_task)
+        BoardSnapshot.invalidate([new_task.board_id])
+        audit_log.record("task.created", new_task.board_id, self.user_id,
+                         lane_id=new_task.lane_id, task_id=new_task.id)
         return new_task
 
-    def update_task(self, task_id: int, task_data: TaskUpdate) -> Task:
+    def get_task(self, task_id: int, expand: bool = False) -> Task:
+        """
+        One card the user can see.
+
+        Args:
+            task_id: Card to read
+            expand: Also load its subtask tree and progress
+        """
         task = self.db.query(Task).filter(
             Task.id == task_id,
-            Task.owner_id == self.user_id
+            Task.board_id.in_(self.permissions.board_ids()),
+            ~IN_DELETED_LANE
         ).first()
-        
+
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
+        if expand:
+            SubtaskService(self.db, self.user_id).expand([task])
+        return task
 
-        # If moving to a new lane, verify access
-        if task_data.lane_id:
-            self._verify_lane_access(task_data.lane_id)
+    def list_tasks(
+        self,
+        filters: dict,
+        sort: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        expand: bool = False
+    ) -> dict:
+        """
+        List tasks of one board (or lane) with index-backed filters and sorting.
 
+        With ``expand`` the subtask trees of the whole page come from one
+        more query.
+
+        Returns:
+            Dictionary with ``items`` and ``next_cursor``
+        """
+        query = TaskQuery(filters, sort, self.db.get_bind().dialect.name)
+
+        board_id = query.filters.get("board_id")
+        if board_id is not None:
+            self.permissions.require(board_id)
+        else:
+            lane_board_id = self.db.query(Lane.board_id).filter(
+                Lane.id == query.filters["lane_id"],
+                Lane.deleted_at.is_(None)
+            ).scalar()
+            if lane_board_id is None or not self.permissions.role(lane_board_id):
+                raise HTTPException(status_code=404, detail="Lane not found")
+            board_id = lane_board_id
+
+        tasks = self.db.execute(query.statement([board_id], limit, cursor)).scalars().all()
+        next_cursor = query.next_cursor(tasks[limit - 1]) if len(tasks) > limit else None
+        items = tasks[:limit]
+        if expand:
+            SubtaskService(self.db, self.user_id).expand(items)
+        return {"items": items, "next_cursor": next_cursor}
+
+    def update_task(
+        self,
+        task_id: int,
+        task_data: TaskUpdate,
+        expected_version: Optional[int] = None
+    ) -> Task:
+        """
+        Apply a partial update in one conditional statement.
+
+        Args:
+            task_id: Task to change
+            task_data: Fields to set
+            expected_version: Version the client last saw (If-Match); None skips the check
+
+        Raises:
+            HTTPException 409: If ``expected_version`` is stale
+        """
         update_data = task_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(task, field, value)
-        
+        if not update_data:
+            return self.get_task(task_id)
+
+        stmt = update(Task).where(
+            Task.id == task_id,
+            Task.board_id.in_(self._editable_board_ids()),
+            ~IN_DELETED_LANE
+        )
+        if expected_version is not None:
+            stmt = stmt.where(Task.version == expected_version)
+        update_data["version"] = Task.version + 1
+        if "due_at" in update_data:
+            # A new due date gets a new reminder, even if the old one was sent
+            update_data["remind_at"] = remind_at_for(update_data["due_at"])
+
+        # Moving to a new lane: the target lane must be on an editable board,
+        # and board_id follows the lane in the same statement.
+        if update_data.get("lane_id"):
+            target_board_id = self._editable_lane_board_id(update_data["lane_id"])
+            stmt = stmt.where(target_board_id.is_not(None))
+            update_data["board_id"] = target_board_id
+
+        # New labels must be of the board the card ends up on
+        labels_board_id = None
+        if update_data.get("label_ids"):
+            labels_board_id = self._labels_board_id(update_data["label_ids"])
+            stmt = stmt.where(update_data.get("board_id", Task.board_id) == labels_board_id)
+
+        # Counter key before the write; the row lock keeps it valid until commit
+        old = None
+        if "lane_id" in update_data or "priority" in update_data:
+            old = self.db.execute(
+                select(Task.board_id, Task.lane_id, Task.priority)
+                .where(Task.id == task_id, Task.board_id.in_(self._editable_board_ids()))
+                .with_for_update()
+            ).first()
+
+        task = self.db.execute(
+            stmt.values(**update_data)
+            .returning(Task)
+            .execution_options(synchronize_session=False)
+        ).scalars().first()
+
+        if not task:
+            self.db.rollback()
+            self._raise_update_failure(task_id, expected_version, labels_board_id)
+
+        if old and old.board_id != task.board_id and task.label_ids and "label_ids" not in update_data:
+            # The old board's labels mean nothing on the new one
+            task.label_ids = []
+        if old:
+            old_key = count_key(*old)
+            new_key = count_key(task.board_id, task.lane_id, task.priority)
+            if old_key != new_key:
+                self.stats.apply({old_key: -1, new_key: 1})
         self.db.commit()
-        self.db.refresh(task)
+        BoardSnapshot.invalidate([task.board_id, old.board_id if old else None])
+
+        fields = sorted(key for key in update_data if key not in ("version", "board_id", "remind_at"))
+        if old and old.lane_id != task.lane_id:
+            audit_log.record("task.moved", task.board_id, self.user_id, lane_id=task.lane_id, task_id=task.id,
+                             data={"from_lane": old.lane_id, "to_lane": task.lane_id, "position": task.position})
+        else:
+            audit_log.record("task.updated", task.board_id, self.user_id, lane_id=task.lane_id, task_id=task.id,
+                             data={"fields": fields})
         return task
 
-    def delete_task(self, task_id: int):
-        task = self.db.query(Task).filter(
+    def delete_task(self, task_id: int, expected_version: Optional[int] = None):
+        stmt = delete(Task).where(
             Task.id == task_id,
-            Task.owner_id == self.user_id
+            Task.board_id.in_(self._editable_board_ids()),
+            ~IN_DELETED_LANE
+        )
+        if expected_version is not None:
+            stmt = stmt.where(Task.version == expected_version)
+        deleted = self.db.execute(
+            stmt.returning(Task.board_id, Task.lane_id, Task.priority)
+            .execution_options(synchronize_session=False)
         ).first()
-        
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-            
-        self.db.delete(task)
+
+        if not deleted:
+            self.db.rollback()
+            self._raise_update_failure(task_id, expected_version)
+
+        # No foreign key to cascade along (tasks may be partitioned)
+        self.db.execute(
+            delete(Subtask).where(Subtask.task_id == task_id).execution_options(synchronize_session=False)
+        )
+        self.stats.apply({count_key(*deleted): -1})
         self.db.commit()
+        BoardSnapshot.invalidate([deleted.board_id])
+        audit_log.record("task.deleted", deleted.board_id, self.user_id, lane_id=deleted.lane_id, task_id=task_id)
         return {"message": "Task deleted"}
-    
-    def move_task(self, task_id: int, new_lane_id: int, new_position: int) -> Task:
+
+    def move_task(
+        self,
+        task_id: int,
+        new_lane_id: int,
+        new_position: int,
+        expected_version: Optional[int] = None
+    ) -> Task:
         """ Specialized method for drag-and-drop updates """
-        return self.update_task(task_id, TaskUpdate(lane_id=new_lane_id, position=new_position))
+        return self.update_task(
+            task_id, TaskUpdate(lane_id=new_lane_id, position=new_position), expected_version
+        )
@@ -6,11 +6,12 @@ separating it from the API routes for better maintainability and testability.
 """
 
 from datetime import timedelta
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.cache import aget_cache, aset_cache, delete_cache, get_many, set_many
 from app.core.security import (
     hash_password, 
     verify_password, 
@@ -19,6 +20,11 @@ from app.core.security import (
 )
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse
+from app.services.loader import RequestLoaders
+
+
+def _profile_key(user_id: int) -> str:
+    return f"user:profile:{user_id}"
 
 
 class UserService:
@@ -57,6 +63,65 @@ class UserService:
         """
         return self.db.query(User).filter(User.id == user_id).first()
     
+    async def get_profile(self, user_id: int) -> dict:
+        """
+        Profile of a user as returned by ``GET /users/me``, cached.
+
+        Served from the near cache (``user`` namespace) when warm, else
+        from Redis through the asyncio client; dropped by ``update_user``
+        and ``deactivate_user``.
+
+        Args:
+            user_id: User's database ID
+
+        Returns:
+            Dictionary matching ``UserResponse``
+
+        Raises:
+            HTTPException: If user not found
+        """
+        cached = await aget_cache(_profile_key(user_id), schema=UserResponse)
+        if cached is not None:
+            return cached
+
+        # Through the request's loader: misses of the same loop turn share one query
+        user = await RequestLoaders.of(self.db).users.load(user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with ID {user_id} not found."
+            )
+        profile = UserResponse.model_validate(user).model_dump(mode="json")
+        await aset_cache(_profile_key(user_id), profile, schema=UserResponse)
+        return profile
+
+    async def get_profiles(self, user_ids: List[int]) -> List[dict]:
+        """
+        Profiles of several users (``GET /users?ids=``), cached like ``get_profile``.
+
+        Cached profiles come from the near cache or one MGET; the rest are
+        read in one query through the request's loader and cached in one
+        pipeline.
+
+        Args:
+            user_ids: User IDs, in the order to return them
+
+        Returns:
+            Dictionaries matching ``UserResponse`` (unknown ids are left out)
+        """
+        keys = {user_id: _profile_key(user_id) for user_id in user_ids}
+        cached = await get_many(keys.values(), schema=UserResponse)
+        profiles = {user_id: cached[key] for user_id, key in keys.items() if key in cached}
+
+        missing = [user_id for user_id in user_ids if user_id not in profiles]
+        loaded = {}
+        for user in await RequestLoaders.of(self.db).users.load_many(missing):
+            if user is not None:
+                profile = UserResponse.model_validate(user).model_dump(mode="json")
+                profiles[user.id] = loaded[_profile_key(user.id)] = profile
+        await set_many(loaded, schema=UserResponse)
+        return [profiles[user_id] for user_id in user_ids if user_id in profiles]
+
     def get_all_users(self) -> list[User]:
         """
         Retrieve all users from the database.
@@ -191,6 +256,7 @@ class UserService:
         
         self.db.commit()
         self.db.refresh(user)
+        delete_cache(_profile_key(user_id))
         
         return user
     
@@ -218,6 +284,7 @@ class UserService:
         user.is_active = False
         self.db.commit()
         self.db.refresh(user)
+        delete_cache(_profile_key(user_id))
         
         return user
     
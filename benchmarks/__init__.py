@@ -0,0 +1,10 @@
+"""
+TaskMaster Benchmark Suite
+
+Reproducible performance measurements for the service layer and the
+v1 API routers. Run ``python -m benchmarks --help`` for the commands.
+
+The suite targets whatever database ``--database-url`` points to
+(SQLite file or a local PostgreSQL instance). Seeding resets the schema
+of that database, so never point it at real data.
+"""
@@ -0,0 +1,443 @@
+"""
+Benchmark CLI
+
+Usage:
+    python -m benchmarks seed     - Reset the benchmark database and generate a dataset
+    python -m benchmarks micro    - Time service-layer methods
+    python -m benchmarks load     - Drive the v1 API through ASGI with concurrent clients
+    python -m benchmarks compare  - Compare a saved report against a baseline
+    python -m benchmarks plans    - Assert every allowed task listing query uses its index
+    python -m benchmarks contention - Concurrent updates of one card; fails on lost updates
+    python -m benchmarks importtime - Cold-start import of app.main against a time budget
+    python -m benchmarks digest   - Daily digest pipeline: time, queries and peak memory
+    python -m benchmarks audit    - Card move latency with and without the activity log
+    python -m benchmarks nearcache - Hot reads with and without the in-process cache layer
+    python -m benchmarks codec    - Size and encode/decode time of cache encodings on board payloads
+    python -m benchmarks asynccache - MGET vs sequential reads, event-loop lag of sync vs async Redis
+    python -m benchmarks stampede - Concurrent misses on one cached key; fails unless it loads once
+    python -m benchmarks breaker  - Cache call latency with Redis down, with and without the circuit breaker
+    python -m benchmarks snapshot - CPU and bytes per board read: per-request gzip vs precompressed variants
+    python -m benchmarks batch    - A dashboard of N boards and their owners: separate requests vs batch reads
+    python -m benchmarks reminders - Several reminder schedulers on a burst of due dates; fails on duplicates or misses
+    python -m benchmarks labels   - Label filters on a 100k-card board: label_ids containment vs a grouped join table
+    python -m benchmarks subtasks - A page of cards with nested checklists: one-query expansion vs a per-item walk
+
+Every command accepts --database-url (defaults to $BENCH_DATABASE_URL or
+a local SQLite file). micro/load accept --output to write a JSON report
+and --baseline to fail (exit 1) when p95 regresses beyond --tolerance.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks import env
+
+
+def _finish(kind: str, recorder, params: dict, args, wall_seconds: float = None) -> int:
+    from benchmarks import report
+
+    results = recorder.summary(wall_seconds)
+    report.print_table(results)
+    data = report.build_report(kind, results, params)
+    if args.output:
+        report.write_report(data, args.output)
+        print(f"Report written to {args.output}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = report.compare(data, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"Within {args.tolerance:.0%} of baseline {args.baseline}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="TaskMaster benchmarks")
+    parser.add_argument("--database-url", help="SQLAlchemy URL of the benchmark database")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    seed_cmd = sub.add_parser("seed", help="Reset schema and generate a dataset")
+    seed_cmd.add_argument("--users", type=int, default=100)
+    seed_cmd.add_argument("--boards", type=int, default=300)
+    seed_cmd.add_argument("--lanes-per-board", type=int, default=3)
+    seed_cmd.add_argument("--tasks", type=int, default=20_000)
+    seed_cmd.add_argument("--skew", type=float, default=1.0, help="Zipf exponent (0 = uniform)")
+    seed_cmd.add_argument("--seed", type=int, default=42)
+    seed_cmd.add_argument("--partitions", type=int, default=0,
+                          help="Hash-partition tasks by board_id into N slices (PostgreSQL)")
+
+    for name, help_text in (("micro", "Service microbenchmarks"), ("load", "ASGI load driver")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("--only", help="Run operations whose name contains this text")
+        cmd.add_argument("--output", help="Write the JSON report to this path")
+        cmd.add_argument("--baseline", help="Baseline report to compare against")
+        cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+        cmd.add_argument("--seed", type=int, default=7)
+        if name == "micro":
+            cmd.add_argument("--iterations", type=int, default=200)
+            cmd.add_argument("--warmup", type=int, default=20)
+        else:
+            cmd.add_argument("--concurrency", type=int, default=8)
+            cmd.add_argument("--duration", type=float, default=30.0)
+            cmd.add_argument("--requests", type=int, default=5_000)
+
+    sub.add_parser("plans", help="Check query plans of the task listing API")
+
+    importtime_cmd = sub.add_parser("importtime", help="Check the import time of app.main")
+    importtime_cmd.add_argument("--budget-ms", type=float, default=1500.0,
+                                help="Maximum cumulative import time of app.main")
+    importtime_cmd.add_argument("--repeat", type=int, default=3, help="Fresh interpreters to try (best wins)")
+
+    contention_cmd = sub.add_parser("contention", help="Stress concurrent updates of one card")
+    contention_cmd.add_argument("--workers", type=int, default=8)
+    contention_cmd.add_argument("--increments", type=int, default=50, help="Committed writes per worker")
+    contention_cmd.add_argument("--no-check", action="store_true",
+                                help="Skip the version check to show lost updates")
+
+    digest_cmd = sub.add_parser("digest", help="Time the daily digest pipeline")
+    digest_cmd.add_argument("--chunk-size", type=int, default=5_000, help="Users per aggregate query")
+    digest_cmd.add_argument("--naive-sample", type=int, default=100,
+                            help="Users digested with a per-user loop for comparison (0 to skip)")
+    digest_cmd.add_argument("--memory-mb", type=float, default=64.0,
+                            help="Fail when the pipeline's peak Python allocation exceeds this")
+    digest_cmd.add_argument("--project-users", type=int, default=1_000_000,
+                            help="Extrapolate time and queries to this many users")
+
+    audit_cmd = sub.add_parser("audit", help="Measure the activity log's overhead on card moves")
+    audit_cmd.add_argument("--iterations", type=int, default=300, help="Moves per mode")
+    audit_cmd.add_argument("--events", type=int, default=20_000, help="Events for the flush throughput")
+    audit_cmd.add_argument("--seed", type=int, default=7)
+    audit_cmd.add_argument("--output", help="Write the JSON report to this path")
+    audit_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    audit_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    nearcache_cmd = sub.add_parser("nearcache", help="Measure the near cache on /users/me and board reads")
+    nearcache_cmd.add_argument("--iterations", type=int, default=500, help="Request pairs per mode")
+    nearcache_cmd.add_argument("--users", type=int, default=50, help="Distinct users issuing the reads")
+    nearcache_cmd.add_argument("--seed", type=int, default=7)
+    nearcache_cmd.add_argument("--output", help="Write the JSON report to this path")
+    nearcache_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    nearcache_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    codec_cmd = sub.add_parser("codec", help="Compare cache encodings on real board payloads")
+    codec_cmd.add_argument("--boards", type=int, default=20, help="Largest boards to encode")
+    codec_cmd.add_argument("--repeat", type=int, default=20, help="Timing passes over the payloads")
+    codec_cmd.add_argument("--min-compress-bytes", type=int, default=1024)
+
+    asynccache_cmd = sub.add_parser("asynccache", help="Batched and non-blocking cache reads")
+    asynccache_cmd.add_argument("--batch", type=int, default=50, help="Entries per batched fetch")
+    asynccache_cmd.add_argument("--iterations", type=int, default=200)
+    asynccache_cmd.add_argument("--concurrency", type=int, default=32, help="Coroutines in the loop test")
+    asynccache_cmd.add_argument("--reads", type=int, default=50, help="Reads per coroutine")
+    asynccache_cmd.add_argument("--output", help="Write the JSON report to this path")
+    asynccache_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    asynccache_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    stampede_cmd = sub.add_parser("stampede", help="Check that concurrent cache misses load once")
+    stampede_cmd.add_argument("--callers", type=int, default=1000, help="Concurrent misses per worker")
+    stampede_cmd.add_argument("--processes", type=int, default=4, help="Workers in the cross-worker scenario")
+    stampede_cmd.add_argument("--load-ms", type=float, default=100.0, help="Extra latency of each load")
+
+    breaker_cmd = sub.add_parser("breaker", help="Time cache calls while Redis is unreachable")
+    breaker_cmd.add_argument("--redis-host", default="127.0.0.1")
+    breaker_cmd.add_argument("--redis-port", type=int, help="Port where Redis is down (default: a local "
+                             "listener that accepts connections and never answers, i.e. a hung Redis)")
+    breaker_cmd.add_argument("--slow-calls", type=int, default=5, help="Calls timed without the breaker")
+    breaker_cmd.add_argument("--calls", type=int, default=1000, help="Calls timed with the breaker")
+    breaker_cmd.add_argument("--output", help="Write the JSON report to this path")
+    breaker_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    breaker_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    snapshot_cmd = sub.add_parser("snapshot", help="CPU per request and bytes on the wire of board reads")
+    snapshot_cmd.add_argument("--requests", type=int, default=200, help="Requests timed per mode")
+    snapshot_cmd.add_argument("--output", help="Write the JSON report to this path")
+    snapshot_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    snapshot_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    batch_cmd = sub.add_parser("batch", help="Separate vs batch reads of a dashboard of boards and users")
+    batch_cmd.add_argument("--boards", type=int, default=20, help="Boards on the dashboard")
+    batch_cmd.add_argument("--users", type=int, default=20, help="Card owners whose profiles it shows")
+    batch_cmd.add_argument("--iterations", type=int, default=50, help="Dashboard loads per mode")
+    batch_cmd.add_argument("--seed", type=int, default=7)
+    batch_cmd.add_argument("--output", help="Write the JSON report to this path")
+    batch_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    batch_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    reminders_cmd = sub.add_parser("reminders", help="Run reminder schedulers side by side on a burst of due dates")
+    reminders_cmd.add_argument("--reminders", type=int, default=5_000, help="Reminders armed")
+    reminders_cmd.add_argument("--schedulers", type=int, default=3, help="Schedulers run side by side")
+    reminders_cmd.add_argument("--spread", type=float, default=20.0, help="Seconds over which they come due")
+    reminders_cmd.add_argument("--window", type=int, default=10, help="Claim window of each scheduler (seconds)")
+    reminders_cmd.add_argument("--poll", type=float, default=1.0, help="Seconds between claims")
+    reminders_cmd.add_argument("--batch-size", type=int, default=500, help="Reminders per claim and per job")
+    reminders_cmd.add_argument("--seed", type=int, default=7)
+    reminders_cmd.add_argument("--output", help="Write the JSON report to this path")
+    reminders_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    reminders_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    labels_cmd = sub.add_parser("labels", help="Multi-label filtering on one big board")
+    labels_cmd.add_argument("--tasks", type=int, default=100_000, help="Cards on the board")
+    labels_cmd.add_argument("--labels", type=int, default=50, help="Labels on the board")
+    labels_cmd.add_argument("--iterations", type=int, default=30, help="Pages read per mode")
+    labels_cmd.add_argument("--seed", type=int, default=7)
+    labels_cmd.add_argument("--output", help="Write the JSON report to this path")
+    labels_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    labels_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    subtasks_cmd = sub.add_parser("subtasks", help="Checklist trees of a page of cards, and subtree moves")
+    subtasks_cmd.add_argument("--cards", type=int, default=50, help="Cards on the board (one page)")
+    subtasks_cmd.add_argument("--fanout", type=int, default=3, help="Items per checklist level")
+    subtasks_cmd.add_argument("--depth", type=int, default=4, help="Checklist levels")
+    subtasks_cmd.add_argument("--iterations", type=int, default=20, help="Runs per mode")
+    subtasks_cmd.add_argument("--seed", type=int, default=7)
+    subtasks_cmd.add_argument("--output", help="Write the JSON report to this path")
+    subtasks_cmd.add_argument("--baseline", help="Baseline report to compare against")
+    subtasks_cmd.add_argument("--tolerance", type=float, default=0.10, help="Allowed p95 slowdown")
+
+    compare_cmd = sub.add_parser("compare", help="Compare two saved reports")
+    compare_cmd.add_argument("current")
+    compare_cmd.add_argument("baseline")
+    compare_cmd.add_argument("--tolerance", type=float, default=0.10)
+
+    args = parser.parse_args()
+    database_url = env.configure(args.database_url)
+
+    if args.command == "seed":
+        from benchmarks.seed import SeedConfig, seed
+
+        config = SeedConfig(
+            users=args.users, boards=args.boards, lanes_per_board=args.lanes_per_board,
+            tasks=args.tasks, skew=args.skew, seed=args.seed, partitions=args.partitions,
+        )
+        print(f"Seeding {database_url} ...")
+        counts = seed(config)
+        print(", ".join(f"{count} {table}" for table, count in counts.items()))
+        return 0
+
+    if args.command == "micro":
+        from benchmarks import micro
+
+        recorder = micro.run(args.iterations, args.warmup, args.seed, args.only)
+        params = {"database": database_url.split(":", 1)[0], "iterations": args.iterations,
+                  "warmup": args.warmup, "seed": args.seed}
+        return _finish("micro", recorder, params, args)
+
+    if args.command == "load":
+        from benchmarks import load
+
+        recorder, wall = load.run(args.concurrency, args.duration, args.requests, args.seed, args.only)
+        params = {"database": database_url.split(":", 1)[0], "concurrency": args.concurrency,
+                  "duration": args.duration, "requests": args.requests, "seed": args.seed}
+        return _finish("load", recorder, params, args, wall_seconds=wall)
+
+    if args.command == "plans":
+        from benchmarks import plans
+
+        failures = 0
+        for label, problems in plans.run():
+            print(f"{'FAIL' if problems else 'ok  '} {label}")
+            for problem in problems:
+                print(f"       {problem}")
+            failures += bool(problems)
+        return 1 if failures else 0
+
+    if args.command == "importtime":
+        from benchmarks import importtime
+
+        total_us, children = importtime.run(repeat=args.repeat)
+        for cumulative, name in children[:10]:
+            print(f"{cumulative / 1000:10.1f} ms  {name}")
+        total_ms = total_us / 1000
+        print(f"import app.main: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms), "
+              f"no database or Redis connection needed")
+        return 1 if total_ms > args.budget_ms else 0
+
+    if args.command == "contention":
+        from benchmarks import contention, report
+
+        result = contention.run(args.workers, args.increments, check=not args.no_check)
+        latencies = sorted(result.latencies_ms)
+        print(f"{result.workers} workers x {result.increments} increments "
+              f"({'version checked' if result.check else 'no version check'}) in {result.seconds:.2f}s")
+        print(f"committed={result.committed} conflicts(409)={result.conflicts} errors={result.errors}")
+        if latencies:
+            print(f"write p50={report.percentile(latencies, 50):.2f}ms p95={report.percentile(latencies, 95):.2f}ms")
+        print(f"final position delta={result.final_position - result.start_position} "
+              f"lost updates={result.lost_updates}")
+        return 1 if result.lost_updates or result.errors else 0
+
+    if args.command == "digest":
+        from benchmarks import digest
+
+        result = digest.run(args.chunk_size, args.naive_sample)
+        print(f"{result.users} users, chunk {result.chunk_size}: {result.digests} digests in "
+              f"{result.batches} batches, {result.queries} queries, {result.seconds:.2f}s, "
+              f"peak {result.peak_mb:.1f} MB (budget {args.memory_mb:.0f} MB)")
+        if result.naive_users:
+            print(f"naive loop, {result.naive_users} users: {result.naive_queries} queries, "
+                  f"{result.naive_seconds:.2f}s")
+        projection = result.projected(args.project_users)
+        print(f"projected to {args.project_users} users: pipeline {projection['seconds']:.0f}s / "
+              f"{projection['queries']:.0f} queries, naive {projection['naive_seconds']:.0f}s / "
+              f"{projection['naive_queries']:.0f} queries")
+        return 1 if result.peak_mb > args.memory_mb else 0
+
+    if args.command == "audit":
+        from benchmarks import audit
+
+        recorder, figures = audit.run(args.iterations, args.events, args.seed)
+        params = {"database": database_url.split(":", 1)[0], "iterations": args.iterations,
+                  "events": args.events, "seed": args.seed}
+        code = _finish("audit", recorder, params, args)
+        print(f"record(): {figures['record_us']:.2f} us/event; flush of {figures['flushed']} events "
+              f"in {figures['flush_seconds']:.2f}s ({figures['events_per_second']:.0f} events/s)")
+        return code
+
+    if args.command == "nearcache":
+        from benchmarks import nearcache
+
+        recorder, stats = nearcache.run(args.iterations, args.users, args.seed)
+        params = {"database": database_url.split(":", 1)[0], "iterations": args.iterations,
+                  "users": args.users, "seed": args.seed}
+        code = _finish("nearcache", recorder, params, args)
+        for namespace, counts in stats["namespaces"].items():
+            print(f"{namespace}: hit ratio {counts['hit_ratio']:.1%} ({counts['hits']} hits, "
+                  f"{counts['misses']} misses), {counts['size']}/{counts['limit']} entries")
+        return code
+
+    if args.command == "codec":
+        from benchmarks import codec
+
+        results = codec.run(args.boards, args.repeat, args.min_compress_bytes)
+        baseline = results[0]
+        print(f"{'encoding':<18}{'bytes':>12}{'ratio':>8}{'encode us':>12}{'decode us':>12}{'redis bytes':>14}")
+        for result in results:
+            redis_bytes = "n/a" if result.redis_bytes is None else str(result.redis_bytes)
+            print(f"{result.name:<18}{result.stored_bytes:>12}{result.stored_bytes / baseline.stored_bytes:>8.2f}"
+                  f"{result.encode_us:>12.1f}{result.decode_us:>12.1f}{redis_bytes:>14}")
+        return 0
+
+    if args.command == "asynccache":
+        from benchmarks import asynccache
+
+        recorder, loops = asynccache.run(args.batch, args.iterations, args.concurrency, args.reads)
+        params = {"batch": args.batch, "iterations": args.iterations,
+                  "concurrency": args.concurrency, "reads": args.reads}
+        code = _finish("asynccache", recorder, params, args)
+        for result in loops:
+            print(f"{result.mode:>5} client, {args.concurrency} x {args.reads} reads: {result.seconds:.3f}s, "
+                  f"event-loop lag p99 {result.lag_p99_ms:.2f} ms, max {result.lag_max_ms:.2f} ms")
+        return code
+
+    if args.command == "stampede":
+        from benchmarks import stampede
+
+        results = stampede.run(args.callers, args.processes, args.load_ms)
+        failed = False
+        for result in results:
+            guarded = result.scenario != "unguarded"
+            ok = result.loads == 1 or not guarded
+            failed = failed or not ok
+            print(f"{result.scenario:<10} {result.callers:>5} callers: {result.loads:>5} loads "
+                  f"in {result.seconds:.2f}s, read p99 {result.p99_ms:.1f} ms"
+                  f"{'' if ok else '  FAIL (expected 1 load)'}")
+        return 1 if failed else 0
+
+    if args.command == "breaker":
+        import os
+        import socket
+
+        host, port = args.redis_host, args.redis_port
+        if port is None:
+            # Connects succeed (kernel backlog), every read waits for REDIS_SOCKET_TIMEOUT
+            silent = socket.socket()
+            silent.bind((host, 0))
+            silent.listen(1024)
+            port = silent.getsockname()[1]
+        # Settings are read on first import of the app
+        os.environ["REDIS_HOST"], os.environ["REDIS_PORT"] = host, str(port)
+        from benchmarks import breaker
+
+        recorder, figures = breaker.run(args.slow_calls, args.calls)
+        params = {"redis": f"{host}:{port}" if args.redis_port else "hung", "slow_calls": args.slow_calls, "calls": args.calls}
+        code = _finish("breaker", recorder, params, args)
+        stats = figures["breaker"]
+        print(f"breaker: opened {stats['opened']}x, {stats['rejected']} calls rejected without a round trip; "
+              f"guard() overhead when closed {figures['guard_ns']:.0f} ns/call")
+        return code
+
+    if args.command == "snapshot":
+        from benchmarks import snapshot
+
+        recorder, figures = snapshot.run(args.requests)
+        code = _finish("snapshot", recorder, {"requests": args.requests}, args)
+        print(f"{'mode':<18}{'cpu ms/request':>16}{'bytes':>12}")
+        for name, figure in figures.items():
+            print(f"{name:<18}{figure['cpu_ms']:>16.3f}{figure['bytes']:>12}")
+        return code
+
+    if args.command == "batch":
+        from benchmarks import batch
+
+        recorder, figures = batch.run(args.boards, args.users, args.iterations, args.seed)
+        params = {"boards": args.boards, "users": args.users, "iterations": args.iterations, "seed": args.seed}
+        code = _finish("batch", recorder, params, args)
+        print(f"dashboard: {figures.pop('boards')} boards, {figures.pop('users')} users; SQL statements per load: "
+              + ", ".join(f"{mode} {count:.1f}" for mode, count in figures.items()))
+        return code
+
+    if args.command == "reminders":
+        from benchmarks import reminders
+
+        recorder, figures = reminders.run(args.reminders, args.schedulers, args.spread, args.window,
+                                          args.poll, args.batch_size, seed=args.seed)
+        params = {"database": database_url.split(":", 1)[0], "reminders": args.reminders,
+                  "schedulers": args.schedulers, "spread": args.spread, "window": args.window,
+                  "batch_size": args.batch_size}
+        code = _finish("reminders", recorder, params, args)
+        print(f"sent {figures['sent']} (per scheduler {figures['per_scheduler']}), "
+              f"duplicates {figures['duplicates']}, missing {figures['missing']}, early {figures['early']}")
+        if figures["sent"]:
+            print(f"lateness p50 {figures['late_p50_ms']:.0f} ms, p95 {figures['late_p95_ms']:.0f} ms, "
+                  f"max {figures['late_max_ms']:.0f} ms")
+        return 1 if figures["duplicates"] or figures["missing"] or figures["early"] else code
+
+    if args.command == "labels":
+        from benchmarks import labels
+
+        recorder, matches = labels.run(args.tasks, args.labels, args.iterations, args.seed)
+        params = {"database": database_url.split(":", 1)[0], "tasks": args.tasks, "labels": args.labels,
+                  "iterations": args.iterations, "seed": args.seed}
+        code = _finish("labels", recorder, params, args)
+        print("cards matching: " + ", ".join(f"{name} {count}" for name, count in matches.items()))
+        return code
+
+    if args.command == "subtasks":
+        from benchmarks import subtasks
+
+        recorder, figures = subtasks.run(args.cards, args.fanout, args.depth, args.iterations, args.seed)
+        params = {"database": database_url.split(":", 1)[0], "cards": args.cards, "fanout": args.fanout,
+                  "depth": args.depth, "iterations": args.iterations, "seed": args.seed}
+        code = _finish("subtasks", recorder, params, args)
+        print(f"items per card {figures['items_per_card']}, moved per move {figures['items_moved']}")
+        print("SQL statements per run: " + ", ".join(f"{mode} {count}" for mode, count in figures["statements"].items()))
+        return code
+
+    from benchmarks import report
+
+    with open(args.current, encoding="utf-8") as handle:
+        current = json.load(handle)
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    regressions = report.compare(current, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
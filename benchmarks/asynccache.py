@@ -0,0 +1,101 @@
+"""
+Async Cache Benchmark - Batched reads and event-loop blocking.
+
+Two measurements against the configured Redis (keys ``bench:entity:*``,
+outside the near-cached namespaces, so every read is a round trip):
+
+    batch  Fetch N entries: N sequential ``get_cache`` calls vs one
+           ``get_many`` (MGET).
+    loop   C concurrent coroutines each read K entries, once with the
+           synchronous client (each call blocks the event loop) and once
+           with ``aget_cache``. A probe coroutine that wakes every
+           millisecond records how late it runs: the event-loop lag
+           other requests would see.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+from app.core.cache import AsyncCacheClient, aget_cache, get_cache, get_many, set_many
+
+from benchmarks.report import Recorder, percentile
+
+
+@dataclass
+class LoopResult:
+    mode: str
+    seconds: float
+    lag_p99_ms: float
+    lag_max_ms: float
+
+
+def _keys(count: int) -> List[str]:
+    return [f"bench:entity:{index}" for index in range(count)]
+
+
+async def _probe(stop: asyncio.Event, lags: List[float]) -> None:
+    while not stop.is_set():
+        began = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - began - 0.001) * 1000)
+
+
+async def _loop_run(mode: str, concurrency: int, reads: int, keys: List[str]) -> LoopResult:
+    async def reader(offset: int) -> None:
+        for index in range(reads):
+            key = keys[(offset + index) % len(keys)]
+            if mode == "sync":
+                get_cache(key)
+            else:
+                await aget_cache(key)
+
+    stop, lags = asyncio.Event(), []
+    probe = asyncio.create_task(_probe(stop, lags))
+    await asyncio.sleep(0.01)
+    began = time.perf_counter()
+    await asyncio.gather(*(reader(offset) for offset in range(concurrency)))
+    seconds = time.perf_counter() - began
+    stop.set()
+    await probe
+    lags.sort()
+    return LoopResult(mode, seconds, percentile(lags, 99), lags[-1] if lags else 0.0)
+
+
+async def _drive(batch: int, iterations: int, concurrency: int, reads: int):
+    keys = _keys(batch)
+    payload = {"id": 0, "title": "cached entity", "description": "x" * 200, "position": 3}
+    if not await set_many({key: {**payload, "id": index} for index, key in enumerate(keys)}):
+        raise RuntimeError("Redis is not reachable")
+
+    recorder = Recorder()
+    for _ in range(iterations):
+        begin = time.perf_counter_ns()
+        for key in keys:
+            get_cache(key)
+        recorder.add(f"get_cache x{batch} (sequential)", (time.perf_counter_ns() - begin) / 1e6)
+        begin = time.perf_counter_ns()
+        found: Dict = await get_many(keys)
+        recorder.add(f"get_many x{batch} (MGET)", (time.perf_counter_ns() - begin) / 1e6)
+        assert len(found) == batch
+
+    # Warm-up: opens the pooled connections the async run needs
+    await _loop_run("async", concurrency, reads, keys)
+    loops = [await _loop_run(mode, concurrency, reads, keys) for mode in ("sync", "async", "sync", "async")]
+    await AsyncCacheClient.close()
+    return recorder, loops
+
+
+def run(batch: int = 50, iterations: int = 200, concurrency: int = 32, reads: int = 50):
+    """
+    Args:
+        batch: Entries per batched fetch
+        iterations: Batched fetches per mode
+        concurrency: Concurrent coroutines in the loop test
+        reads: Reads per coroutine
+
+    Returns:
+        (Recorder with the batch timings, LoopResult per loop run)
+    """
+    return asyncio.run(_drive(batch, iterations, concurrency, reads))
@@ -0,0 +1,106 @@
+"""
+Audit Benchmark - Cost of the activity log on card moves.
+
+Times ``TaskService.move_task`` (the body of ``PUT /tasks/{id}/move``)
+in three modes, interleaved so drift hits all of them equally:
+
+    move.no_audit     audit log disabled
+    move.buffered     ``audit_log.record`` (what the app does)
+    move.sync_insert  one INSERT into activity_events inside the move's
+                      transaction, the per-write alternative
+
+Then measures the buffer itself: ``record`` cost per event and flush
+throughput (events written per second with one multi-row INSERT per flush).
+"""
+
+import random
+import time
+from datetime import datetime
+from typing import Dict, Tuple
+
+from sqlalchemy import event, insert
+
+from app.db.connection import SessionLocal
+from app.models.activity import ActivityEvent
+from app.services.audit_service import AuditLog, audit_log
+from app.services.task_service import TaskService
+
+from benchmarks.report import Recorder
+from benchmarks.seed import Fixture
+
+MODES = ("move.no_audit", "move.buffered", "move.sync_insert")
+
+
+def _move(mode: str, user_id: int, task_id: int, lane_id: int, position: int) -> float:
+    db = SessionLocal()
+    try:
+        if mode == "move.sync_insert":
+            def insert_event(session):
+                session.execute(insert(ActivityEvent).values(
+                    occurred_at=datetime.now(), action="task.moved", actor_id=user_id,
+                    board_id=0, task_id=task_id, data={"to_lane": lane_id},
+                ))
+            event.listen(db, "before_commit", insert_event)
+        audit_log.enabled = mode == "move.buffered"
+        begin = time.perf_counter_ns()
+        TaskService(db, user_id).move_task(task_id, lane_id, position)
+        return (time.perf_counter_ns() - begin) / 1e6
+    finally:
+        db.close()
+
+
+def run(iterations: int = 300, events: int = 20_000, seed: int = 7) -> Tuple[Recorder, Dict[str, float]]:
+    """
+    Time moves per mode and the buffer's flush throughput.
+
+    Args:
+        iterations: Moves per mode
+        events: Events recorded and flushed for the throughput figure
+        seed: Random seed for the picked cards and lanes
+
+    Returns:
+        (Recorder with one operation per mode, buffer figures)
+    """
+    rng = random.Random(seed)
+    with SessionLocal() as db:
+        fixture = Fixture.load(db)
+    candidates = [
+        (user_id, board_id)
+        for user_id, boards in fixture.boards_by_user.items()
+        for board_id in boards
+        if fixture.tasks_by_board.get(board_id) and len(fixture.lanes_by_board.get(board_id, [])) > 1
+    ]
+
+    recorder = Recorder()
+    enabled = audit_log.enabled
+    try:
+        for _ in range(iterations):
+            for mode in rng.sample(MODES, len(MODES)):
+                user_id, board_id = rng.choice(candidates)
+                task_id = rng.choice(fixture.tasks_by_board[board_id])
+                lane_id = rng.choice(fixture.lanes_by_board[board_id])
+                try:
+                    recorder.add(mode, _move(mode, user_id, task_id, lane_id, rng.randint(0, 50)))
+                except Exception:
+                    recorder.fail(mode)
+    finally:
+        audit_log.enabled = enabled
+    audit_log.flush()
+
+    # A private buffer that never flushes on its own, so the flush is timed alone
+    buffer = AuditLog(flush_seconds=3600, flush_size=events + 1, max_buffer=events + 1)
+    buffer.enabled = True
+    begin = time.perf_counter_ns()
+    for index in range(events):
+        buffer.record("task.moved", 0, 0, task_id=index, data={"from_lane": 1, "to_lane": 2})
+    record_us = (time.perf_counter_ns() - begin) / 1e3 / events
+    begin = time.perf_counter()
+    flushed = buffer.flush()
+    flush_seconds = time.perf_counter() - begin
+    figures = {
+        "record_us": record_us,
+        "flushed": flushed,
+        "flush_seconds": flush_seconds,
+        "events_per_second": flushed / flush_seconds if flush_seconds else 0.0,
+    }
+    return recorder, figures
@@ -0,0 +1,137 @@
+"""
+Batch Benchmark - A dashboard of N boards and their card owners.
+
+The user owning the most seeded boards loads a dashboard: ``boards`` of
+those boards plus the profiles of ``users`` users (owners of their cards,
+topped up with other seeded users), through ASGI. Per dashboard load, wall time and SQL statements are
+recorded for:
+
+    separate     one ``GET /boards/{id}`` per board and one
+                 ``GET /users/{id}`` per owner (an auth decode, a session
+                 and its queries each)
+    batch        ``GET /boards?ids=`` and ``GET /users?ids=``, caches warm
+    batch.cold   the same after bumping every board's version and dropping
+                 the profiles, so everything is read through the
+                 request's loaders (one query per entity type); run
+                 after the warm modes, which are interleaved
+
+Needs Redis.
+"""
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+import httpx
+from sqlalchemy import event, func, select
+
+from app.core.cache import delete_cache
+from app.core.security import create_access_token
+from app.db.connection import SessionLocal, engine
+from app.models.board import Board
+from app.models.task import Task
+from app.models.user import User
+from app.services.snapshot_service import BoardSnapshot
+
+from benchmarks.report import Recorder
+
+MODES = ("separate", "batch", "batch.cold")
+
+
+@contextmanager
+def _count_queries(counter: List[int]):
+    def before_cursor_execute(*args):
+        counter[0] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _dashboard(boards: int, users: int, seed: int) -> Tuple[int, str, List[int], List[int]]:
+    with SessionLocal() as db:
+        owner_id = db.execute(
+            select(Board.owner_id).where(Board.deleted_at.is_(None))
+            .group_by(Board.owner_id).order_by(func.count().desc()).limit(1)
+        ).scalar()
+        if owner_id is None:
+            raise RuntimeError("No boards found; run `python -m benchmarks seed` first")
+        email = db.execute(select(User.email).where(User.id == owner_id)).scalar()
+        board_ids = db.execute(
+            select(Board.id).where(Board.owner_id == owner_id, Board.deleted_at.is_(None)).order_by(Board.id)
+        ).scalars().all()
+        board_ids = random.Random(seed).sample(board_ids, min(boards, len(board_ids)))
+        user_ids = db.execute(
+            select(Task.owner_id).where(Task.board_id.in_(board_ids), Task.owner_id.is_not(None))
+            .distinct().order_by(Task.owner_id).limit(users)
+        ).scalars().all()
+        # Seeded cards mostly belong to the board owner; fill up with other users
+        others = db.execute(
+            select(User.id).where(User.id.not_in(user_ids)).order_by(User.id).limit(users - len(user_ids))
+        ).scalars().all()
+    return owner_id, email, board_ids, list(user_ids) + list(others)
+
+
+def run(boards: int = 20, users: int = 20, iterations: int = 50, seed: int = 7) -> Tuple[Recorder, Dict]:
+    """
+    Args:
+        boards: Boards on the dashboard
+        users: Card owners whose profiles it shows
+        iterations: Dashboard loads per mode
+        seed: Random seed (board choice and mode order)
+
+    Returns:
+        (Recorder with one operation per mode, ``{mode: queries per load}`` plus the dashboard size)
+    """
+    from app.main import app
+
+    owner_id, email, board_ids, user_ids = _dashboard(boards, users, seed)
+    headers = {"Authorization": f"Bearer {create_access_token(email, owner_id, 'user', timedelta(hours=1))}"}
+    board_list = ",".join(map(str, board_ids))
+    user_list = ",".join(map(str, user_ids))
+    recorder = Recorder()
+    queries: Dict[str, List[int]] = {mode: [0] for mode in MODES}
+    rng = random.Random(seed)
+
+    async def load(client: httpx.AsyncClient, mode: str) -> None:
+        if mode == "separate":
+            responses = [await client.get(f"/boards/{board_id}", headers=headers) for board_id in board_ids]
+            responses += [await client.get(f"/users/{user_id}", headers=headers) for user_id in user_ids]
+        else:
+            responses = [
+                await client.get(f"/boards/?ids={board_list}", headers=headers),
+                await client.get(f"/users/?ids={user_list}", headers=headers),
+            ]
+            if len(responses[0].json()) != len(board_ids) or len(responses[1].json()) != len(user_ids):
+                raise RuntimeError("Batch read returned fewer rows than asked for")
+        for response in responses:
+            response.raise_for_status()
+
+    async def drive() -> None:
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for mode in MODES[:2]:
+                    await load(client, mode)  # Warm up (builds the snapshots)
+                # Warm modes interleaved; the cold one last, as it bumps the versions
+                rounds = [rng.sample(MODES[:2], 2) for _ in range(iterations)] + [["batch.cold"]] * iterations
+                for modes in rounds:
+                    for mode in modes:
+                        if mode == "batch.cold":
+                            BoardSnapshot.invalidate(board_ids)
+                            for user_id in user_ids:
+                                delete_cache(f"user:profile:{user_id}")
+                        with _count_queries(queries[mode]):
+                            began = time.perf_counter_ns()
+                            await load(client, mode)
+                            recorder.add(mode, (time.perf_counter_ns() - began) / 1e6)
+
+    asyncio.run(drive())
+    figures = {mode: counter[0] / iterations for mode, counter in queries.items()}
+    figures.update(boards=len(board_ids), users=len(user_ids))
+    return recorder, figures
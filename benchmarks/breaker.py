@@ -0,0 +1,76 @@
+"""
+Breaker Benchmark - Cache call latency while Redis is down.
+
+The CLI points the application at an address where nothing answers
+(``--redis-host``/``--redis-port``) before importing it, then times
+``get_cache`` and ``aget_cache`` (near cache off, so every read goes to
+Redis):
+
+    no_breaker   the breaker never opens: every call waits for the
+                 connect timeout and client retries, then misses
+    breaker      the default breaker: the first ``BREAKER_MIN_CALLS``
+                 calls fail slowly, the rest are rejected at once
+
+It also times ``guard()`` around an empty body, the cost the breaker
+adds to every call while Redis is healthy.
+"""
+
+import asyncio
+import time
+from typing import Dict
+
+from app.core import cache
+from app.core.breaker import CLOSED
+from app.core.cache import aget_cache, cache_breaker, get_cache
+from app.core.near_cache import near_cache
+
+from benchmarks.report import Recorder
+
+
+def _reset(min_calls: int) -> None:
+    cache_breaker.reset()
+    cache_breaker.min_calls = min_calls
+
+
+def run(slow_calls: int = 5, calls: int = 1000) -> tuple:
+    """
+    Args:
+        slow_calls: Calls timed without the breaker (each waits for the timeout)
+        calls: Calls timed with the breaker
+
+    Returns:
+        (Recorder with one operation per mode and client, figures)
+    """
+    recorder = Recorder()
+    near_cache.enabled = False
+    min_calls = cache_breaker.min_calls
+
+    async def read_async(mode: str, count: int) -> None:
+        for index in range(count):
+            begin = time.perf_counter_ns()
+            await aget_cache(f"bench:breaker:{index}")
+            recorder.add(f"aget_cache.{mode}", (time.perf_counter_ns() - begin) / 1e6)
+        await cache.AsyncCacheClient.close()
+
+    try:
+        for mode, count, threshold in (("no_breaker", slow_calls, 10 ** 9), ("breaker", calls, min_calls)):
+            _reset(threshold)
+            for index in range(count):
+                begin = time.perf_counter_ns()
+                get_cache(f"bench:breaker:{index}")
+                recorder.add(f"get_cache.{mode}", (time.perf_counter_ns() - begin) / 1e6)
+            _reset(threshold)
+            asyncio.run(read_async(mode, count))
+        opened = cache_breaker.stats()
+    finally:
+        _reset(min_calls)
+
+    # Overhead on the healthy path: the guard alone, breaker closed
+    assert cache_breaker.state == CLOSED
+    iterations = 200_000
+    begin = time.perf_counter_ns()
+    for _ in range(iterations):
+        with cache_breaker.guard():
+            pass
+    figures: Dict = {"guard_ns": (time.perf_counter_ns() - begin) / iterations, "breaker": opened}
+    return recorder, figures
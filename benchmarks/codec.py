@@ -0,0 +1,113 @@
+"""
+Codec Benchmark - Size and speed of cache encodings on real board payloads.
+
+Dumps the largest seeded boards as ``BoardResponse`` (lanes and cards,
+the payload the snapshot cache stores), then for every installed
+serializer/compressor pair measures encode and decode time per board and
+the stored size. ``json-text`` is the pre-codec format (``json.dumps``
+text, no header). When Redis answers ``MEMORY USAGE``, each encoding is
+also written under ``bench:codec:*`` and its actual Redis footprint
+reported (keys are removed afterwards).
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import redis
+from sqlalchemy import func, select
+
+from app.core.cache import CacheClient
+from app.core.codec import COMPRESSORS, SERIALIZERS, Codec, schema_tag
+from app.db.connection import SessionLocal
+from app.models.board import Board
+from app.models.task import Task
+from app.models.user import User  # noqa: F401 (resolves Board.owner)
+from app.schemas.board import BoardResponse
+
+
+@dataclass
+class CodecResult:
+    name: str
+    stored_bytes: int = 0
+    encode_us: float = 0.0
+    decode_us: float = 0.0
+    redis_bytes: Optional[int] = None
+
+
+def load_payloads(boards: int) -> List[dict]:
+    """``BoardResponse`` dumps of the ``boards`` boards with the most cards."""
+    with SessionLocal() as db:
+        board_ids = db.execute(
+            select(Task.board_id).group_by(Task.board_id).order_by(func.count().desc()).limit(boards)
+        ).scalars().all()
+        return [
+            BoardResponse.model_validate(board).model_dump(mode="json")
+            for board in db.query(Board).filter(Board.id.in_(board_ids))
+        ]
+
+
+def _time_us(fn: Callable, items: list, repeat: int) -> float:
+    begin = time.perf_counter_ns()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    return (time.perf_counter_ns() - begin) / 1e3 / (repeat * len(items))
+
+
+def _redis_bytes(name: str, entries: List[bytes]) -> Optional[int]:
+    client = CacheClient.get_client()
+    keys = [f"bench:codec:{name}:{index}" for index in range(len(entries))]
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, entry in zip(keys, entries):
+            pipe.set(key, entry, ex=300)
+        pipe.execute()
+        return sum(client.memory_usage(key) or 0 for key in keys)
+    except redis.RedisError:
+        return None
+    finally:
+        try:
+            client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+
+def run(boards: int = 20, repeat: int = 20, min_compress_bytes: int = 1024) -> List[CodecResult]:
+    """
+    Compare every installed encoding on the same payloads.
+
+    Args:
+        boards: Number of (largest) boards to encode
+        repeat: Passes over the payloads per timing
+        min_compress_bytes: Compression threshold of the codecs under test
+
+    Returns:
+        One CodecResult per encoding, pre-codec JSON text first
+    """
+    payloads = load_payloads(boards)
+    schema = schema_tag(BoardResponse)
+
+    candidates = [("json-text", lambda value: json.dumps(value).encode("utf-8"), json.loads)]
+    for serializer_name in (name for name, _, _ in SERIALIZERS.values()):
+        for compressor_name in (name for name, _, _ in COMPRESSORS.values()):
+            codec = Codec(serializer_name, compressor_name, min_compress_bytes)
+            candidates.append((
+                codec.name,
+                lambda value, codec=codec: codec.encode(value, schema),
+                lambda data, codec=codec: codec.decode(data, schema),
+            ))
+
+    results = []
+    for name, encode, decode in candidates:
+        entries = [encode(payload) for payload in payloads]
+        assert [decode(entry) for entry in entries] == payloads, name
+        results.append(CodecResult(
+            name=name,
+            stored_bytes=sum(len(entry) for entry in entries),
+            encode_us=_time_us(encode, payloads, repeat),
+            decode_us=_time_us(decode, entries, repeat),
+            redis_bytes=_redis_bytes(name, entries),
+        ))
+    return results
@@ -0,0 +1,110 @@
+"""
+Contention Stress Test - Proves conditional updates lose no writes.
+
+Several threads run read-modify-write increments of one card's
+``position`` (read the card, write ``position + 1``). With optimistic
+concurrency each write carries the version it read and retries on 409,
+so the final position must equal the number of successful writes. With
+``check=False`` the version is not sent, which shows the lost updates the
+check prevents.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+from fastapi import HTTPException
+
+from app.db.connection import SessionLocal
+from app.schemas.task import TaskUpdate
+from app.services.task_service import TaskService
+
+from benchmarks.seed import Fixture
+
+
+@dataclass
+class ContentionResult:
+    workers: int
+    increments: int
+    check: bool
+    committed: int = 0
+    conflicts: int = 0
+    errors: int = 0
+    final_position: int = 0
+    start_position: int = 0
+    seconds: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list)
+
+    @property
+    def lost_updates(self) -> int:
+        return self.committed - (self.final_position - self.start_position)
+
+
+def _increment(user_id: int, task_id: int, check: bool, result: ContentionResult, lock: threading.Lock):
+    """One read-modify-write, retried until it commits."""
+    while True:
+        db = SessionLocal()
+        try:
+            service = TaskService(db, user_id)
+            task = service.get_task(task_id)
+            begin = time.perf_counter_ns()
+            service.update_task(
+                task_id, TaskUpdate(position=task.position + 1),
+                expected_version=task.version if check else None
+            )
+            took = (time.perf_counter_ns() - begin) / 1e6
+            with lock:
+                result.committed += 1
+                result.latencies_ms.append(took)
+            return
+        except HTTPException as e:
+            with lock:
+                if e.status_code == 409:
+                    result.conflicts += 1
+                else:
+                    result.errors += 1
+                    return
+        except Exception:
+            db.rollback()
+            with lock:
+                result.errors += 1
+            return
+        finally:
+            db.close()
+
+
+def run(workers: int = 8, increments: int = 50, check: bool = True) -> ContentionResult:
+    """
+    Hammer the first task of the busiest board from ``workers`` threads.
+
+    Args:
+        workers: Concurrent threads
+        increments: Increments each thread must commit
+        check: Send the read version (If-Match semantics)
+    """
+    with SessionLocal() as db:
+        fixture = Fixture.load(db)
+        board_id = max(fixture.tasks_by_board, key=lambda board: len(fixture.tasks_by_board[board]))
+        user_id = next(uid for uid, boards in fixture.boards_by_user.items() if board_id in boards)
+        task_id = fixture.tasks_by_board[board_id][0]
+        start = TaskService(db, user_id).get_task(task_id).position
+
+    result = ContentionResult(workers=workers, increments=increments, check=check, start_position=start)
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(increments):
+            _increment(user_id, task_id, check, result, lock)
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.seconds = time.perf_counter() - began
+
+    with SessionLocal() as db:
+        result.final_position = TaskService(db, user_id).get_task(task_id).position
+    return result
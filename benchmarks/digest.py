@@ -0,0 +1,135 @@
+"""
+Digest Benchmark - Chunked set-based digests vs. a per-user loop.
+
+Runs ``DigestService`` over every seeded user with a counting sink (no
+jobs or mail), once timed and once under ``tracemalloc`` for the peak
+Python allocation, which must stay flat as the user count grows. A small
+sample of users is also digested the naive way (``get_my_boards`` and
+two count queries per board) to show the query count the pipeline saves.
+Seeded tasks are timestamped at seed time, so the window is the last day.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import event, func, select
+
+from app.db.connection import SessionLocal, engine
+from app.models.task import Task
+from app.models.user import User
+from app.services.board_service import BoardService
+from app.services.digest_service import DigestService
+
+
+@dataclass
+class DigestResult:
+    chunk_size: int
+    users: int = 0
+    digests: int = 0
+    batches: int = 0
+    queries: int = 0
+    seconds: float = 0.0
+    peak_mb: float = 0.0
+    naive_users: int = 0
+    naive_queries: int = 0
+    naive_seconds: float = 0.0
+
+    def projected(self, users: int) -> Dict[str, float]:
+        """Seconds and queries extrapolated linearly to ``users`` users."""
+        scale = users / self.users if self.users else 0.0
+        naive_scale = users / self.naive_users if self.naive_users else 0.0
+        return {
+            "seconds": self.seconds * scale,
+            "queries": self.queries * scale,
+            "naive_seconds": self.naive_seconds * naive_scale,
+            "naive_queries": self.naive_queries * naive_scale,
+        }
+
+
+@contextmanager
+def _count_queries(counter: List[int]):
+    def before_cursor_execute(*args):
+        counter[0] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _pipeline(chunk_size: int, start: datetime, end: datetime, result: DigestResult) -> None:
+    db = SessionLocal()
+    try:
+        def sink(digests: List[Dict]) -> None:
+            result.batches += 1
+
+        counts = DigestService(db, chunk_size=chunk_size).run(start, end, sink=sink)
+        result.digests = counts["digests"]
+    finally:
+        db.close()
+
+
+def _naive(user_ids: List[int], start: datetime, end: datetime) -> None:
+    """The per-user loop the pipeline replaces."""
+    db = SessionLocal()
+    try:
+        for user_id in user_ids:
+            for board in BoardService(db, user_id).get_my_boards():
+                in_window = (Task.board_id == board.id, Task.updated_at >= start, Task.updated_at < end)
+                db.execute(select(func.count()).where(*in_window, Task.created_at >= start)).scalar()
+                db.execute(select(func.count()).where(*in_window, Task.created_at < start)).scalar()
+    finally:
+        db.close()
+
+
+def run(chunk_size: int = 5_000, naive_sample: int = 100) -> DigestResult:
+    """
+    Digest every seeded user and a naive sample.
+
+    Args:
+        chunk_size: Users per aggregate query
+        naive_sample: Users digested with the per-user loop (0 to skip)
+
+    Returns:
+        DigestResult
+    """
+    start = datetime.now() - timedelta(days=1)
+    end = datetime.now() + timedelta(minutes=1)
+    result = DigestResult(chunk_size=chunk_size)
+
+    db = SessionLocal()
+    try:
+        result.users = db.execute(select(func.count()).where(User.is_active.is_(True))).scalar()
+        sample = list(db.execute(select(User.id).order_by(User.id).limit(naive_sample)).scalars())
+    finally:
+        db.close()
+
+    queries = [0]
+    with _count_queries(queries):
+        began = time.perf_counter()
+        _pipeline(chunk_size, start, end, result)
+        result.seconds = time.perf_counter() - began
+    result.queries = queries[0]
+
+    # Second pass for memory only: tracemalloc slows allocation-heavy code
+    tracemalloc.start()
+    try:
+        _pipeline(chunk_size, start, end, DigestResult(chunk_size=chunk_size))
+        result.peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+    if sample:
+        queries = [0]
+        with _count_queries(queries):
+            began = time.perf_counter()
+            _naive(sample, start, end)
+            result.naive_seconds = time.perf_counter() - began
+        result.naive_users = len(sample)
+        result.naive_queries = queries[0]
+    return result
@@ -0,0 +1,32 @@
+"""
+Benchmark Environment - Points the application at the benchmark database.
+
+Application settings are read once at import time, so the environment
+must be prepared before anything under ``app`` is imported.
+"""
+
+import os
+
+
+DEFAULT_DATABASE_URL = "sqlite:///./bench.db"
+
+
+def configure(database_url: str = None) -> str:
+    """
+    Prepare environment variables for importing the application.
+
+    Args:
+        database_url: SQLAlchemy URL of the benchmark database
+
+    Returns:
+        The database URL in effect
+    """
+    os.environ["DATABASE_URL"] = database_url or os.environ.get(
+        "BENCH_DATABASE_URL", DEFAULT_DATABASE_URL
+    )
+    # Tokens are minted locally by the load driver, any key works
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    # Keep benchmark numbers independent of a local mail setup
+    os.environ["MAIL_USERNAME"] = ""
+    os.environ["MAIL_PASSWORD"] = ""
+    return os.environ["DATABASE_URL"]
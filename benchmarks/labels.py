@@ -0,0 +1,165 @@
+"""
+Labels Benchmark - "Cards with labels A and B" on one big board.
+
+Creates a board with ``tasks`` cards and ``labels`` labels (popularity
+skewed: the first label is on about a third of the cards, the last on a
+handful), then times the first page of ``GET /tasks/?board_id=&labels=``
+(``TaskService.list_tasks``, sorted by ``-updated_at``) against the same
+page read through a ``task_labels(task_id, label_id)`` join table grouped
+per request:
+
+    labels.common / join.common   the most used label
+    labels.pair / join.pair       the two most used labels (both required)
+    labels.rare / join.rare       the least used label
+
+Modes are interleaved. The board, its cards and the join table are
+removed afterwards.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Column, Integer, MetaData, Table, delete, func, insert, select
+
+from app.db.connection import SessionLocal, engine
+from app.models.board import Board, Label, Lane
+from app.models.task import Task
+from app.models.user import User
+from app.services.permission_service import PermissionResolver
+from app.services.task_service import TaskService
+
+from benchmarks.report import Recorder
+
+INSERT_BATCH = 5_000
+PAGE = 50
+
+task_labels = Table(
+    "bench_task_labels", MetaData(),
+    Column("label_id", Integer, primary_key=True),
+    Column("task_id", Integer, primary_key=True),
+)
+
+
+def _create_board(tasks: int, labels: int, seed: int) -> Tuple[int, int, List[int]]:
+    """Board, cards and labels; returns (owner id, board id, label ids by popularity)."""
+    rng = random.Random(seed)
+    db = SessionLocal()
+    try:
+        owner_id = db.execute(select(User.id).order_by(User.id).limit(1)).scalar()
+        if owner_id is None:
+            raise RuntimeError("No users found; run `python -m benchmarks seed` first")
+        board = Board(title="Labels benchmark", owner_id=owner_id)
+        db.add(board)
+        db.flush()
+        lanes = [Lane(title=title, position=index, board_id=board.id)
+                 for index, title in enumerate(("Todo", "Doing", "Done"))]
+        label_rows = [Label(name=f"label-{index}", board_id=board.id) for index in range(labels)]
+        db.add_all(lanes + label_rows)
+        db.flush()
+        label_ids = [label.id for label in label_rows]
+        # Zipf-like popularity: label k is on about 1/(3(k+1)) of the cards
+        weights = [1 / (3 * (rank + 1)) for rank in range(labels)]
+        now = datetime.now()
+        rows, links = [], []
+        for index in range(tasks):
+            chosen = sorted(label_id for label_id, weight in zip(label_ids, weights) if rng.random() < weight)
+            rows.append({
+                "title": f"card {index}", "position": index, "priority": rng.randint(1, 5),
+                "lane_id": lanes[index % len(lanes)].id, "board_id": board.id, "owner_id": owner_id,
+                "updated_at": now - timedelta(seconds=index), "label_ids": chosen,
+            })
+            if len(rows) == INSERT_BATCH:
+                ids = db.execute(insert(Task).returning(Task.id), rows).scalars().all()
+                links += [{"task_id": task_id, "label_id": label_id}
+                          for task_id, row in zip(ids, rows) for label_id in row["label_ids"]]
+                rows = []
+        if rows:
+            ids = db.execute(insert(Task).returning(Task.id), rows).scalars().all()
+            links += [{"task_id": task_id, "label_id": label_id}
+                      for task_id, row in zip(ids, rows) for label_id in row["label_ids"]]
+        task_labels.create(db.connection(), checkfirst=True)
+        for start in range(0, len(links), INSERT_BATCH):
+            db.execute(insert(task_labels), links[start:start + INSERT_BATCH])
+        db.commit()
+        PermissionResolver.invalidate([owner_id])
+        return owner_id, board.id, label_ids
+    finally:
+        db.close()
+
+
+def _drop_board(board_id: int, owner_id: int) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(delete(Task).where(Task.board_id == board_id))
+        db.execute(delete(Label).where(Label.board_id == board_id))
+        db.execute(delete(Lane).where(Lane.board_id == board_id))
+        db.execute(delete(Board).where(Board.id == board_id))
+        db.commit()
+    finally:
+        db.close()
+    task_labels.drop(engine, checkfirst=True)
+    PermissionResolver.invalidate([owner_id])
+
+
+def _join_page(db, board_id: int, label_ids: List[int]) -> list:
+    """The same page through the join table: group per card, keep those with every label."""
+    matching = (
+        select(task_labels.c.task_id)
+        .where(task_labels.c.label_id.in_(label_ids))
+        .group_by(task_labels.c.task_id)
+        .having(func.count() == len(label_ids))
+    )
+    return db.execute(
+        select(Task)
+        .where(Task.board_id == board_id, Task.id.in_(matching))
+        .order_by(Task.updated_at.desc(), Task.id.desc())
+        .limit(PAGE + 1)
+    ).scalars().all()
+
+
+def run(tasks: int = 100_000, labels: int = 50, iterations: int = 30, seed: int = 7) -> Tuple[Recorder, Dict]:
+    """
+    Args:
+        tasks: Cards on the board
+        labels: Labels on the board
+        iterations: Pages read per mode
+        seed: Random seed (label assignment and mode order)
+
+    Returns:
+        (Recorder with one operation per mode, ``{case: cards matching}``)
+    """
+    owner_id, board_id, label_ids = _create_board(tasks, labels, seed)
+    cases = {"common": label_ids[:1], "pair": label_ids[:2], "rare": label_ids[-1:]}
+    recorder = Recorder()
+    rng = random.Random(seed)
+    try:
+        with SessionLocal() as db:
+            matches = {name: db.execute(
+                select(func.count()).select_from(
+                    select(task_labels.c.task_id).where(task_labels.c.label_id.in_(ids))
+                    .group_by(task_labels.c.task_id).having(func.count() == len(ids)).subquery()
+                )
+            ).scalar() for name, ids in cases.items()}
+        modes = [f"{kind}.{name}" for name in cases for kind in ("labels", "join")]
+        for _ in range(iterations):
+            for mode in rng.sample(modes, len(modes)):
+                kind, name = mode.split(".")
+                db = SessionLocal()
+                try:
+                    began = time.perf_counter_ns()
+                    if kind == "labels":
+                        page = TaskService(db, owner_id).list_tasks(
+                            {"board_id": board_id, "labels": cases[name]}, "-updated_at", PAGE
+                        )["items"]
+                    else:
+                        page = _join_page(db, board_id, cases[name])[:PAGE]
+                    recorder.add(mode, (time.perf_counter_ns() - began) / 1e6)
+                finally:
+                    db.close()
+                if len(page) != min(PAGE, matches[name]):
+                    raise RuntimeError(f"{mode} returned {len(page)} cards, expected {min(PAGE, matches[name])}")
+        return recorder, matches
+    finally:
+        _drop_board(board_id, owner_id)
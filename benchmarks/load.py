@@ -0,0 +1,166 @@
+"""
+ASGI Load Driver - Drives the v1 routers in-process through httpx.
+
+Requests go through the full FastAPI stack (routing, auth decode,
+validation, serialization) without a network hop, so the numbers track
+application cost rather than the host's TCP stack.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+
+from app.core.security import create_access_token
+from app.db.connection import SessionLocal
+
+from benchmarks.report import Recorder
+from benchmarks.seed import VOCABULARY, Fixture
+
+
+@dataclass
+class Scenario:
+    """One endpoint in the request mix."""
+    name: str
+    weight: int
+    build: Callable[[random.Random], Tuple[str, str, dict, dict]]
+
+
+def build_scenarios(fixture: Fixture) -> List[Scenario]:
+    """
+    Request mix modelled on a kanban client: mostly board reads and
+    card moves, fewer creates and profile reads.
+    """
+    owners = {board: uid for uid, boards in fixture.boards_by_user.items() for board in boards}
+    board_ids = [board for board, tasks in fixture.tasks_by_board.items() if tasks]
+    tokens = {
+        uid: create_access_token(fixture.emails[uid], uid, "user", timedelta(hours=2))
+        for uid in fixture.user_ids
+    }
+
+    def auth(user_id: int) -> dict:
+        return {"Authorization": f"Bearer {tokens[user_id]}"}
+
+    def target(rng: random.Random):
+        board_id = rng.choice(board_ids)
+        return owners[board_id], board_id
+
+    def list_boards(rng):
+        user_id = rng.choice(fixture.user_ids)
+        return "GET", "/boards/", auth(user_id), None
+
+    def get_board(rng):
+        user_id, board_id = target(rng)
+        return "GET", f"/boards/{board_id}", auth(user_id), None
+
+    def move_task(rng):
+        user_id, board_id = target(rng)
+        task_id = rng.choice(fixture.tasks_by_board[board_id])
+        body = {
+            "new_lane_id": rng.choice(fixture.lanes_by_board[board_id]),
+            "new_position": rng.randint(0, 50),
+        }
+        return "PUT", f"/tasks/{task_id}/move", auth(user_id), body
+
+    def update_task(rng):
+        user_id, board_id = target(rng)
+        task_id = rng.choice(fixture.tasks_by_board[board_id])
+        return "PUT", f"/tasks/{task_id}", auth(user_id), {"priority": rng.randint(1, 5)}
+
+    def create_task(rng):
+        user_id, board_id = target(rng)
+        body = {"title": "load card", "lane_id": rng.choice(fixture.lanes_by_board[board_id])}
+        return "POST", "/tasks/", auth(user_id), body
+
+    def list_tasks(rng):
+        user_id, board_id = target(rng)
+        return "GET", f"/tasks/?board_id={board_id}&sort=-updated_at", auth(user_id), None
+
+    def search_tasks(rng):
+        user_id, _ = target(rng)
+        query = " ".join(rng.sample(VOCABULARY, rng.randint(1, 2)))
+        return "GET", f"/tasks/search?q={query}", auth(user_id), None
+
+    def board_stats(rng):
+        user_id, board_id = target(rng)
+        return "GET", f"/boards/{board_id}/stats", auth(user_id), None
+
+    def read_me(rng):
+        user_id = rng.choice(fixture.user_ids)
+        return "GET", "/users/me", auth(user_id), None
+
+    return [
+        Scenario("GET /boards/", 10, list_boards),
+        Scenario("GET /boards/{id}", 30, get_board),
+        Scenario("PUT /tasks/{id}/move", 30, move_task),
+        Scenario("PUT /tasks/{id}", 10, update_task),
+        Scenario("POST /tasks/", 10, create_task),
+        Scenario("GET /tasks/", 5, list_tasks),
+        Scenario("GET /tasks/search", 5, search_tasks),
+        Scenario("GET /boards/{id}/stats", 5, board_stats),
+        Scenario("GET /users/me", 10, read_me),
+    ]
+
+
+async def _worker(client: httpx.AsyncClient, scenarios: List[Scenario], rng: random.Random,
+                  recorder: Recorder, deadline: float, budget: Dict[str, int]) -> None:
+    weights = [scenario.weight for scenario in scenarios]
+    while time.perf_counter() < deadline and budget["remaining"] > 0:
+        budget["remaining"] -= 1
+        scenario = rng.choices(scenarios, weights=weights)[0]
+        method, url, headers, body = scenario.build(rng)
+        begin = time.perf_counter_ns()
+        try:
+            response = await client.request(method, url, headers=headers, json=body)
+            took = (time.perf_counter_ns() - begin) / 1e6
+            if response.status_code >= 400:
+                recorder.fail(scenario.name)
+            else:
+                recorder.add(scenario.name, took)
+        except httpx.HTTPError:
+            recorder.fail(scenario.name)
+
+
+async def _drive(concurrency: int, duration: float, requests: int, seed: int,
+                 only: str = None) -> Tuple[Recorder, float]:
+    from app.main import app
+
+    with SessionLocal() as db:
+        fixture = Fixture.load(db)
+    scenarios = [s for s in build_scenarios(fixture) if not only or only in s.name]
+
+    recorder = Recorder()
+    budget = {"remaining": requests}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            started = time.perf_counter()
+            deadline = started + duration
+            await asyncio.gather(*(
+                _worker(client, scenarios, random.Random(seed + index), recorder, deadline, budget)
+                for index in range(concurrency)
+            ))
+            wall = time.perf_counter() - started
+    return recorder, wall
+
+
+def run(concurrency: int = 8, duration: float = 30.0, requests: int = 5_000,
+        seed: int = 11, only: str = None) -> Tuple[Recorder, float]:
+    """
+    Drive the request mix until ``duration`` seconds or ``requests`` calls.
+
+    Args:
+        concurrency: Number of concurrent virtual clients
+        duration: Upper bound on run time in seconds
+        requests: Upper bound on the number of requests
+        seed: RNG seed for the request mix
+        only: Optional substring filter on scenario names
+
+    Returns:
+        Recorder with samples and the wall-clock duration in seconds
+    """
+    return asyncio.run(_drive(concurrency, duration, requests, seed, only))
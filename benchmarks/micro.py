@@ -0,0 +1,136 @@
+"""
+Service Microbenchmarks - Times service methods without the HTTP stack.
+
+Each iteration uses a fresh session, as ``get_db`` does per request, and
+read operations include response-model serialization so lazy loads are
+part of the measurement.
+"""
+
+import random
+import time
+from typing import Callable, Dict
+
+from app.db.connection import SessionLocal
+from app.schemas.board import BoardResponse
+from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.services.board_service import BoardService
+from app.services.search_service import SearchService
+from app.services.task_service import TaskService
+
+from benchmarks.report import Recorder
+from benchmarks.seed import VOCABULARY, Fixture
+
+
+def build_operations(fixture: Fixture, rng: random.Random) -> Dict[str, Callable]:
+    """
+    Map of operation name to a callable taking a session.
+
+    Targets are chosen per call so hot and cold boards are both exercised
+    in proportion to the seeded skew.
+    """
+    owners = {board: uid for uid, boards in fixture.boards_by_user.items() for board in boards}
+    board_ids = [board for board in fixture.tasks_by_board if fixture.tasks_by_board[board]]
+
+    def target():
+        board_id = rng.choice(board_ids)
+        return owners[board_id], board_id
+
+    def get_board(db):
+        user_id, board_id = target()
+        board = BoardService(db, user_id).get_board(board_id)
+        BoardResponse.model_validate(board).model_dump()
+
+    def get_my_boards(db):
+        user_id = rng.choice(fixture.user_ids)
+        boards = BoardService(db, user_id).get_my_boards()
+        [BoardResponse.model_validate(board).model_dump() for board in boards]
+
+    def create_task(db):
+        user_id, board_id = target()
+        lane_id = rng.choice(fixture.lanes_by_board[board_id])
+        task = TaskService(db, user_id).create_task(
+            TaskCreate(title="bench card", lane_id=lane_id, position=0)
+        )
+        TaskResponse.model_validate(task).model_dump()
+
+    def move_task(db):
+        user_id, board_id = target()
+        task_id = rng.choice(fixture.tasks_by_board[board_id])
+        lane_id = rng.choice(fixture.lanes_by_board[board_id])
+        task = TaskService(db, user_id).move_task(task_id, lane_id, rng.randint(0, 50))
+        TaskResponse.model_validate(task).model_dump()
+
+    def update_task(db):
+        user_id, board_id = target()
+        task_id = rng.choice(fixture.tasks_by_board[board_id])
+        task = TaskService(db, user_id).update_task(
+            task_id, TaskUpdate(priority=rng.randint(1, 5))
+        )
+        TaskResponse.model_validate(task).model_dump()
+
+    def list_tasks(db):
+        user_id, board_id = target()
+        page = TaskService(db, user_id).list_tasks(
+            {"board_id": board_id}, rng.choice(["-updated_at", "-priority", "-created_at"])
+        )
+        [TaskResponse.model_validate(task).model_dump() for task in page["items"]]
+
+    def search_tasks(db):
+        user_id, _ = target()
+        query = " ".join(rng.sample(VOCABULARY, rng.randint(1, 2)))
+        page = SearchService(db, user_id).search_tasks(query, limit=20)
+        [hit.model_dump() for hit in page["items"]]
+
+    return {
+        "board_service.get_board": get_board,
+        "board_service.get_my_boards": get_my_boards,
+        "task_service.create_task": create_task,
+        "task_service.move_task": move_task,
+        "task_service.update_task": update_task,
+        "task_service.list_tasks": list_tasks,
+        "search_service.search_tasks": search_tasks,
+    }
+
+
+def run(iterations: int = 200, warmup: int = 20, seed: int = 7,
+        only: str = None) -> Recorder:
+    """
+    Run every service microbenchmark.
+
+    Args:
+        iterations: Measured calls per operation
+        warmup: Unmeasured calls per operation (connection pool, caches)
+        seed: RNG seed for target selection
+        only: Optional substring filter on operation names
+
+    Returns:
+        Recorder holding the samples
+    """
+    rng = random.Random(seed)
+    with SessionLocal() as db:
+        fixture = Fixture.load(db)
+    operations = build_operations(fixture, rng)
+
+    recorder = Recorder()
+    for name, operation in operations.items():
+        if only and only not in name:
+            continue
+        started = time.perf_counter()
+        for index in range(warmup + iterations):
+            db = SessionLocal()
+            try:
+                begin = time.perf_counter_ns()
+                operation(db)
+                took = (time.perf_counter_ns() - begin) / 1e6
+                if index >= warmup:
+                    recorder.add(name, took)
+            except Exception:
+                db.rollback()
+                if index >= warmup:
+                    recorder.fail(name)
+            finally:
+                db.close()
+            if index + 1 == warmup:
+                started = time.perf_counter()
+        recorder.elapsed[name] = time.perf_counter() - started
+    return recorder
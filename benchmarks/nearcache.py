@@ -0,0 +1,90 @@
+"""
+Near-Cache Benchmark - Hot reads with and without the in-process layer.
+
+Drives ``GET /users/me`` and ``GET /boards/{id}`` through ASGI from one
+client, switching the near cache on and off per request (random order,
+so drift hits both modes equally). With the layer off every lookup goes
+to Redis (ACL version, role map, profile); with it on, warm lookups are
+dict reads. Needs a reachable Redis for the pub/sub listener.
+"""
+
+import asyncio
+import random
+import time
+from datetime import timedelta
+from typing import Dict, Tuple
+
+import httpx
+
+from app.core.near_cache import near_cache
+from app.core.security import create_access_token
+from app.db.connection import SessionLocal
+
+from benchmarks.report import Recorder
+from benchmarks.seed import Fixture
+
+MODES = ("redis", "near")
+
+
+async def _drive(iterations: int, users: int, seed: int) -> Tuple[Recorder, Dict]:
+    from app.main import app
+
+    rng = random.Random(seed)
+    with SessionLocal() as db:
+        fixture = Fixture.load(db)
+    # A small working set, as on a busy worker: the same users come back
+    user_ids = rng.sample(fixture.user_ids, min(users, len(fixture.user_ids)))
+    headers = {
+        uid: {"Authorization": f"Bearer {create_access_token(fixture.emails[uid], uid, 'user', timedelta(hours=1))}"}
+        for uid in user_ids
+    }
+
+    recorder = Recorder()
+    enabled = near_cache.enabled
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                near_cache.enabled = True
+                await client.get("/users/me", headers=headers[user_ids[0]])
+                for _ in range(50):
+                    if near_cache.listening:
+                        break
+                    await asyncio.sleep(0.1)
+                if not near_cache.listening:
+                    raise RuntimeError("Near-cache listener did not subscribe; is Redis reachable?")
+
+                for _ in range(iterations):
+                    for mode in rng.sample(MODES, len(MODES)):
+                        user_id = rng.choice(user_ids)
+                        boards = fixture.boards_by_user[user_id]
+                        requests = [("GET /users/me", "/users/me")]
+                        if boards:
+                            requests.append(("GET /boards/{id}", f"/boards/{rng.choice(boards)}"))
+                        near_cache.enabled = mode == "near"
+                        for name, url in requests:
+                            begin = time.perf_counter_ns()
+                            response = await client.get(url, headers=headers[user_id])
+                            took = (time.perf_counter_ns() - begin) / 1e6
+                            if response.status_code >= 400:
+                                recorder.fail(f"{name} ({mode})")
+                            else:
+                                recorder.add(f"{name} ({mode})", took)
+    finally:
+        near_cache.enabled = enabled
+    return recorder, near_cache.stats()
+
+
+def run(iterations: int = 500, users: int = 50, seed: int = 7) -> Tuple[Recorder, Dict]:
+    """
+    Time hot reads per mode.
+
+    Args:
+        iterations: Request pairs per mode
+        users: Distinct users issuing the reads
+        seed: Random seed
+
+    Returns:
+        (Recorder with one operation per endpoint and mode, near-cache stats)
+    """
+    return asyncio.run(_drive(iterations, users, seed))
@@ -0,0 +1,95 @@
+"""
+Query Plan Check - Asserts every allowed task listing shape uses its index.
+
+For each combination accepted by ``app.services.task_query`` this runs
+EXPLAIN (first page and a keyset page) and fails when the plan does not
+scan the expected index or needs a separate sort step.
+
+On PostgreSQL sequential scans are disabled for the check, so a small
+seeded table still proves the index *can* serve the query.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from sqlalchemy import text
+
+from app.core.pagination import encode_cursor
+from app.db.connection import SessionLocal
+from app.services.task_query import TaskQuery, allowed_combinations
+
+from benchmarks.seed import Fixture
+
+
+def _sample_filters(fixture: Fixture, names: dict) -> dict:
+    board_id = max(fixture.tasks_by_board, key=lambda board: len(fixture.tasks_by_board[board]))
+    owner_id = next(uid for uid, boards in fixture.boards_by_user.items() if board_id in boards)
+    values = {
+        "board_id": board_id,
+        "lane_id": fixture.lanes_by_board[board_id][0],
+        "owner_id": owner_id,
+        "min_priority": 3,
+        "updated_since": datetime.now() - timedelta(days=1),
+    }
+    return {name: values[name] for name in names}, board_id
+
+
+def _sample_cursor(query: TaskQuery) -> str:
+    if query.plan.order in ("updated_at", "created_at"):
+        return encode_cursor([datetime.now().isoformat(), 1_000_000])
+    return encode_cursor([3, 1_000_000])
+
+
+def _check_sqlite(db, sql: str, index: str) -> List[str]:
+    details = [row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    problems = []
+    if not any(f"INDEX {index}" in detail for detail in details):
+        problems.append(f"expected {index}, plan: {details}")
+    if any("TEMP B-TREE" in detail for detail in details):
+        problems.append(f"needs a sort step, plan: {details}")
+    return problems
+
+
+def _walk(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+def _check_postgres(db, sql: str, index: str) -> List[str]:
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    raw = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    nodes = list(_walk(plan))
+    problems = []
+    if not any(node.get("Index Name") == index for node in nodes):
+        problems.append(f"expected {index}, got {[node['Node Type'] for node in nodes]}")
+    if any(node["Node Type"] in ("Sort", "Incremental Sort") for node in nodes):
+        problems.append("needs a sort step")
+    return problems
+
+
+def run() -> List[Tuple[str, List[str]]]:
+    """
+    Check every allowed combination.
+
+    Returns:
+        List of (description, problems) for each checked query
+    """
+    results = []
+    with SessionLocal() as db:
+        fixture = Fixture.load(db)
+        dialect = db.get_bind().dialect
+        check = _check_postgres if dialect.name == "postgresql" else _check_sqlite
+
+        for plan, names, sort in allowed_combinations():
+            filters, board_id = _sample_filters(fixture, names)
+            query = TaskQuery(filters, sort)
+            for page, cursor in (("first", None), ("keyset", _sample_cursor(query))):
+                stmt = query.statement([board_id], 50, cursor)
+                sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+                label = f"{'+'.join(sorted(names))} sort={sort} ({page} page)"
+                results.append((label, check(db, sql, plan.index)))
+            db.rollback()
+    return results
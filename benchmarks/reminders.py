@@ -0,0 +1,175 @@
+"""
+Reminder Benchmark - Several schedulers sending a burst of due dates.
+
+Arms ``reminders`` reminders due over the next ``spread`` seconds on
+random seeded cards, and gives every other card a due date in the past,
+already reminded (the history a naive poll keeps rescanning). Then
+``schedulers`` ReminderSchedulers run side by side (threads, each with
+its own sessions) until every reminder is queued. Recorded:
+
+    claim       one claim round of a scheduler (pending-index range scans)
+    fire        one tick that sent something (mark sent + one job per batch)
+    poll.naive  ``SELECT id FROM tasks WHERE due_at <= now + window``, the
+                query the scheduler replaces
+
+Fails unless every reminder was queued exactly once; lateness (time the
+job was queued minus the due time) is reported. The due dates and jobs
+are removed afterwards.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy import delete, select, update
+
+from app.db.connection import SessionLocal
+from app.models.board import Board
+from app.models.job import Job
+from app.models.task import Task
+from app.models.user import User
+from app.services.reminder_service import ReminderScheduler
+from app.services.task_query import IN_DELETED_LANE
+
+from benchmarks.report import Recorder, percentile
+
+
+class _TimedScheduler(ReminderScheduler):
+    def __init__(self, recorder: Recorder, **kwargs):
+        super().__init__(**kwargs)
+        self.recorder = recorder
+
+    def claim(self, now: float) -> int:
+        began = time.perf_counter_ns()
+        claimed = super().claim(now)
+        self.recorder.add("claim", (time.perf_counter_ns() - began) / 1e6)
+        return claimed
+
+    def fire(self, now: float) -> int:
+        began = time.perf_counter_ns()
+        sent = super().fire(now)
+        if sent:
+            self.recorder.add("fire", (time.perf_counter_ns() - began) / 1e6)
+        return sent
+
+
+def _arm(reminders: int, spread: float, seed: int) -> Tuple[Dict[int, datetime], datetime]:
+    """Due dates on ``reminders`` live cards, plus sent ones in the past on every other card."""
+    db = SessionLocal()
+    try:
+        candidates = db.execute(
+            select(Task.id)
+            .join(Board, Board.id == Task.board_id)
+            .join(User, User.id == Task.owner_id)
+            .where(Board.deleted_at.is_(None), ~IN_DELETED_LANE, User.is_active.is_(True))
+        ).scalars().all()
+        chosen = random.Random(seed).sample(candidates, min(reminders, len(candidates)))
+        db.execute(
+            update(Task).where(Task.id % 2 == 0)
+            .values(due_at=datetime.now() - timedelta(days=1), remind_at=None, updated_at=Task.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        start = datetime.now() + timedelta(seconds=2)
+        due = {task_id: start + timedelta(seconds=spread * index / len(chosen)) for index, task_id in enumerate(chosen)}
+        for task_id, due_at in due.items():
+            db.execute(
+                update(Task).where(Task.id == task_id)
+                .values(due_at=due_at, remind_at=due_at, updated_at=Task.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+        return due, start
+    finally:
+        db.close()
+
+
+def _queued(since: datetime) -> List[Tuple[int, datetime]]:
+    """(task id, time queued) of every reminder in jobs queued since ``since``."""
+    db = SessionLocal()
+    try:
+        jobs = db.execute(
+            select(Job.payload, Job.run_at).where(Job.name == "send_due_reminders", Job.run_at >= since)
+        ).all()
+        return [(reminder["task_id"], run_at) for payload, run_at in jobs for reminder in payload["reminders"]]
+    finally:
+        db.close()
+
+
+def _cleanup(since: datetime) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(delete(Job).where(Job.name == "send_due_reminders", Job.run_at >= since))
+        db.execute(
+            update(Task).where(Task.due_at.is_not(None))
+            .values(due_at=None, remind_at=None, updated_at=Task.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def run(reminders: int = 5_000, schedulers: int = 3, spread: float = 20.0, window: int = 10,
+        poll: float = 1.0, batch_size: int = 500, polls: int = 20, seed: int = 7) -> Tuple[Recorder, Dict]:
+    """
+    Args:
+        reminders: Reminders armed
+        schedulers: Schedulers run side by side
+        spread: Seconds over which the reminders come due
+        window: Scheduler claim window (seconds)
+        poll: Seconds between a scheduler's claims
+        batch_size: Reminders per claim statement and per job
+        polls: Timed runs of the naive poll query
+        seed: Random seed (card choice)
+
+    Returns:
+        (Recorder with claim / fire / poll.naive, figures: sent, duplicates, missing, lateness ms)
+    """
+    recorder = Recorder()
+    began = datetime.now()
+    due, start = _arm(reminders, spread, seed)
+    try:
+        db = SessionLocal()
+        try:
+            for _ in range(polls):
+                ticks = time.perf_counter_ns()
+                db.execute(select(Task.id).where(Task.due_at <= datetime.now() + timedelta(seconds=window))).all()
+                recorder.add("poll.naive", (time.perf_counter_ns() - ticks) / 1e6)
+        finally:
+            db.close()
+
+        workers = [
+            _TimedScheduler(recorder, window_seconds=window, poll_seconds=poll, batch_size=batch_size)
+            for _ in range(schedulers)
+        ]
+        deadline = time.time() + (start - datetime.now()).total_seconds() + spread + window + 30
+        threads = [threading.Thread(target=worker.run, kwargs={"until": deadline}) for worker in workers]
+        for thread in threads:
+            thread.start()
+        while time.time() < deadline and sum(worker.counts["sent"] for worker in workers) < len(due):
+            time.sleep(0.5)
+        for worker in workers:
+            worker.stopping = True
+        for thread in threads:
+            thread.join()
+
+        queued = _queued(began)
+        sent = {}
+        for task_id, run_at in queued:
+            sent.setdefault(task_id, run_at)
+        lateness = sorted((run_at - due[task_id]).total_seconds() * 1000 for task_id, run_at in sent.items())
+        figures = {
+            "sent": len(sent),
+            "duplicates": len(queued) - len(sent),
+            "missing": len(set(due) - set(sent)),
+            "per_scheduler": [worker.counts["sent"] for worker in workers],
+            "late_p50_ms": percentile(lateness, 50) if lateness else None,
+            "late_p95_ms": percentile(lateness, 95) if lateness else None,
+            "late_max_ms": lateness[-1] if lateness else None,
+            "early": sum(1 for value in lateness if value < 0),
+        }
+        return recorder, figures
+    finally:
+        _cleanup(began)
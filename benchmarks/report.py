@@ -0,0 +1,135 @@
+"""
+Benchmark Reporting - Latency summaries, JSON reports and baseline checks.
+"""
+
+import json
+import math
+import platform
+import subprocess
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+@dataclass
+class Recorder:
+    """Collects per-operation latencies (in milliseconds) and error counts."""
+    samples: Dict[str, List[float]] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    elapsed: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, name: str, millis: float) -> None:
+        self.samples.setdefault(name, []).append(millis)
+
+    def fail(self, name: str) -> None:
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def summary(self, wall_seconds: Optional[float] = None) -> Dict[str, dict]:
+        """
+        Summarise every operation.
+
+        Args:
+            wall_seconds: Shared wall clock for concurrent runs. When omitted,
+                throughput is derived from each operation's own elapsed time.
+
+        Returns:
+            Mapping of operation name to its statistics
+        """
+        results = {}
+        for name in sorted(set(self.samples) | set(self.errors)):
+            values = sorted(self.samples.get(name, []))
+            seconds = wall_seconds or self.elapsed.get(name) or (sum(values) / 1000) or 1e-9
+            results[name] = {
+                "count": len(values),
+                "errors": self.errors.get(name, 0),
+                "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "p99_ms": round(percentile(values, 99), 3),
+                "max_ms": round(values[-1], 3) if values else 0.0,
+                "throughput_rps": round(len(values) / seconds, 2),
+            }
+        return results
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(kind: str, results: Dict[str, dict], params: dict) -> dict:
+    """Wrap results with the metadata needed to compare runs later."""
+    return {
+        "kind": kind,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "results": results,
+    }
+
+
+def write_report(report: dict, path: Optional[str]) -> None:
+    """Write the report as JSON to ``path`` (or stdout when omitted)."""
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if path:
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+
+
+def print_table(results: Dict[str, dict]) -> None:
+    """Human readable summary printed after every run."""
+    header = f"{'operation':<36}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'rps':>10}{'err':>6}"
+    print(header)
+    print("-" * len(header))
+    for name, row in results.items():
+        print(
+            f"{name:<36}{row['count']:>8}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+            f"{row['p99_ms']:>10.2f}{row['throughput_rps']:>10.1f}{row['errors']:>6}"
+        )
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.10,
+            metric: str = "p95_ms") -> List[str]:
+    """
+    Compare two reports operation by operation.
+
+    Args:
+        current: Report of the run under test
+        baseline: Stored reference report
+        tolerance: Allowed relative slowdown (0.10 = 10%)
+        metric: Latency statistic to compare
+
+    Returns:
+        Human readable regression messages (empty when within tolerance)
+    """
+    regressions = []
+    for name, base_row in baseline.get("results", {}).items():
+        row = current.get("results", {}).get(name)
+        if row is None:
+            regressions.append(f"{name}: missing from current run")
+            continue
+        base_value, value = base_row.get(metric, 0.0), row.get(metric, 0.0)
+        if base_value and value > base_value * (1 + tolerance):
+            regressions.append(
+                f"{name}: {metric} {value:.2f}ms vs baseline {base_value:.2f}ms "
+                f"(+{(value / base_value - 1) * 100:.1f}%)"
+            )
+        if row.get("errors", 0) > base_row.get("errors", 0):
+            regressions.append(f"{name}: {row['errors']} errors vs baseline {base_row.get('errors', 0)}")
+    return regressions
@@ -0,0 +1,242 @@
+"""
+Dataset Seeder - Generates realistic users x boards x lanes x tasks data.
+
+Real tenants are skewed: a few users own most boards and a few boards
+hold most cards. Counts are spread with Zipf-like weights controlled
+by ``skew`` (0 = uniform, ~1 = heavy head).
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.cache import clear_pattern
+from app.core.security import hash_password
+from app.db.connection import Base, engine
+from app.db.partitioning import partition_tasks
+from app.models.activity import ActivityEvent  # noqa: F401 (create_all builds activity_events)
+from app.models.board import Board, Lane
+from app.models.job import Job  # noqa: F401 (create_all builds the jobs table too)
+from app.models.task import Task
+from app.models.user import User
+from app.services.permission_service import PermissionResolver
+from app.services.snapshot_service import BoardSnapshot
+from app.services.stats_service import StatsService
+
+
+BENCH_PASSWORD = "benchmark"
+LANE_TITLES = ["Todo", "In Progress", "Review", "Blocked", "Done"]
+# Card text is drawn from a small vocabulary so search terms have
+# realistic, varied selectivity
+VOCABULARY = (
+    "api auth backend billing bug cache checkout cleanup client config customer dashboard "
+    "database deploy design docs email export feature fix frontend invoice login logging "
+    "metrics migration mobile monitoring onboarding payment performance refactor release "
+    "report search security settings signup sso staging storage sync test upgrade "
+    "webhook"
+).split()
+INSERT_BATCH = 5_000
+
+
+@dataclass
+class SeedConfig:
+    """Shape of the generated dataset."""
+    users: int = 100
+    boards: int = 300
+    lanes_per_board: int = 3
+    tasks: int = 20_000
+    skew: float = 1.0
+    seed: int = 42
+    partitions: int = 0  # > 0: hash-partition tasks by board_id first (PostgreSQL)
+
+
+@dataclass
+class Fixture:
+    """Ids of seeded rows, used by the benchmarks to pick realistic targets."""
+    boards_by_user: Dict[int, List[int]] = field(default_factory=dict)
+    lanes_by_board: Dict[int, List[int]] = field(default_factory=dict)
+    tasks_by_board: Dict[int, List[int]] = field(default_factory=dict)
+    emails: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def user_ids(self) -> List[int]:
+        return [uid for uid, boards in self.boards_by_user.items() if boards]
+
+    @classmethod
+    def load(cls, db: Session, task_sample: int = 20_000) -> "Fixture":
+        """
+        Read the seeded ids back from the database.
+
+        Args:
+            db: Database session
+            task_sample: Maximum number of task ids to keep in memory
+
+        Returns:
+            Populated Fixture
+        """
+        fixture = cls()
+        for user_id, email in db.execute(select(User.id, User.email)):
+            fixture.emails[user_id] = email
+            fixture.boards_by_user.setdefault(user_id, [])
+        for board_id, owner_id in db.execute(select(Board.id, Board.owner_id)):
+            fixture.boards_by_user.setdefault(owner_id, []).append(board_id)
+        for lane_id, board_id in db.execute(select(Lane.id, Lane.board_id)):
+            fixture.lanes_by_board.setdefault(board_id, []).append(lane_id)
+
+        rows = db.execute(
+            select(Task.id, Task.board_id)
+            .order_by(Task.id)
+            .limit(task_sample)
+        )
+        for task_id, board_id in rows:
+            fixture.tasks_by_board.setdefault(board_id, []).append(task_id)
+        return fixture
+
+
+def zipf_counts(total: int, buckets: int, skew: float, rng: random.Random) -> List[int]:
+    """
+    Split ``total`` items over ``buckets`` with Zipf-like weights.
+
+    Bucket order is shuffled so low ids are not always the heavy ones.
+    """
+    if buckets <= 0:
+        return []
+    weights = [1.0 / (rank + 1) ** skew for rank in range(buckets)]
+    rng.shuffle(weights)
+    scale = total / sum(weights)
+    counts = [int(w * scale) for w in weights]
+    # Hand out the rounding remainder to the heaviest buckets
+    remainder = total - sum(counts)
+    for index in sorted(range(buckets), key=lambda i: -weights[i])[:remainder]:
+        counts[index] += 1
+    return counts
+
+
+def _bulk_insert(db: Session, model, rows: List[dict]) -> None:
+    for start in range(0, len(rows), INSERT_BATCH):
+        db.execute(insert(model), rows[start:start + INSERT_BATCH])
+
+
+def _reset_sequences(db: Session) -> None:
+    """Explicit ids bypass PostgreSQL sequences; move them past the seeded rows."""
+    if db.bind.dialect.name != "postgresql":
+        return
+    for table in ("users", "boards", "lanes", "tasks"):
+        db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 1))"
+        ))
+
+
+def seed(config: SeedConfig) -> dict:
+    """
+    Drop and recreate the schema, then insert a generated dataset.
+
+    Args:
+        config: Dataset shape
+
+    Returns:
+        Row counts per table
+    """
+    if config.partitions and engine.dialect.name != "postgresql":
+        raise ValueError("--partitions requires a PostgreSQL benchmark database")
+    rng = random.Random(config.seed)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    if config.partitions:
+        # Partition while empty so the dataset is inserted straight into the slices
+        with engine.begin() as connection:
+            partition_tasks(connection, config.partitions)
+
+    # bcrypt is deliberately slow; every seeded user shares one hash
+    hashed = hash_password(BENCH_PASSWORD)
+    users = [
+        {
+            "id": uid,
+            "email": f"bench{uid}@example.com",
+            "hashed_password": hashed,
+            "full_name": f"Bench User {uid}",
+            "is_active": True,
+            "role": "user",
+        }
+        for uid in range(1, config.users + 1)
+    ]
+
+    boards, lanes = [], []
+    board_id = lane_id = 0
+    for uid, count in zip(range(1, config.users + 1),
+                          zipf_counts(config.boards, config.users, config.skew, rng)):
+        for _ in range(count):
+            board_id += 1
+            boards.append({
+                "id": board_id,
+                "title": f"Board {board_id}",
+                "description": f"Benchmark board owned by user {uid}",
+                "owner_id": uid,
+            })
+            for position in range(config.lanes_per_board):
+                lane_id += 1
+                lanes.append({
+                    "id": lane_id,
+                    "title": LANE_TITLES[position % len(LANE_TITLES)],
+                    "position": position,
+                    "board_id": board_id,
+                })
+
+    with Session(engine) as db:
+        _bulk_insert(db, User, users)
+        _bulk_insert(db, Board, boards)
+        _bulk_insert(db, Lane, lanes)
+        db.commit()
+
+        # Tasks are streamed in batches so large datasets (millions of
+        # cards) never sit in memory at once
+        batch, task_count = [], 0
+        for row in _generate_tasks(config, boards, rng):
+            batch.append(row)
+            if len(batch) >= INSERT_BATCH:
+                db.execute(insert(Task), batch)
+                db.commit()
+                task_count += len(batch)
+                batch = []
+        if batch:
+            db.execute(insert(Task), batch)
+            task_count += len(batch)
+        _reset_sequences(db)
+        db.commit()
+        # Bulk inserts bypass TaskService; count the cards once
+        StatsService(db).rebuild()
+
+    # Ids are reused across reseeds; drop role maps and snapshots cached for the old dataset
+    PermissionResolver.invalidate(user["id"] for user in users)
+    clear_pattern("user:profile:*")
+    BoardSnapshot.invalidate(board["id"] for board in boards)
+    return {"users": len(users), "boards": len(boards), "lanes": len(lanes), "tasks": task_count}
+
+
+def _generate_tasks(config: SeedConfig, boards: List[dict], rng: random.Random):
+    """Yield task rows board by board, skewed towards later lanes."""
+    task_id = 0
+    lane_weights = [position + 1 for position in range(config.lanes_per_board)]
+    per_board = zipf_counts(config.tasks, len(boards), config.skew, rng)
+    for board, count in zip(boards, per_board):
+        first_lane = (board["id"] - 1) * config.lanes_per_board + 1
+        lane_ids = list(range(first_lane, first_lane + config.lanes_per_board))
+        positions = dict.fromkeys(lane_ids, 0)
+        # Later lanes ("Done") accumulate more cards, as on real boards
+        for lane in rng.choices(lane_ids, weights=lane_weights, k=count):
+            task_id += 1
+            yield {
+                "id": task_id,
+                "title": " ".join(rng.sample(VOCABULARY, 3)).capitalize(),
+                "description": " ".join(rng.choices(VOCABULARY, k=12)),
+                "position": positions[lane],
+                "priority": rng.randint(1, 5),
+                "lane_id": lane,
+                "board_id": board["id"],
+                "owner_id": board["owner_id"],
+            }
+            positions[lane] += 1
@@ -0,0 +1,135 @@
+"""
+Snapshot Benchmark - CPU per request and bytes on the wire for board reads.
+
+Serves the largest seeded board (``GET /boards/{id}``) in three ways and
+reports, per request, the CPU time of this process (``time.process_time``),
+the wall time and the body size:
+
+    serialize        the response built per request from a snapshot dict
+                     already in memory: ``BoardResponse`` validation and
+                     JSON rendering, as ``response_model`` does (the best
+                     case of the path before precompression, Redis read
+                     and decode not counted)
+    serialize.gzip   the same plus gzip level 9, what a per-request
+                     compression middleware (``GZipMiddleware``) adds
+    asgi.<encoding>  the endpoint as shipped, through ASGI with the board
+                     owner's token and ``Accept-Encoding: <encoding>``:
+                     auth and access check, then the stored variant sent
+                     as is (raw bytes received; the client does not decode them)
+
+The first request of the ASGI pass builds the variants of the current
+version; it is reported on its own as ``build`` and left out of the
+per-request figures. Needs Redis.
+"""
+
+import asyncio
+import gzip
+import json
+import time
+from datetime import timedelta
+from typing import Dict, Tuple
+
+import httpx
+from sqlalchemy import func, select
+
+from app.core.content_encoding import ENCODERS, IDENTITY
+from app.core.security import create_access_token
+from app.db.connection import SessionLocal
+from app.models.board import Board
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.board import BoardResponse
+from app.services.snapshot_service import BoardSnapshot
+
+from benchmarks.report import Recorder
+
+
+def _largest_board() -> Tuple[int, int, str]:
+    with SessionLocal() as db:
+        board_id = db.execute(
+            select(Task.board_id).group_by(Task.board_id).order_by(func.count().desc()).limit(1)
+        ).scalar()
+        if board_id is None:
+            raise RuntimeError("No tasks found; run `python -m benchmarks seed` first")
+        owner_id, email = db.execute(
+            select(User.id, User.email).join(Board, Board.owner_id == User.id).where(Board.id == board_id)
+        ).one()
+    return board_id, owner_id, email
+
+
+def _render(snapshot: dict) -> bytes:
+    content = BoardResponse.model_validate(snapshot).model_dump(mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class _Meter:
+    """Wall time to the recorder, CPU time and bytes per operation."""
+
+    def __init__(self, recorder: Recorder):
+        self.recorder = recorder
+        self.figures: Dict[str, Dict[str, float]] = {}
+
+    def measure(self, name: str, requests: int, serve) -> None:
+        cpu = 0.0
+        size = 0
+        for _ in range(requests):
+            cpu_began, began = time.process_time(), time.perf_counter_ns()
+            size = serve()
+            self.recorder.add(name, (time.perf_counter_ns() - began) / 1e6)
+            cpu += time.process_time() - cpu_began
+        self.figures[name] = {"cpu_ms": cpu * 1000 / requests, "bytes": size}
+
+    async def ameasure(self, name: str, requests: int, serve) -> None:
+        cpu = 0.0
+        size = 0
+        for _ in range(requests):
+            cpu_began, began = time.process_time(), time.perf_counter_ns()
+            size = await serve()
+            self.recorder.add(name, (time.perf_counter_ns() - began) / 1e6)
+            cpu += time.process_time() - cpu_began
+        self.figures[name] = {"cpu_ms": cpu * 1000 / requests, "bytes": size}
+
+
+def run(requests: int = 200) -> Tuple[Recorder, Dict[str, Dict[str, float]]]:
+    """
+    Args:
+        requests: Requests timed per mode
+
+    Returns:
+        (Recorder with wall times per mode, ``{mode: {"cpu_ms", "bytes"}}``)
+    """
+    from app.main import app
+
+    board_id, owner_id, email = _largest_board()
+    snapshot = BoardSnapshot.load(board_id)
+    meter = _Meter(Recorder())
+
+    meter.measure("serialize", requests, lambda: len(_render(snapshot)))
+    meter.measure("serialize.gzip", requests, lambda: len(gzip.compress(_render(snapshot), compresslevel=9)))
+
+    token = create_access_token(email, owner_id, "user", timedelta(hours=1))
+    encodings = [IDENTITY] + [encoding for encoding in ("br", "zstd", "gzip") if encoding in ENCODERS]
+
+    async def drive() -> None:
+        # A fresh version, so the first request below is the one that compresses
+        BoardSnapshot.invalidate([board_id])
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                async def fetch(encoding: str) -> int:
+                    # Raw body: decoding it is the client's CPU, not the server's
+                    async with client.stream(
+                        "GET", f"/boards/{board_id}",
+                        headers={"Authorization": f"Bearer {token}", "Accept-Encoding": encoding}
+                    ) as response:
+                        response.raise_for_status()
+                        if response.headers.get("content-encoding", IDENTITY) != encoding:
+                            raise RuntimeError(f"Asked for {encoding}, got {response.headers.get('content-encoding')}")
+                        return sum([len(chunk) async for chunk in response.aiter_raw()])
+
+                await meter.ameasure("build", 1, lambda: fetch(IDENTITY))
+                for encoding in encodings:
+                    await meter.ameasure(f"asgi.{encoding}", requests, lambda: fetch(encoding))
+
+    asyncio.run(drive())
+    return meter.recorder, meter.figures
@@ -0,0 +1,175 @@
+"""
+Stampede Check - Concurrent misses on one key must load it once.
+
+Every scenario reads a fresh key (``bench:stampede:*``) through
+``cached()`` with a loader that builds the snapshot of the largest board
+(``BoardSnapshot.load``) after ``load_ms`` of extra latency, standing in
+for a slow query. Loads are counted with a Redis INCR, so the count
+covers every process:
+
+    miss       N coroutines in one worker miss at once (asyncio single flight)
+    workers    P spawned processes x N coroutines miss at once (Redis lock)
+    stale      N coroutines read an expired entry inside its stale window:
+               all get the old value at once, one background refresh runs
+    unguarded  up to 100 of those misses with plain get-then-set, for contrast
+
+The check fails unless the guarded scenarios load exactly once.
+"""
+
+import asyncio
+import multiprocessing
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import List
+
+from sqlalchemy import func, select
+
+from app.core.cache import AsyncCacheClient, CacheClient, aget_cache, aset_cache, cached
+from app.db.connection import SessionLocal
+from app.models.task import Task
+from app.services.snapshot_service import BoardSnapshot
+
+from benchmarks.report import percentile
+
+# Every unguarded miss is a full load; more callers only make the contrast slower
+UNGUARDED_CALLERS = 100
+
+
+@dataclass
+class StampedeResult:
+    scenario: str
+    callers: int
+    loads: int
+    seconds: float
+    latencies_ms: List[float] = field(default_factory=list)
+
+    @property
+    def p99_ms(self) -> float:
+        return percentile(sorted(self.latencies_ms), 99)
+
+
+def _largest_board() -> int:
+    with SessionLocal() as db:
+        board_id = db.execute(
+            select(Task.board_id).group_by(Task.board_id).order_by(func.count().desc()).limit(1)
+        ).scalar()
+    if board_id is None:
+        raise RuntimeError("No tasks found; run `python -m benchmarks seed` first")
+    return board_id
+
+
+def _loader(board_id: int, counter: str, load_ms: float):
+    def load():
+        CacheClient.get_client().incr(counter)
+        time.sleep(load_ms / 1000)
+        return BoardSnapshot.load(board_id)
+    return load
+
+
+async def _callers(callers: int, read) -> List[float]:
+    async def timed() -> float:
+        began = time.perf_counter_ns()
+        if await read() is None:
+            raise RuntimeError("Read returned no snapshot")
+        return (time.perf_counter_ns() - began) / 1e6
+
+    return list(await asyncio.gather(*(timed() for _ in range(callers))))
+
+
+def _loads(counter: str) -> int:
+    return int(CacheClient.get_client().get(counter) or 0)
+
+
+async def _scenario(scenario: str, board_id: int, callers: int, load_ms: float) -> StampedeResult:
+    key, counter = f"bench:stampede:{uuid.uuid4().hex}", f"bench:stampede:loads:{uuid.uuid4().hex}"
+    load = _loader(board_id, counter, load_ms)
+
+    if scenario == "stale":
+        # Fill, then let the entry expire into its stale window
+        await cached(key, load, ttl_seconds=0.5, stale_seconds=60, beta=0)
+        await asyncio.sleep(0.6)
+        CacheClient.get_client().set(counter, 0)
+
+    async def guarded():
+        return await cached(key, load, ttl_seconds=60, stale_seconds=60, beta=0)
+
+    async def unguarded():
+        value = await aget_cache(key)
+        if value is None:
+            value = await asyncio.to_thread(load)
+            await aset_cache(key, value)
+        return value
+
+    if scenario == "unguarded":
+        callers = min(callers, UNGUARDED_CALLERS)
+    began = time.perf_counter()
+    latencies = await _callers(callers, unguarded if scenario == "unguarded" else guarded)
+    seconds = time.perf_counter() - began
+    if scenario == "stale":
+        # The refresh runs after the callers were served
+        await asyncio.sleep(load_ms / 1000 + 0.5)
+    result = StampedeResult(scenario, callers, _loads(counter), seconds, latencies)
+    CacheClient.get_client().delete(key, counter)
+    return result
+
+
+def _worker(key: str, counter: str, board_id: int, callers: int, load_ms: float, start_at: float, queue) -> None:
+    async def drive():
+        load = _loader(board_id, counter, load_ms)
+        await asyncio.sleep(max(0.0, start_at - time.time()))
+        latencies = await _callers(callers, lambda: cached(key, load, ttl_seconds=60, stale_seconds=60, beta=0))
+        await AsyncCacheClient.close()
+        return latencies
+
+    queue.put(asyncio.run(drive()))
+
+
+def _workers(board_id: int, processes: int, callers: int, load_ms: float) -> StampedeResult:
+    key, counter = f"bench:stampede:{uuid.uuid4().hex}", f"bench:stampede:loads:{uuid.uuid4().hex}"
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    # Spawned workers import the app first; all of them start reading at this instant
+    start_at = time.time() + 5.0
+    children = [
+        context.Process(target=_worker, args=(key, counter, board_id, callers, load_ms, start_at, queue))
+        for _ in range(processes)
+    ]
+    for child in children:
+        child.start()
+    latencies = []
+    for _ in children:
+        latencies.extend(queue.get(timeout=120))
+    for child in children:
+        child.join()
+    seconds = time.time() - start_at
+    result = StampedeResult("workers", processes * callers, _loads(counter), seconds, latencies)
+    CacheClient.get_client().delete(key, counter)
+    return result
+
+
+def run(callers: int = 1000, processes: int = 4, load_ms: float = 100.0) -> List[StampedeResult]:
+    """
+    Run every scenario against the largest seeded board.
+
+    Args:
+        callers: Concurrent coroutines per worker
+        processes: Worker processes in the cross-worker scenario
+        load_ms: Extra latency of each load
+
+    Returns:
+        One StampedeResult per scenario
+    """
+    board_id = _largest_board()
+
+    async def in_process():
+        results = [
+            await _scenario(scenario, board_id, callers, load_ms)
+            for scenario in ("miss", "stale", "unguarded")
+        ]
+        await AsyncCacheClient.close()
+        return results
+
+    results = asyncio.run(in_process())
+    results.insert(1, _workers(board_id, processes, callers, load_ms))
+    return results
@@ -0,0 +1,196 @@
+"""
+Subtasks Benchmark - A page of cards with nested checklists.
+
+Creates a board of ``cards`` cards, each with a checklist tree of
+``fanout`` items per level, ``depth`` levels deep (120 items per card by
+default), then times:
+
+    expand.page    ``GET /tasks/?board_id=&expand=subtasks`` (list_tasks with
+                   expand): the page, then every tree in one query
+    walk.page      the same page, then each tree walked level by level (one
+                   children query per item, what recursive relationships do)
+    move.subtree   ``SubtaskService.move_subtask`` of a top-level item (its
+                   whole branch) to another card and back: one UPDATE
+    move.rowwise   the same move rewriting each item's path through the ORM
+
+SQL statements per run are reported; the run fails unless both page
+modes count the same progress and moves keep every item. The board is
+removed afterwards.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+from sqlalchemy import delete, event, insert, select
+
+from app.db.connection import SessionLocal, engine
+from app.models.board import Board, Lane
+from app.models.task import Subtask, Task
+from app.models.user import User
+from app.schemas.task import SubtaskMove
+from app.services.permission_service import PermissionResolver
+from app.services.subtask_service import SubtaskService, build_tree
+from app.services.task_service import TaskService
+
+from benchmarks.report import Recorder
+
+MODES = ("expand.page", "walk.page", "move.subtree", "move.rowwise")
+
+
+@contextmanager
+def _count_queries(counter: List[int]):
+    def before_cursor_execute(*args):
+        counter[0] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _create_board(cards: int, fanout: int, depth: int, seed: int) -> Tuple[int, int, List[int]]:
+    """Board with ``cards`` cards and their checklists; returns (owner id, board id, card ids)."""
+    rng = random.Random(seed)
+    Subtask.__table__.create(engine, checkfirst=True)
+    db = SessionLocal()
+    try:
+        owner_id = db.execute(select(User.id).order_by(User.id).limit(1)).scalar()
+        if owner_id is None:
+            raise RuntimeError("No users found; run `python -m benchmarks seed` first")
+        board = Board(title="Subtasks benchmark", owner_id=owner_id)
+        db.add(board)
+        db.flush()
+        lane = Lane(title="Todo", position=0, board_id=board.id)
+        db.add(lane)
+        db.flush()
+        card_ids = db.execute(insert(Task).returning(Task.id), [
+            {"title": f"card {index}", "position": index, "lane_id": lane.id, "board_id": board.id,
+             "owner_id": owner_id}
+            for index in range(cards)
+        ]).scalars().all()
+        for card_id in card_ids:
+            # One level per statement: the parents' ids make the children's paths
+            level = [""]
+            for _ in range(depth):
+                rows = [{"task_id": card_id, "path": path, "title": f"item {index}", "position": index,
+                         "done": rng.random() < 0.4}
+                        for path in level for index in range(fanout)]
+                created = db.execute(insert(Subtask).returning(Subtask.id, Subtask.path), rows).all()
+                level = [f"{path}{item_id}/" for item_id, path in created]
+        db.commit()
+        PermissionResolver.invalidate([owner_id])
+        return owner_id, board.id, list(card_ids)
+    finally:
+        db.close()
+
+
+def _drop_board(board_id: int, owner_id: int, card_ids: List[int]) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(delete(Subtask).where(Subtask.task_id.in_(card_ids)))
+        db.execute(delete(Task).where(Task.board_id == board_id))
+        db.execute(delete(Lane).where(Lane.board_id == board_id))
+        db.execute(delete(Board).where(Board.id == board_id))
+        db.commit()
+    finally:
+        db.close()
+    PermissionResolver.invalidate([owner_id])
+
+
+def _walk(db, task_id: int) -> list:
+    """One card's tree loaded a level at a time: a children query per item."""
+    def children(path: str) -> list:
+        items = db.execute(
+            select(Subtask.id, Subtask.task_id, Subtask.path, Subtask.title, Subtask.done, Subtask.position)
+            .where(Subtask.task_id == task_id, Subtask.path == path)
+        ).all()
+        found = list(items)
+        for item in items:
+            found += children(f"{path}{item.id}/")
+        return found
+
+    return children("")
+
+
+def _move_rowwise(db, item_id: int, task_id: int) -> None:
+    """Move an item's branch to the top level of ``task_id``, one row at a time."""
+    item = db.get(Subtask, item_id)
+    prefix = f"{item.path}{item.id}/"
+    branch = db.execute(
+        select(Subtask).where(Subtask.task_id == item.task_id, Subtask.path.startswith(prefix))
+    ).scalars().all()
+    for row in branch:
+        row.path = f"{item.id}/" + row.path[len(prefix):]
+        row.task_id = task_id
+    item.path, item.task_id = "", task_id
+    db.commit()
+
+
+def run(cards: int = 50, fanout: int = 3, depth: int = 4, iterations: int = 20,
+        seed: int = 7) -> Tuple[Recorder, Dict]:
+    """
+    Args:
+        cards: Cards on the board (one page)
+        fanout: Items per checklist level
+        depth: Checklist levels
+        iterations: Runs per mode
+        seed: Random seed (done flags and mode order)
+
+    Returns:
+        (Recorder with one operation per mode, figures: items per card, statements per page)
+    """
+    owner_id, board_id, card_ids = _create_board(cards, fanout, depth, seed)
+    recorder = Recorder()
+    rng = random.Random(seed)
+    statements = {mode: [0] for mode in MODES}
+    filters = {"board_id": board_id}
+    try:
+        with SessionLocal() as db:
+            moved_id, moved_card = db.execute(
+                select(Subtask.id, Subtask.task_id).where(Subtask.task_id == card_ids[0], Subtask.path == "")
+                .order_by(Subtask.id).limit(1)
+            ).one()
+        other_card = card_ids[-1]
+        per_card = sum(fanout ** level for level in range(1, depth + 1))
+
+        for _ in range(iterations):
+            for mode in rng.sample(MODES, len(MODES)):
+                db = SessionLocal()
+                try:
+                    counter = statements[mode]
+                    began = time.perf_counter_ns()
+                    with _count_queries(counter):
+                        if mode == "expand.page":
+                            page = TaskService(db, owner_id).list_tasks(filters, "-updated_at", cards, expand=True)
+                            trees = {task.id: task.progress for task in page["items"]}
+                        elif mode == "walk.page":
+                            page = TaskService(db, owner_id).list_tasks(filters, "-updated_at", cards)
+                            trees = {task.id: build_tree(_walk(db, task.id))[1] for task in page["items"]}
+                        else:
+                            for target in (other_card, moved_card):
+                                if mode == "move.subtree":
+                                    SubtaskService(db, owner_id).move_subtask(moved_id, SubtaskMove(task_id=target))
+                                else:
+                                    _move_rowwise(db, moved_id, target)
+                    recorder.add(mode, (time.perf_counter_ns() - began) / 1e6)
+                    if mode.endswith("page"):
+                        if len(trees) != cards or any(tree != {"done": tree["done"], "total": per_card}
+                                                      or tree != build_tree(_walk(db, task_id))[1]
+                                                      for task_id, tree in list(trees.items())[:3]):
+                            raise RuntimeError(f"{mode} returned wrong trees")
+                    elif any(len(_walk(db, card)) != per_card for card in (moved_card, other_card)):
+                        raise RuntimeError(f"{mode} lost items")
+                finally:
+                    db.close()
+
+        figures = {
+            "items_per_card": per_card,
+            "items_moved": per_card // fanout,
+            "statements": {mode: counter[0] // iterations for mode, counter in statements.items()},
+        }
+        return recorder, figures
+    finally:
+        _drop_board(board_id, owner_id, card_ids)
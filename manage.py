@@ -4,13 +4,36 @@ TaskMaster Management CLI
 
 Professional administrative utility for managing the TaskMaster application.
 Usage:
-    python manage.py init-db        - Reset and initialize database tables
+    python manage.py init-db        - Reset the database and apply all migrations
+    python manage.py migrate        - Apply migrations up to head (or a given revision; --partition to partition tasks)
+    python manage.py revision -m    - Create a new migration (--autogenerate to diff the models)
+    python manage.py status         - Show the applied revision and pending migrations
+    python manage.py lint-migrations - Reject migrations that would lock large tables
     python manage.py create-admin   - Create a new administrative user
+    python manage.py purge          - Remove soft-deleted boards and lanes in batches
+    python manage.py archive        - Move stale tasks to the archive (--loop to keep running, --enqueue for the worker)
+    python manage.py digest         - Queue daily digest emails (--day, --enqueue for the worker)
+    python manage.py snapshot-stats - Record today's cumulative-flow point for every board
+    python manage.py rebuild-stats  - Recount board counters from the tasks table
+    python manage.py worker         - Run queued jobs (emails, purges, archive runs)
+    python manage.py scheduler      - Queue due-date reminders on time (run several for more throughput)
+    python manage.py requeue-dead   - Retry jobs in the dead-letter queue
+    python manage.py partition-tasks - Hash-partition the tasks table by board (PostgreSQL)
 """
 
+import os
+import signal
 import sys
+import time
 import argparse
+from datetime import date, timedelta
+from typing import Optional
 import getpass
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.db.connection import engine, Base, SessionLocal
@@ -19,16 +42,94 @@ from app.core.security import hash_password
 # Import all models to ensure metadata is loaded
 from app.models.task import Task
 from app.models.board import Board, Lane
+from app.services.purge_service import PurgeService, PURGE_BATCH_SIZE
+from app.services.archive_service import ArchiveService
+from app.services.job_service import JobService, JobWorker
+from app.services.reminder_service import ReminderScheduler
+from app.services.digest_service import DigestService, day_window
+from app.services.stats_service import StatsService
+from app.core.config import settings
+from app.db.partitioning import partition_tasks
+from app.db.migration_lint import lint
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
+def alembic_config() -> Config:
+    """Alembic configuration for this checkout (URL comes from settings)."""
+    return Config(ALEMBIC_INI)
 
 def init_db():
-    """Drops and recreates all database tables."""
+    """Drops all tables and rebuilds the schema from the migrations."""
     print("Initializing Database...")
     print("   - Dropping existing tables...")
     Base.metadata.drop_all(bind=engine)
-    print("   - Creating new schema...")
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    print("   - Applying migrations...")
+    command.upgrade(alembic_config(), "head")
     print("Database initialized successfully.")
 
+def current_revision():
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+def migrate(revision: str, fake: bool, partitions: Optional[int] = None):
+    """
+    Moves (or with --fake only stamps) the database to a revision, up or down.
+
+    ``partitions`` opts in to the tasks partitioning of revision 0013.
+    """
+    config = alembic_config()
+    if partitions:
+        config.cmd_opts = argparse.Namespace(x=[f"partitions={partitions}"])
+    if fake:
+        command.stamp(config, revision)
+        print(f"Database stamped at {revision} without running migrations.")
+        return
+    current = current_revision()
+    applied = set()
+    if current:
+        script = ScriptDirectory.from_config(config)
+        applied = {rev.revision for rev in script.iterate_revisions(current, "base")} - {current}
+    if revision == "base" or revision in applied:
+        command.downgrade(config, revision)
+    else:
+        command.upgrade(config, revision)
+    print(f"Database migrated to {revision}.")
+
+def new_revision(message: str, autogenerate: bool):
+    """Creates the next numbered migration file."""
+    config = alembic_config()
+    script = ScriptDirectory.from_config(config)
+    numbers = [int(rev.revision) for rev in script.walk_revisions() if rev.revision.isdigit()]
+    rev_id = f"{max(numbers, default=0) + 1:04d}"
+    command.revision(config, message=message, autogenerate=autogenerate, rev_id=rev_id)
+
+def migration_status():
+    """Prints the applied revision and any migrations still to run."""
+    script = ScriptDirectory.from_config(alembic_config())
+    current = current_revision()
+    head = script.get_current_head()
+    print(f"Current revision: {current or 'none'} (head: {head})")
+    pending = list(script.iterate_revisions(head, current or "base"))
+    if not pending:
+        print("Database is up to date.")
+        return
+    print("Pending migrations:")
+    for rev in reversed(pending):
+        print(f"   - {rev.revision}: {rev.doc}")
+
+def lint_migrations() -> bool:
+    """Checks every migration for locking DDL on large tables."""
+    violations = lint(alembic_config())
+    for violation in violations:
+        print(violation)
+    if violations:
+        print(f"{len(violations)} blocking statement(s); use app.db.online_ddl or add a lint waiver.")
+        return False
+    print("Migrations are lock-safe.")
+    return True
+
 def create_admin():
     """Interactively creates a system administrator."""
     print("Create Admin User")
@@ -81,11 +182,160 @@ def create_admin():
     finally:
         db.close()
 
+def purge(batch_size: int, pause: float):
+    """Purges every soft-deleted board and lane (sweeps up missed background runs)."""
+    print("Purging soft-deleted data...")
+    db = SessionLocal()
+    try:
+        counts = PurgeService(db, batch_size=batch_size, pause_seconds=pause).purge_all()
+        print(f"Purged {counts['boards']} boards, {counts['lanes']} lanes, {counts['tasks']} tasks.")
+    except Exception as e:
+        print(f"Error purging: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+def archive(batch_size: int, loop: bool, interval_minutes: int, enqueue: bool):
+    """Applies board/lane archive policies once, or forever as a scheduled worker."""
+    if enqueue:
+        db = SessionLocal()
+        try:
+            print(f"Queued archive job {JobService(db).enqueue('archive')}.")
+        finally:
+            db.close()
+        return
+    while True:
+        db = SessionLocal()
+        try:
+            counts = ArchiveService(db, batch_size=batch_size).run()
+            print(f"Archived {counts['tasks']} tasks from {counts['lanes']} lanes with a policy.")
+        except Exception as e:
+            print(f"Error archiving: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+        if not loop:
+            return
+        time.sleep(interval_minutes * 60)
+
+def digest(day: str, enqueue: bool):
+    """Builds the digests of one day (default yesterday) and queues them for sending."""
+    target = date.fromisoformat(day) if day else date.today() - timedelta(days=1)
+    db = SessionLocal()
+    try:
+        if enqueue:
+            # One attempt: a retry would queue the batches already sent again
+            job_id = JobService(db).enqueue("daily_digest", {"day": target.isoformat()}, max_attempts=1)
+            print(f"Queued daily digest job {job_id} for {target}.")
+            return
+        counts = DigestService(db).run(*day_window(target))
+        print(f"Queued {counts['digests']} digests for {target} in {counts['batches']} send jobs.")
+    except Exception as e:
+        print(f"Error building digests: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+def snapshot_stats(enqueue: bool):
+    """Copies the live lane counters into today's flow snapshot (run daily or more often)."""
+    db = SessionLocal()
+    try:
+        if enqueue:
+            print(f"Queued stats snapshot job {JobService(db).enqueue('snapshot_stats')}.")
+            return
+        print(f"Recorded {StatsService(db).snapshot()} lane counts for {date.today()}.")
+    except Exception as e:
+        print(f"Error recording snapshot: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+def rebuild_stats():
+    """Recounts board counters from tasks (backfill after bulk loads, drift repair)."""
+    db = SessionLocal()
+    try:
+        print(f"Rebuilt {StatsService(db).rebuild()} counter rows.")
+    except Exception as e:
+        print(f"Error rebuilding counters: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+def worker(concurrency: int, drain: bool):
+    """Runs jobs until interrupted (or, with --drain, until the queue is empty)."""
+    job_worker = JobWorker(concurrency=concurrency)
+
+    def stop(signum, frame):
+        # Stop claiming and let in-flight jobs finish (deploys send SIGTERM)
+        print("Stopping worker after in-flight jobs...")
+        job_worker.stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Worker {job_worker.worker_id} started with concurrency {job_worker.concurrency}.")
+    outcomes = job_worker.run(drain=drain)
+    print(f"Worker finished: {outcomes or 'no jobs'}.")
+
+def scheduler():
+    """Claims due-date reminders ahead of time and queues them as they come due."""
+    reminder_scheduler = ReminderScheduler()
+
+    def stop(signum, frame):
+        # Unsent claims are handed back for the other schedulers
+        print("Stopping scheduler...")
+        reminder_scheduler.stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Scheduler {reminder_scheduler.scheduler_id} started "
+          f"({reminder_scheduler.window_seconds}s window, {reminder_scheduler.tick_seconds}s ticks).")
+    counts = reminder_scheduler.run()
+    print(f"Scheduler finished: {counts}.")
+
+def requeue_dead(name: str):
+    """Moves dead-lettered jobs back to the queue with fresh attempts."""
+    db = SessionLocal()
+    try:
+        print(f"Requeued {JobService(db).requeue_dead(name)} dead jobs.")
+        print(f"Queue: {JobService(db).counts()}")
+    finally:
+        db.close()
+
+def partition(partitions: int):
+    """Rebuilds the tasks table as hash partitions of board_id (maintenance window)."""
+    print(f"Partitioning tasks into {partitions} partitions (locks the table)...")
+    try:
+        with engine.begin() as connection:
+            partition_tasks(connection, partitions)
+        print("Tasks table partitioned successfully.")
+    except Exception as e:
+        print(f"Error partitioning: {e}")
+
 def main():
     parser = argparse.ArgumentParser(description="TaskMaster Management CLI")
-    parser.add_argument('command', choices=['init-db', 'create-admin'], help="Command to execute")
+    parser.add_argument('command', choices=['init-db', 'migrate', 'revision', 'status', 'lint-migrations', 'create-admin', 'purge', 'archive', 'digest', 'snapshot-stats', 'rebuild-stats', 'worker', 'scheduler', 'requeue-dead', 'partition-tasks'], help="Command to execute")
+    parser.add_argument('revision', nargs='?', default='head', help="Target revision (migrate)")
+    parser.add_argument('-m', '--message', help="Migration message (revision)")
+    parser.add_argument('--autogenerate', action='store_true', help="Diff the models against the database (revision)")
+    parser.add_argument('--fake', action='store_true', help="Record the revision without running it (migrate)")
+    parser.add_argument('--partition', action='store_true',
+                        help="Hash-partition tasks into --partitions slices in revision 0013 (migrate)")
     parser.add_argument('--email', help="Admin email for non-interactive creation")
     parser.add_argument('--password', help="Admin password for non-interactive creation")
+    parser.add_argument('--batch-size', type=int, help="Rows per statement (purge, archive)")
+    parser.add_argument('--pause', type=float, default=0.0, help="Seconds to sleep between batches (purge)")
+    parser.add_argument('--loop', action='store_true', help="Keep running (archive worker)")
+    parser.add_argument('--interval', type=int, default=settings.ARCHIVE_INTERVAL_MINUTES,
+                        help="Minutes between archive runs with --loop")
+    parser.add_argument('--enqueue', action='store_true', help="Queue a run for the job worker (archive, digest, snapshot-stats)")
+    parser.add_argument('--day', help="Day to summarize, YYYY-MM-DD (digest; default yesterday)")
+    parser.add_argument('--concurrency', type=int, default=settings.JOB_CONCURRENCY,
+                        help="Jobs run in parallel (worker)")
+    parser.add_argument('--drain', action='store_true', help="Exit once no job is runnable (worker)")
+    parser.add_argument('--job', help="Only requeue dead jobs with this name (requeue-dead)")
+    parser.add_argument('--partitions', type=int, default=settings.TASKS_PARTITIONS,
+                        help="Number of hash partitions (partition-tasks, migrate --partition)")
     
     if len(sys.argv) == 1:
         parser.print_help()
@@ -100,6 +350,21 @@ def main():
         else:
             print("Operation cancelled.")
             
+    if args.command == 'migrate':
+        migrate(args.revision, args.fake, args.partitions if args.partition else None)
+
+    if args.command == 'revision':
+        if not args.message:
+            parser.error("revision requires -m/--message")
+        new_revision(args.message, args.autogenerate)
+
+    if args.command == 'status':
+        migration_status()
+
+    if args.command == 'lint-migrations':
+        if not lint_migrations():
+            sys.exit(1)
+
     if args.command == 'create-admin':
         if args.email and args.password:
             # Non-interactive mode
@@ -123,5 +388,32 @@ def main():
         else:
             create_admin()
 
+    if args.command == 'purge':
+        purge(args.batch_size or PURGE_BATCH_SIZE, args.pause)
+
+    if args.command == 'archive':
+        archive(args.batch_size, args.loop, args.interval, args.enqueue)
+
+    if args.command == 'digest':
+        digest(args.day, args.enqueue)
+
+    if args.command == 'snapshot-stats':
+        snapshot_stats(args.enqueue)
+
+    if args.command == 'rebuild-stats':
+        rebuild_stats()
+
+    if args.command == 'worker':
+        worker(args.concurrency, args.drain)
+
+    if args.command == 'scheduler':
+        scheduler()
+
+    if args.command == 'requeue-dead':
+        requeue_dead(args.job)
+
+    if args.command == 'partition-tasks':
+        partition(args.partitions)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,90 @@
+"""
+Alembic environment.
+
+The URL comes from ``app.core.config.settings`` (or ``-x url=...``, which
+the migration lint uses to render PostgreSQL SQL offline). Each revision
+runs in its own transaction so ``online_ddl`` helpers can step outside it
+for ``CREATE INDEX CONCURRENTLY`` and batched backfills.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, make_url, pool
+
+from app.core.config import settings
+from app.db.connection import Base
+# Import all models so the metadata is complete for autogenerate
+from app.models import activity, board, job, task, user  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None and not config.attributes.get("skip_logging"):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+# Objects created outside the models: SQLite FTS shadow tables, hash and
+# archive partitions, and the generated search column (PostgreSQL DDL)
+IGNORED_TABLE_PREFIXES = ("tasks_fts", "tasks_p", "tasks_archive_y")
+IGNORED_COLUMNS = {("tasks", "search_vector")}
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Keep autogenerate from proposing to drop DDL that lives only in migrations."""
+    if type_ == "table" and name.startswith(IGNORED_TABLE_PREFIXES):
+        return False
+    if type_ == "column" and (obj.table.name, name) in IGNORED_COLUMNS:
+        return False
+    # SQLite cannot alter constraints in place, so FK changes are PostgreSQL-only
+    if type_ == "foreign_key_constraint" and _url().startswith("sqlite"):
+        return False
+    # Indexes declared with ddl_if(dialect=...) exist only on that database
+    ddl_if = getattr(obj, "_ddl_if", None)
+    if type_ == "index" and ddl_if is not None and ddl_if.dialect:
+        dialects = (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+        return make_url(_url()).get_backend_name() in dialects
+    return True
+
+
+def _url() -> str:
+    return context.get_x_argument(as_dictionary=True).get("url") or settings.DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    """Emit the SQL instead of running it (``--sql``)."""
+    context.configure(
+        url=_url(),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
+        output_buffer=config.attributes.get("sql_buffer"),
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run against the configured database."""
+    connectable = create_engine(_url(), poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            transaction_per_migration=True,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,84 @@
+"""Baseline schema: users, boards, lanes, tasks
+
+The schema as it was created by ``Base.metadata.create_all`` before
+migrations existed. Databases created that way are adopted with
+``python manage.py migrate --fake 0001`` and then upgraded normally.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String()),
+        sa.Column("hashed_password", sa.String()),
+        sa.Column("full_name", sa.String()),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("role", sa.String()),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "boards",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String()),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id")),
+    )
+    op.create_index("ix_boards_id", "boards", ["id"])
+    op.create_index("ix_boards_title", "boards", ["title"])
+
+    op.create_table(
+        "lanes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String()),
+        sa.Column("position", sa.Integer()),
+        sa.Column("board_id", sa.Integer(), sa.ForeignKey("boards.id", name="lanes_board_id_fkey")),
+    )
+    op.create_index("ix_lanes_id", "lanes", ["id"])
+
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String()),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("position", sa.Integer()),
+        sa.Column("priority", sa.Integer()),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("lane_id", sa.Integer(), sa.ForeignKey("lanes.id", name="tasks_lane_id_fkey"), nullable=True),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id")),
+    )
+    op.create_index("ix_tasks_id", "tasks", ["id"])
+    op.create_index("ix_tasks_title", "tasks", ["title"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("tasks")
+    op.drop_table("lanes")
+    op.drop_table("boards")
+    op.drop_table("users")
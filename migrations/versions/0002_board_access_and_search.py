@@ -0,0 +1,119 @@
+"""Board access, task listing indexes and full-text search
+
+- tasks.board_id (denormalized from lanes), backfilled in batches
+- board_members table for shared boards
+- composite (equality, order, id) indexes behind GET /tasks/
+- search: generated tsvector + GIN (PostgreSQL) or FTS5 + triggers (SQLite)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:10:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db import online_ddl
+from app.models.task import TASK_SEARCH_VECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {
+    "table-rewrite": "search_vector must be a stored generated column; adding it rewrites "
+                     "tasks once, so apply this revision in a maintenance window",
+}
+
+LISTING_INDEXES = (
+    ("ix_tasks_lane_position", ["lane_id", "position", "id"]),
+    ("ix_tasks_board_updated", ["board_id", "updated_at", "id"]),
+    ("ix_tasks_board_priority", ["board_id", "priority", "id"]),
+    ("ix_tasks_board_created", ["board_id", "created_at", "id"]),
+    ("ix_tasks_board_owner_updated", ["board_id", "owner_id", "updated_at", "id"]),
+)
+
+SQLITE_FTS = (
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id')",
+    "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_context().dialect.name
+
+    # Nullable column without default: catalog-only change
+    op.add_column("tasks", sa.Column("board_id", sa.Integer(), nullable=True))
+    online_ddl.add_foreign_key_not_valid(
+        "tasks_board_id_fkey", "tasks", "boards", ["board_id"], ["id"], ondelete="CASCADE"
+    )
+    online_ddl.batched_backfill(
+        "tasks",
+        "board_id = (SELECT lanes.board_id FROM lanes WHERE lanes.id = tasks.lane_id)",
+        "board_id IS NULL AND lane_id IN (SELECT id FROM lanes WHERE board_id IS NOT NULL)",
+    )
+    online_ddl.validate_constraint("tasks_board_id_fkey", "tasks")
+
+    op.create_table(
+        "board_members",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("role", sa.String()),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("board_id", sa.Integer(), sa.ForeignKey("boards.id", ondelete="CASCADE")),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.UniqueConstraint("board_id", "user_id", name="uq_board_members_board_user"),
+    )
+    op.create_index("ix_board_members_id", "board_members", ["id"])
+    op.create_index("ix_board_members_board_id", "board_members", ["board_id"])
+    op.create_index("ix_board_members_user_id", "board_members", ["user_id"])
+
+    for name, columns in LISTING_INDEXES:
+        online_ddl.create_index_concurrently(name, "tasks", columns)
+
+    if dialect == "postgresql":
+        op.execute(
+            f"ALTER TABLE tasks ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({TASK_SEARCH_VECTOR}) STORED"
+        )
+        online_ddl.create_index_concurrently(
+            "ix_tasks_search_vector", "tasks", ["search_vector"], postgresql_using="gin"
+        )
+    elif dialect == "sqlite":
+        for statement in SQLITE_FTS:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_context().dialect.name
+    if dialect == "postgresql":
+        online_ddl.drop_index_concurrently("ix_tasks_search_vector", "tasks")
+        op.drop_column("tasks", "search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
+
+    for name, _ in LISTING_INDEXES:
+        online_ddl.drop_index_concurrently(name, "tasks")
+    op.drop_table("board_members")
+    if dialect == "postgresql":
+        op.drop_constraint("tasks_board_id_fkey", "tasks", type_="foreignkey")
+    op.drop_column("tasks", "board_id")
@@ -0,0 +1,103 @@
+"""Soft delete, archive tier and row versions
+
+- boards/lanes.deleted_at with partial indexes for the purge job
+- ON DELETE CASCADE on lanes.board_id and tasks.lane_id
+- archive_after_days policy and the tasks_archive table
+- tasks/lanes.version for optimistic concurrency
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 09:20:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db import online_ddl
+from app.models.task import TASK_SEARCH_VECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+CASCADES = (
+    # (constraint, table, column, referenced table)
+    ("lanes_board_id_fkey", "lanes", "board_id", "boards"),
+    ("tasks_lane_id_fkey", "tasks", "lane_id", "lanes"),
+)
+
+
+def _replace_foreign_key(name: str, table: str, column: str, referent: str, ondelete) -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+    op.drop_constraint(name, table, type_="foreignkey")
+    online_ddl.add_foreign_key_not_valid(name, table, referent, [column], ["id"], ondelete=ondelete)
+    online_ddl.validate_constraint(name, table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ("boards", "lanes"):
+        op.add_column(table, sa.Column("deleted_at", sa.DateTime(), nullable=True))
+        op.add_column(table, sa.Column("archive_after_days", sa.Integer(), nullable=True))
+    online_ddl.create_index_concurrently(
+        "ix_boards_deleted", "boards", ["deleted_at"],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"), sqlite_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    online_ddl.create_index_concurrently(
+        "ix_lanes_deleted", "lanes", ["deleted_at"],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"), sqlite_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    online_ddl.create_index_concurrently("ix_lanes_board_id", "lanes", ["board_id"])
+
+    for name, table, column, referent in CASCADES:
+        _replace_foreign_key(name, table, column, referent, "CASCADE")
+
+    # Constant defaults are stored in the catalog (PostgreSQL 11+): no rewrite
+    for table in ("tasks", "lanes"):
+        op.add_column(table, sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+    op.create_table(
+        "tasks_archive",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("archived_at", sa.DateTime(), primary_key=True, server_default=sa.func.now()),
+        sa.Column("title", sa.String()),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("position", sa.Integer()),
+        sa.Column("priority", sa.Integer()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+        sa.Column("lane_id", sa.Integer(), nullable=True),
+        sa.Column("board_id", sa.Integer(), nullable=True),
+        sa.Column("owner_id", sa.Integer()),
+        postgresql_partition_by="RANGE (archived_at)",
+    )
+    op.create_index("ix_tasks_archive_board_archived", "tasks_archive", ["board_id", "archived_at", "id"])
+    op.create_index("ix_tasks_archive_lane", "tasks_archive", ["lane_id"])
+    if op.get_context().dialect.name == "postgresql":
+        op.execute(
+            f"CREATE INDEX ix_tasks_archive_search ON tasks_archive USING GIN (({TASK_SEARCH_VECTOR}))"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("tasks_archive")
+    for table in ("tasks", "lanes"):
+        op.drop_column(table, "version")
+    for name, table, column, referent in CASCADES:
+        _replace_foreign_key(name, table, column, referent, None)
+    online_ddl.drop_index_concurrently("ix_lanes_board_id", "lanes")
+    online_ddl.drop_index_concurrently("ix_lanes_deleted", "lanes")
+    online_ddl.drop_index_concurrently("ix_boards_deleted", "boards")
+    for table in ("boards", "lanes"):
+        op.drop_column(table, "archive_after_days")
+        op.drop_column(table, "deleted_at")
@@ -0,0 +1,57 @@
+"""Job queue
+
+- jobs table polled by `manage.py worker` with FOR UPDATE SKIP LOCKED
+- partial indexes for the claim query and lease recovery
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db import online_ddl
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("locked_by", sa.String(), nullable=True),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_jobs_queued_run_at", "jobs", ["run_at", "id"],
+        postgresql_where=sa.text("status = 'queued'"), sqlite_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "ix_jobs_running_locked_at", "jobs", ["locked_at"],
+        postgresql_where=sa.text("status = 'running'"), sqlite_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("jobs")
@@ -0,0 +1,34 @@
+"""Index boards by owner
+
+- ix_boards_owner_id for permission lookups and digest chunks
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 10:10:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db import online_ddl
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    online_ddl.create_index_concurrently("ix_boards_owner_id", "boards", ["owner_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    online_ddl.drop_index_concurrently("ix_boards_owner_id", "boards")
@@ -0,0 +1,58 @@
+"""Board stats counters and cumulative-flow snapshots
+
+- board_task_counts: live cards per (board, lane, priority), kept by TaskService
+- board_flow_snapshots: per-lane counts per day
+- counters are backfilled from tasks; run `manage.py rebuild-stats` after the
+  deploy to count cards written by the old code in between
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 10:20:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db import online_ddl
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "board_task_counts",
+        sa.Column("board_id", sa.Integer(), sa.ForeignKey("boards.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("lane_id", sa.Integer(), sa.ForeignKey("lanes.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("priority", sa.Integer(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "board_flow_snapshots",
+        sa.Column("board_id", sa.Integer(), sa.ForeignKey("boards.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("lane_id", sa.Integer(), sa.ForeignKey("lanes.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    # Read-only scan of tasks (ACCESS SHARE): writes continue meanwhile
+    op.execute(
+        "INSERT INTO board_task_counts (board_id, lane_id, priority, count) "
+        "SELECT board_id, lane_id, COALESCE(priority, 0), COUNT(*) FROM tasks "
+        "WHERE board_id IS NOT NULL AND lane_id IS NOT NULL "
+        "GROUP BY board_id, lane_id, COALESCE(priority, 0)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("board_flow_snapshots")
+    op.drop_table("board_task_counts")
@@ -0,0 +1,50 @@
+"""Activity log
+
+- activity_events: append-only history of board, lane and card changes,
+  written in batches by the audit buffer (no foreign keys: history
+  outlives what it describes)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 11:40:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "activity_events",
+        sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True),
+        sa.Column("occurred_at", sa.DateTime(), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("actor_id", sa.Integer(), nullable=True),
+        sa.Column("board_id", sa.Integer(), nullable=False),
+        sa.Column("lane_id", sa.Integer(), nullable=True),
+        sa.Column("task_id", sa.Integer(), nullable=True),
+        sa.Column("data", sa.JSON(), nullable=True),
+    )
+    # New, empty table: plain CREATE INDEX is instant
+    op.create_index("ix_activity_board_occurred", "activity_events", ["board_id", "occurred_at", "id"])
+    op.create_index(
+        "ix_activity_task_occurred", "activity_events", ["task_id", "occurred_at", "id"],
+        postgresql_where=sa.text("task_id IS NOT NULL"), sqlite_where=sa.text("task_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("activity_events")
@@ -0,0 +1,45 @@
+"""Task due dates and reminders
+
+- tasks.due_at, and tasks.remind_at for the reminder scheduler (nullable:
+  catalog-only changes)
+- ix_tasks_remind_pending: partial index over pending reminders only
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 12:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db import online_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tasks", sa.Column("due_at", sa.DateTime(), nullable=True))
+    op.add_column("tasks", sa.Column("remind_at", sa.DateTime(), nullable=True))
+    # No card has a due date yet, so the index starts empty
+    online_ddl.create_index_concurrently(
+        "ix_tasks_remind_pending", "tasks", ["remind_at", "id"],
+        postgresql_where=sa.text("remind_at IS NOT NULL"), sqlite_where=sa.text("remind_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    online_ddl.drop_index_concurrently("ix_tasks_remind_pending", "tasks")
+    op.drop_column("tasks", "remind_at")
+    op.drop_column("tasks", "due_at")
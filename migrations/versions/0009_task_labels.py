@@ -0,0 +1,58 @@
+"""Task labels
+
+- labels: per-board labels, unique by name within a board
+- tasks.label_ids: label ids of a card (integer[] on PostgreSQL, JSON
+  elsewhere; nullable, so a catalog-only change)
+- ix_tasks_label_ids: GIN index for label containment (PostgreSQL only)
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 13:10:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.db import online_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, Sequence[str], None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "labels",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("color", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("board_id", sa.Integer(), sa.ForeignKey("boards.id", ondelete="CASCADE"), nullable=False),
+        sa.UniqueConstraint("board_id", "name", name="uq_labels_board_name"),
+    )
+    op.create_index("ix_labels_id", "labels", ["id"])
+
+    op.add_column(
+        "tasks",
+        sa.Column("label_ids", sa.JSON().with_variant(postgresql.ARRAY(sa.Integer()), "postgresql"), nullable=True),
+    )
+    if op.get_context().dialect.name == "postgresql":
+        online_ddl.create_index_concurrently("ix_tasks_label_ids", "tasks", ["label_ids"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == "postgresql":
+        online_ddl.drop_index_concurrently("ix_tasks_label_ids", "tasks")
+    op.drop_column("tasks", "label_ids")
+    op.drop_table("labels")
@@ -0,0 +1,49 @@
+"""Subtasks
+
+- subtasks: nested checklist items of cards, stored with a materialized
+  path of ancestor ids (C collation on PostgreSQL, so a subtree is one
+  index range); no foreign key to tasks, which may be partitioned
+- ix_subtasks_task_path: a card's tree, or one item's subtree, in one
+  range scan
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 16:40:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, Sequence[str], None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "subtasks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String().with_variant(sa.String(collation="C"), "postgresql"), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("done", sa.Boolean(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_subtasks_id", "subtasks", ["id"])
+    op.create_index("ix_subtasks_task_path", "subtasks", ["task_id", "path"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("subtasks")
@@ -0,0 +1,35 @@
+"""Archived due dates
+
+- tasks_archive.due_at: the card's due date, kept when it is archived
+  (nullable: a catalog-only change); remind_at is not carried over, an
+  archived card gets no reminder
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 18:20:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, Sequence[str], None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tasks_archive", sa.Column("due_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tasks_archive", "due_at")
@@ -0,0 +1,39 @@
+"""Archived labels
+
+- tasks_archive.label_ids: the card's label ids, kept when it is archived
+  (integer[] on PostgreSQL, JSON elsewhere; nullable, so a catalog-only
+  change); not indexed, archive search does not filter by label
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 18:40:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, Sequence[str], None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "tasks_archive",
+        sa.Column("label_ids", sa.JSON().with_variant(postgresql.ARRAY(sa.Integer()), "postgresql"), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tasks_archive", "label_ids")
@@ -0,0 +1,51 @@
+"""Hash-partitioned tasks (opt-in)
+
+- tasks: rebuilt as PARTITION BY HASH (board_id) by
+  ``app.db.partitioning.partition_tasks``, only when asked for with
+  ``manage.py migrate --partition`` (``-x partitions=N``) on PostgreSQL and
+  not partitioned already; otherwise a no-op
+- the rewrite holds ACCESS EXCLUSIVE on tasks for its whole run: opt in
+  during a maintenance window. A database that skipped it is converted
+  later with ``manage.py partition-tasks``, outside the migration chain;
+  ``partitioning.is_partitioned`` is the record either way
+- the copy uses the current Task model's columns, so a later revision
+  adding a column to tasks must come after this one (as revisions do)
+- downgrade does not merge the partitions back
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19 19:10:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+from app.db.partitioning import is_partitioned, partition_tasks
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: Union[str, Sequence[str], None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rules of `manage.py lint-migrations` this revision may break, with the reason
+lint_waivers: dict = {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    partitions = context.get_x_argument(as_dictionary=True).get("partitions")
+    if not partitions or op.get_context().dialect.name != "postgresql":
+        return
+    if op.get_context().as_sql:
+        op.execute(f"-- tasks is hash-partitioned ({partitions}) online only: manage.py migrate --partition")
+        return
+    connection = op.get_bind()
+    if not is_partitioned(connection):
+        partition_tasks(connection, int(partitions))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""